@@ -2,18 +2,26 @@
 
 from .constants import Quadrant
 from .cpoint import CPoint
+from .cpointarray import CPointArray
 from .crect import CRect
 from .exceptions import ColinearPoints
 from .line import Line
 from .point import Point
+from .pointarray import PointArray
+from .polygon import Polygon
+from .polyline import Polyline
 from .rect import Rect
 
 __all__ = [
     "ColinearPoints",
     "CPoint",
+    "CPointArray",
     "CRect",
     "Line",
     "Point",
+    "PointArray",
+    "Polygon",
+    "Polyline",
     "Quadrant",
     "Rect",
 ]
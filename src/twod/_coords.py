@@ -0,0 +1,123 @@
+"""coordinate helpers for humans™
+
+Batch algorithms work on raw floats, these helpers pull them out of the
+various objects twod accepts as points and rectangles.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from numbers import Real
+from typing import Any
+
+
+def xy(value: Any) -> tuple[float, float]:
+    """Returns the (x, y) coordinates of a Point, CPoint, complex or
+    two item sequence."""
+
+    if isinstance(value, complex):
+        return (value.real, value.imag)
+
+    try:
+        return value.xy
+    except AttributeError:
+        pass
+
+    x, y, *_ = value
+    return (x, y)
+
+
+def columns(points: Any) -> tuple[list[float], list[float]]:
+    """Returns lists of the x and y coordinates of points.
+
+    Points may be a PointArray or CPointArray, a packed buffer of
+    interleaved x and y values, or an iterable of anything xy() accepts.
+    """
+
+    try:
+        x, y = points.x, points.y
+    except AttributeError:
+        pass
+    else:
+        if not isinstance(x, Real):
+            return (list(map(float, x)), list(map(float, y)))
+
+    values = points if isinstance(points, list) else list(points)
+    if values and isinstance(values[0], Real):
+        if len(values) % 2:
+            raise ValueError(
+                f"Expected interleaved x and y values, got {len(values)} values"
+            )
+        return (values[0::2], values[1::2])
+
+    xs, ys = [], []
+    for value in values:
+        x, y = xy(value)
+        xs.append(x)
+        ys.append(y)
+    return (xs, ys)
+
+
+def bounds(rect: Any) -> tuple[float, float, float, float]:
+    """Returns (min_x, min_y, max_x, max_y) for a Rect, CRect or a
+    packed (x, y, w, h) sequence, normalizing negative dimensions."""
+
+    try:
+        x, y, w, h = rect.x, rect.y, rect.w, rect.h
+    except AttributeError:
+        x, y, w, h = rect
+
+    x0, x1 = (x, x + w) if w >= 0 else (x + w, x)
+    y0, y1 = (y, y + h) if h >= 0 else (y + h, y)
+    return (x0, y0, x1, y1)
+
+
+def extents(rects: Iterable[Any]) -> tuple[list[float], ...]:
+    """Returns lists of the min_x, min_y, max_x and max_y of rects.
+
+    Rects may be a packed buffer of (x, y, w, h) values, or an iterable
+    of anything bounds() accepts.
+    """
+
+    values = rects if isinstance(rects, list) else list(rects)
+    if values and isinstance(values[0], Real):
+        if len(values) % 4:
+            raise ValueError(
+                f"Expected packed x, y, w and h values, got {len(values)} values"
+            )
+        values = [values[i : i + 4] for i in range(0, len(values), 4)]
+
+    x0s, y0s, x1s, y1s = [], [], [], []
+    for value in values:
+        x0, y0, x1, y1 = bounds(value)
+        x0s.append(x0)
+        y0s.append(y0)
+        x1s.append(x1)
+        y1s.append(y1)
+    return (x0s, y0s, x1s, y1s)
+
+
+def segments(lines: Iterable[Any]) -> tuple[list[float], ...]:
+    """Returns lists of the start x, start y, end x and end y of lines.
+
+    Lines may be a packed buffer of (x0, y0, x1, y1) values, or an
+    iterable of Lines or (start, end) pairs of anything xy() accepts.
+    """
+
+    values = lines if isinstance(lines, list) else list(lines)
+    if values and isinstance(values[0], Real):
+        if len(values) % 4:
+            raise ValueError(
+                f"Expected packed x0, y0, x1 and y1 values, got {len(values)} values"
+            )
+        return (values[0::4], values[1::4], values[2::4], values[3::4])
+
+    x0s, y0s, x1s, y1s = [], [], [], []
+    for start, end in values:
+        x0, y0 = xy(start)
+        x1, y1 = xy(end)
+        x0s.append(x0)
+        y0s.append(y0)
+        x1s.append(x1)
+        y1s.append(y1)
+    return (x0s, y0s, x1s, y1s)
@@ -0,0 +1,116 @@
+"""vertices in flat coordinate arrays for humans™"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from ._coords import columns, xy
+from .point import Point
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class _Vertices:
+    """A sequence of vertices stored in two flat arrays of doubles,
+    shared by Polygon and Polyline.
+
+    Subclasses caching values derived from the vertices clear them in
+    _invalidate(), which is called whenever the vertices change.
+    """
+
+    __slots__ = ("_x", "_y")
+
+    def __init__(self, points: Iterable[Any] = ()) -> None:
+        xs, ys = columns(points)
+        self._x = array("d", xs)
+        self._y = array("d", ys)
+        self._invalidate()
+
+    @classmethod
+    def from_arrays(
+        cls,
+        xs: Iterable[float | int],
+        ys: Iterable[float | int],
+    ) -> Self:
+        """Returns an instance with vertices taken from flat coordinate
+        arrays, e.g. the x and y buffers of a PointArray.
+
+        :param xs: Iterable[float | int]
+        :param ys: Iterable[float | int]
+        :return: instance of cls
+        """
+        vertices = cls()
+        vertices._x = array("d", xs)
+        vertices._y = array("d", ys)
+        if len(vertices._x) != len(vertices._y):
+            raise ValueError(
+                "Expected equal length coordinates, "
+                f"got {len(vertices._x)} and {len(vertices._y)}"
+            )
+        return vertices
+
+    def _invalidate(self) -> None:
+        pass
+
+    @property
+    def x(self) -> memoryview:
+        """A read-only view of the x coordinates of the vertices, change
+        vertices through the methods so cached values are updated."""
+        return memoryview(self._x).toreadonly()
+
+    @property
+    def y(self) -> memoryview:
+        """A read-only view of the y coordinates of the vertices, change
+        vertices through the methods so cached values are updated."""
+        return memoryview(self._y).toreadonly()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def __iter__(self) -> Iterator[Point]:
+        for x, y in zip(self._x, self._y):
+            yield Point(x, y)
+
+    def __getitem__(self, key: int) -> Point:
+        return Point(self._x[key], self._y[key])
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        self._x[key], self._y[key] = xy(value)
+        self._invalidate()
+
+    def __delitem__(self, key: int) -> None:
+        del self._x[key]
+        del self._y[key]
+        self._invalidate()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._x == other._x and self._y == other._y
+
+    def append(self, point: Any) -> None:
+        """Adds point as the last vertex.
+
+        :param point: Point, CPoint or (x, y)
+        """
+        x, y = xy(point)
+        self._x.append(x)
+        self._y.append(y)
+        self._invalidate()
+
+    def insert(self, index: int, point: Any) -> None:
+        """Inserts point as a vertex before index.
+
+        :param int index:
+        :param point: Point, CPoint or (x, y)
+        """
+        x, y = xy(point)
+        self._x.insert(index, x)
+        self._y.insert(index, y)
+        self._invalidate()
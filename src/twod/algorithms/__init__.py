@@ -0,0 +1,17 @@
+"""geometric algorithms for humans™"""
+
+from .closest import closest_pair
+from .hull import IncrementalHull, convex_hull
+from .intersections import segment_intersections
+from .simplify import simplify
+from .union import union_area, union_outline
+
+__all__ = [
+    "IncrementalHull",
+    "closest_pair",
+    "convex_hull",
+    "segment_intersections",
+    "simplify",
+    "union_area",
+    "union_outline",
+]
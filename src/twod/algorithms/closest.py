@@ -0,0 +1,64 @@
+"""closest pair of points for humans™"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from typing import Any
+
+from .._coords import columns
+
+
+def closest_pair(points: Iterable[Any]) -> tuple[int, int, float]:
+    """Returns the indices of the two closest points and the distance
+    between them.
+
+    Points are swept left to right in O(n log n). Only points less than
+    the best distance so far to the left of the sweep are kept, sorted
+    by y, and each new point is compared with the ones within that
+    distance above and below it. Distances are compared squared and no
+    points are allocated.
+
+    Raises ValueError if there are fewer than two points.
+
+    >>> closest_pair([Point(0, 0), Point(5, 5), Point(1, 1), Point(5, 6)])
+    (1, 3, 1.0)
+
+    :param points: Iterable of points, a PointArray or a packed buffer
+    :return: (i, j, distance) with i < j
+    """
+    xs, ys = columns(points)
+    if len(xs) < 2:
+        raise ValueError(f"Expected at least two points, got {len(xs)}")
+
+    order = sorted(range(len(xs)), key=xs.__getitem__)
+    active: list[tuple[float, int]] = []
+    best = math.inf
+    best2 = math.inf
+    pair = (order[0], order[1])
+    left = 0
+
+    for i in order:
+        x, y = xs[i], ys[i]
+
+        while xs[order[left]] < x - best:
+            gone = order[left]
+            del active[bisect_left(active, (ys[gone], gone))]
+            left += 1
+
+        for k in range(bisect_left(active, (y - best, -1)), len(active)):
+            ay, j = active[k]
+            if ay > y + best:
+                break
+            dx, dy = xs[j] - x, ay - y
+            d2 = dx * dx + dy * dy
+            if d2 < best2:
+                best2, best, pair = d2, math.sqrt(d2), (j, i)
+                if not d2:
+                    return (min(pair), max(pair), 0.0)
+
+        insort(active, (y, i))
+
+    i, j = sorted(pair)
+    return (i, j, best)
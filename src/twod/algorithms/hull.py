@@ -0,0 +1,220 @@
+"""convex hulls for humans™"""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from .. import backend
+from .._coords import columns, xy
+
+# below this many points discarding interior points first doesn't pay
+_FILTER_MIN = 64
+
+
+def _candidates(xs: list[float], ys: list[float]) -> list[int]:
+    """Returns the indices of points that may be on the hull.
+
+    Points strictly inside the quadrilateral spanned by the leftmost,
+    lowest, rightmost and highest points can't be on the hull, and are
+    discarded with a single batched orientation test (Akl-Toussaint).
+    """
+    n = len(xs)
+    if n < _FILTER_MIN:
+        return list(range(n))
+
+    # leftmost, lowest, rightmost and highest, counter clock-wise
+    x, y = min(zip(xs, ys))
+    corners = {(x, y): None}
+    y, x = min(zip(ys, map(operator.neg, xs)))
+    corners[(-x, y)] = None
+    x, y = max(zip(xs, ys))
+    corners[(x, y)] = None
+    y, x = max(zip(ys, map(operator.neg, xs)))
+    corners[(-x, y)] = None
+    if len(corners) < 3:
+        return list(range(n))
+
+    k = backend.kernels()
+    return k.outside_convex(
+        k.floats(xs),
+        k.floats(ys),
+        [x for x, _ in corners],
+        [y for _, y in corners],
+    )
+
+
+def convex_hull(points: Iterable[Any]) -> list[int]:
+    """Returns the indices of the points on the convex hull of points.
+
+    The hull is found with Andrew's monotone chain in O(n log n) and is
+    listed counter clock-wise, starting from the leftmost (then lowest)
+    point, with the same sign convention as Point.ccw. Points on the
+    hull's edges but not at its corners, and repeated points, are left
+    out.
+
+    Points may be Points, CPoints, (x, y) tuples, a PointArray or
+    CPointArray, or a packed buffer of interleaved x and y values. The
+    orientation tests run on the raw coordinates, no points are copied.
+
+    >>> convex_hull([Point(0, 0), Point(2, 0), Point(1, 1), Point(2, 2), Point(0, 2)])
+    [0, 1, 3, 4]
+
+    :param points: Iterable of points or a packed buffer
+    :return: list of indices into points
+    """
+    xs, ys = columns(points)
+    order = _candidates(xs, ys)
+    if not order:
+        return []
+    order.sort(key=lambda i: (xs[i], ys[i]))
+
+    first, last = order[0], order[-1]
+    if xs[first] == xs[last] and ys[first] == ys[last]:
+        return [first]
+
+    def chain(indices: Iterable[int]) -> list[int]:
+        stack: list[int] = []
+        for c in indices:
+            cx, cy = xs[c], ys[c]
+            while len(stack) > 1:
+                a, b = stack[-2], stack[-1]
+                ax, ay = xs[a], ys[a]
+                # keep b only if [a, b, c] turns counter clock-wise
+                if (xs[b] - ax) * (cy - ay) - (cx - ax) * (ys[b] - ay) > 0:
+                    break
+                stack.pop()
+            stack.append(c)
+        return stack
+
+    lower = chain(order)
+    upper = chain(reversed(order))
+    return lower[:-1] + upper[:-1]
+
+
+class IncrementalHull(Sequence):
+    """The convex hull of a stream of points, updated as they arrive.
+
+    The hull is a read-only sequence of the points at its corners,
+    counter clock-wise with the same sign convention as Point.ccw. Points
+    inside the hull or on its edges are rejected with a binary search
+    over the fan of hull vertices in O(log n); points outside replace the
+    vertices they can see.
+
+    >>> hull = IncrementalHull()
+    >>> for p in [Point(0, 0), Point(2, 0), Point(0, 2), Point(1, 1)]:
+    ...     hull.add(p)
+    True
+    True
+    True
+    False
+    >>> list(hull)
+    [Point(x=0, y=0), Point(x=2, y=0), Point(x=0, y=2)]
+    """
+
+    def __init__(self, points: Iterable[Any] = ()) -> None:
+        self._xs: list[float] = []
+        self._ys: list[float] = []
+        self._points: list[Any] = []
+        for point in points:
+            self.add(point)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._points!r})"
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __getitem__(self, key: int | slice) -> Any:
+        return self._points[key]
+
+    def _ccw(self, a: int, b: int, px: float, py: float) -> float:
+        xs, ys = self._xs, self._ys
+        ax, ay = xs[a], ys[a]
+        return (xs[b] - ax) * (py - ay) - (px - ax) * (ys[b] - ay)
+
+    def _visible_edge(self, px: float, py: float) -> int | None:
+        """Returns the index of a hull edge with (px, py) on its right, or
+        None if (px, py) is inside or on the hull."""
+        n = len(self._xs)
+        ccw = self._ccw
+        if ccw(0, 1, px, py) < 0:
+            return 0
+        if ccw(0, n - 1, px, py) > 0:
+            return n - 1
+        # the wedge [v0, v[lo], v[lo + 1]] containing the point
+        lo, hi = 1, n - 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if ccw(0, mid, px, py) >= 0:
+                lo = mid
+            else:
+                hi = mid
+        return lo if ccw(lo, lo + 1, px, py) < 0 else None
+
+    def _add_degenerate(self, point: Any, px: float, py: float) -> bool:
+        """Adds a point while the hull is at most a segment."""
+        xs, ys, points = self._xs, self._ys, self._points
+        if not points or (len(points) == 1 and (px, py) != (xs[0], ys[0])):
+            xs.append(px)
+            ys.append(py)
+            points.append(point)
+            return True
+        if len(points) == 1:
+            return False
+
+        ccw = self._ccw(0, 1, px, py)
+        if ccw:
+            position = 2 if ccw > 0 else 1
+            xs.insert(position, px)
+            ys.insert(position, py)
+            points.insert(position, point)
+            return True
+
+        # collinear, keep the two points farthest apart
+        dx, dy = xs[1] - xs[0], ys[1] - ys[0]
+        t = ((px - xs[0]) * dx + (py - ys[0]) * dy) / (dx * dx + dy * dy)
+        if 0 <= t <= 1:
+            return False
+        end = 0 if t < 0 else 1
+        xs[end], ys[end], points[end] = px, py, point
+        return True
+
+    def add(self, point: Any) -> bool:
+        """Adds point to the hull.
+
+        :param point: Point, CPoint or (x, y)
+        :return: True if the hull changed, False if point was inside
+        """
+        px, py = xy(point)
+        if len(self._points) < 3:
+            return self._add_degenerate(point, px, py)
+
+        edge = self._visible_edge(px, py)
+        if edge is None:
+            return False
+
+        n = len(self._xs)
+        ccw = self._ccw
+        # walk out to the tangent vertices, dropping the ones p can see
+        # and any left in line with p
+        first = (edge + 1) % n
+        while ccw(first, (first + 1) % n, px, py) <= 0:
+            first = (first + 1) % n
+        last = edge
+        while ccw((last - 1) % n, last, px, py) <= 0:
+            last = (last - 1) % n
+
+        for values, value in (
+            (self._xs, px),
+            (self._ys, py),
+            (self._points, point),
+        ):
+            if last < first:
+                values[last + 1 : first] = [value]
+            else:
+                del values[last + 1 :]
+                del values[:first]
+                values.append(value)
+        return True
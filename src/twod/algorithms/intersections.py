@@ -0,0 +1,193 @@
+"""all-pairs line segment intersection for humans™"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from .._coords import xy
+from ..point import Point
+
+_TOLERANCE = 1e-9
+
+
+def _crossing(
+    xs0: array,
+    ys0: array,
+    xs1: array,
+    ys1: array,
+    a: int,
+    b: int,
+) -> tuple[float, float] | None:
+    """Returns the point where segments a and b cross, or None if they
+    don't or are parallel. Collinear overlaps are found at the endpoint
+    events instead."""
+
+    ax, ay = xs0[a], ys0[a]
+    bx, by = xs0[b], ys0[b]
+    adx, ady = xs1[a] - ax, ys1[a] - ay
+    bdx, bdy = xs1[b] - bx, ys1[b] - by
+
+    cross = adx * bdy - ady * bdx
+    if cross == 0:
+        return None
+
+    sx, sy = bx - ax, by - ay
+    t = (sx * bdy - sy * bdx) / cross
+    u = (sx * ady - sy * adx) / cross
+    if not (0 <= t <= 1 and 0 <= u <= 1):
+        return None
+
+    x, y = ax + t * adx, ay + t * ady
+    # snap to the exact coordinates of axis aligned segments
+    if adx == 0:
+        x = ax
+    elif bdx == 0:
+        x = bx
+    if ady == 0:
+        y = ay
+    elif bdy == 0:
+        y = by
+    return (x, y)
+
+
+def segment_intersections(lines: Iterable[Any]) -> list[tuple[Point, int, int]]:
+    """Returns every point where two of lines touch or cross.
+
+    Each result is (point, i, j) with i < j indices into lines. Segments
+    that share an endpoint or where an endpoint lies on another segment
+    are reported, and collinear segments that overlap are reported at
+    both ends of the shared piece.
+
+    This is a Bentley-Ottmann sweep running in O((n + k) log n) for n
+    segments and k intersections: events are swept left to right, then
+    bottom to top, and only segments adjacent along the sweep line are
+    ever tested against each other. Points closer to a segment than a
+    small tolerance relative to their coordinates are considered on it.
+
+    >>> segment_intersections([
+    ...     Line(Point(0, 0), Point(2, 2)),
+    ...     Line(Point(0, 2), Point(2, 0)),
+    ... ])
+    [(Point(x=1.0, y=1.0), 0, 1)]
+
+    :param lines: Iterable of Line or (start, end) pairs of points
+    :return: list of (Point, i, j)
+    """
+
+    # endpoints ordered so every segment runs left to right, then up
+    xs0, ys0, xs1, ys1 = array("d"), array("d"), array("d"), array("d")
+    slopes = array("d")
+    starts: dict[tuple[float, float], list[int]] = {}
+    ends: dict[tuple[float, float], list[int]] = {}
+
+    for index, (start, end) in enumerate(lines):
+        (px, py), (qx, qy) = xy(start), xy(end)
+        p, q = (float(px), float(py)), (float(qx), float(qy))
+        if q < p:
+            p, q = q, p
+        xs0.append(p[0])
+        ys0.append(p[1])
+        xs1.append(q[0])
+        ys1.append(q[1])
+        dx = q[0] - p[0]
+        slopes.append((q[1] - p[1]) / dx if dx else float("inf"))
+        starts.setdefault(p, []).append(index)
+        ends.setdefault(q, []).append(index)
+
+    events = list(starts.keys() | ends.keys())
+    heapq.heapify(events)
+    queued = set(events)
+    crossings: dict[tuple[float, float], set[int]] = {}
+
+    status: list[int] = []
+    found: list[tuple[Point, int, int]] = []
+    seen: set[tuple[int, int]] = set()
+
+    def y_at(s: int, px: float, py: float) -> float:
+        # a vertical segment in the status always contains the event
+        if px == xs0[s]:
+            return py if xs1[s] == px else ys0[s]
+        if px == xs1[s]:
+            return ys1[s]
+        return ys0[s] + (px - xs0[s]) * slopes[s]
+
+    def is_end(s: int, event: tuple[float, float]) -> bool:
+        return event == (xs0[s], ys0[s]) or event == (xs1[s], ys1[s])
+
+    def schedule(a: int, b: int, event: tuple[float, float]) -> None:
+        point = _crossing(xs0, ys0, xs1, ys1, a, b)
+        if point is None or point <= event:
+            return
+        crossings.setdefault(point, set()).update((a, b))
+        if point not in queued:
+            queued.add(point)
+            heapq.heappush(events, point)
+
+    while events:
+        event = heapq.heappop(events)
+        queued.discard(event)
+        px, py = event
+        tolerance = _TOLERANCE * max(1.0, abs(px), abs(py))
+
+        # the segments through the event form a block in the status
+        lo, hi = 0, len(status)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if y_at(status[mid], px, py) < py - tolerance:
+                lo = mid + 1
+            else:
+                hi = mid
+        hi = lo
+        while hi < len(status) and y_at(status[hi], px, py) <= py + tolerance:
+            hi += 1
+
+        block = status[lo:hi]
+        del status[lo:hi]
+        upper = starts.pop(event, [])
+        # segments out of order by rounding are pulled in explicitly
+        stray = crossings.pop(event, set()).union(ends.get(event, ()))
+        stray.difference_update(block, upper)
+        for s in stray:
+            try:
+                position = status.index(s)
+            except ValueError:
+                continue
+            del status[position]
+            lo -= position < lo
+            block.append(s)
+
+        involved = sorted(set(block).union(upper))
+        # crossing pairs are reported once, collinear ones at both ends
+        # of the shared piece, where one of them starts or ends
+        for i, a in enumerate(involved):
+            for b in involved[i + 1 :]:
+                if slopes[a] != slopes[b]:
+                    if (a, b) in seen:
+                        continue
+                    seen.add((a, b))
+                elif not (is_end(a, event) or is_end(b, event)):
+                    continue
+                found.append((Point(px, py), a, b))
+
+        # re-insert the segments continuing past the event, ordered by
+        # their slope just to the right of it
+        finished = set(ends.pop(event, ()))
+        continuing = [s for s in block if s not in finished]
+        continuing.extend(s for s in upper if s not in finished)
+        continuing.sort(key=lambda s: (slopes[s], s))
+        status[lo:lo] = continuing
+
+        above = lo + len(continuing)
+        if not continuing:
+            if 0 < lo < len(status):
+                schedule(status[lo - 1], status[lo], event)
+            continue
+        if lo > 0:
+            schedule(status[lo - 1], continuing[0], event)
+        if above < len(status):
+            schedule(continuing[-1], status[above], event)
+
+    return found
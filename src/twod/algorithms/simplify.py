@@ -0,0 +1,129 @@
+"""polyline simplification for humans™"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from typing import Any
+
+from .._coords import columns
+
+
+def _douglas_peucker(xs: list[float], ys: list[float], tolerance: float) -> list[int]:
+    n = len(xs)
+    keep = bytearray(n)
+    keep[0] = keep[n - 1] = 1
+    limit = tolerance * tolerance
+
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = xs[first], ys[first]
+        vx, vy = xs[last] - ax, ys[last] - ay
+        vv = vx * vx + vy * vy
+
+        farthest, worst = -1, limit
+        for i in range(first + 1, last):
+            # the same distance as Line.distance_to_point, squared
+            wx, wy = xs[i] - ax, ys[i] - ay
+            t = (wx * vx + wy * vy) / vv if vv else 0.0
+            if t <= 0:
+                d2 = wx * wx + wy * wy
+            elif t >= 1:
+                dx, dy = wx - vx, wy - vy
+                d2 = dx * dx + dy * dy
+            else:
+                cross = wx * vy - wy * vx
+                d2 = cross * cross / vv
+            if d2 > worst:
+                farthest, worst = i, d2
+
+        if farthest >= 0:
+            keep[farthest] = 1
+            stack.append((farthest, last))
+            stack.append((first, farthest))
+
+    return [i for i in range(n) if keep[i]]
+
+
+def _visvalingam_whyatt(
+    xs: list[float],
+    ys: list[float],
+    tolerance: float,
+) -> list[int]:
+    n = len(xs)
+    previous = list(range(-1, n - 1))
+    following = list(range(1, n + 1))
+    removed = bytearray(n)
+
+    def area(i: int) -> float:
+        a, c = previous[i], following[i]
+        ax, ay = xs[a], ys[a]
+        return abs((xs[i] - ax) * (ys[c] - ay) - (xs[c] - ax) * (ys[i] - ay)) / 2
+
+    areas = [0.0] * n
+    heap = []
+    for i in range(1, n - 1):
+        areas[i] = area(i)
+        heap.append((areas[i], i))
+    heapq.heapify(heap)
+
+    while heap:
+        smallest, i = heapq.heappop(heap)
+        if removed[i] or smallest != areas[i]:
+            continue
+        if smallest >= tolerance:
+            break
+        removed[i] = 1
+        a, c = previous[i], following[i]
+        following[a], previous[c] = c, a
+        # neighbours never get less significant than the point removed
+        for j in (a, c):
+            if 0 < j < n - 1:
+                areas[j] = max(area(j), smallest)
+                heapq.heappush(heap, (areas[j], j))
+
+    return [i for i in range(n) if not removed[i]]
+
+
+_METHODS = {
+    "dp": _douglas_peucker,
+    "vw": _visvalingam_whyatt,
+}
+
+
+def simplify(points: Iterable[Any], tolerance: float, method: str = "dp") -> list[int]:
+    """Returns the indices of the points kept when simplifying the
+    polyline through points.
+
+    With method "dp" (Douglas-Peucker) a span is kept whole if no point
+    between its ends is farther than tolerance from the segment joining
+    them, otherwise it is split at the farthest point. With method "vw"
+    (Visvalingam-Whyatt) the point making the smallest triangle with its
+    neighbours is removed until every triangle has an area of at least
+    tolerance.
+
+    Spans are kept on an explicit stack rather than by recursion, and
+    distances and areas are computed on the raw coordinates, so long
+    traces neither overflow nor allocate points. The first and last
+    points are always kept.
+
+    Raises ValueError for an unknown method.
+
+    >>> simplify([Point(0, 0), Point(1, 0.1), Point(2, 0), Point(3, 5)], 0.5)
+    [0, 2, 3]
+
+    :param points: Iterable of points, a PointArray or a packed buffer
+    :param float tolerance: distance for "dp", area for "vw"
+    :param str method: "dp" or "vw"
+    :return: list of indices into points, in order
+    """
+    try:
+        simplifier = _METHODS[method]
+    except KeyError:
+        raise ValueError(f"Unknown method {method!r}, expected 'dp' or 'vw'") from None
+
+    xs, ys = columns(points)
+    if len(xs) < 3:
+        return list(range(len(xs)))
+    return simplifier(xs, ys, tolerance)
@@ -0,0 +1,271 @@
+"""the union of rectangles for humans™"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from .._coords import extents
+from ..polygon import Polygon
+
+
+class _Cover:
+    """A segment tree counting how many times each elementary interval
+    between consecutive values of ys is covered."""
+
+    def __init__(self, ys: list[float]) -> None:
+        self.ys = ys
+        self.leaves = max(1, len(ys) - 1)
+        self.count = [0] * (4 * self.leaves)
+        self.length = [0.0] * (4 * self.leaves)
+
+    def update(
+        self,
+        a: int,
+        b: int,
+        delta: int,
+        node: int = 1,
+        lo: int = 0,
+        hi: int = -1,
+    ) -> None:
+        """Adds delta to the cover of the elementary intervals a to b."""
+        if hi < 0:
+            hi = self.leaves
+        if b <= lo or hi <= a:
+            return
+        count, length = self.count, self.length
+        if a <= lo and hi <= b:
+            count[node] += delta
+        else:
+            mid = (lo + hi) // 2
+            self.update(a, b, delta, 2 * node, lo, mid)
+            self.update(a, b, delta, 2 * node + 1, mid, hi)
+        if count[node]:
+            length[node] = self.ys[hi] - self.ys[lo]
+        elif hi - lo == 1:
+            length[node] = 0.0
+        else:
+            length[node] = length[2 * node] + length[2 * node + 1]
+
+    @property
+    def covered(self) -> float:
+        """The total length covered at least once."""
+        return self.length[1]
+
+    def intervals(self, a: int, b: int) -> list[tuple[float, float]]:
+        """Returns the covered parts of the elementary intervals a to b as
+        sorted, separated intervals."""
+        found: list[tuple[float, float]] = []
+        ys, count, length = self.ys, self.count, self.length
+        stack = [(1, 0, self.leaves)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if hi <= a or b <= lo:
+                continue
+            if count[node]:
+                y0, y1 = ys[max(lo, a)], ys[min(hi, b)]
+                if found and found[-1][1] == y0:
+                    found[-1] = (found[-1][0], y1)
+                else:
+                    found.append((y0, y1))
+            elif hi - lo > 1 and length[node]:
+                mid = (lo + hi) // 2
+                stack.append((2 * node + 1, mid, hi))
+                stack.append((2 * node, lo, mid))
+        return found
+
+
+def _subtract(
+    a: list[tuple[float, float]],
+    b: list[tuple[float, float]],
+) -> list[tuple[float, float]]:
+    """Returns the parts of the sorted intervals a not covered by the
+    sorted intervals b."""
+    found = []
+    k = 0
+    for lo, hi in a:
+        while k < len(b) and b[k][1] <= lo:
+            k += 1
+        j = k
+        while lo < hi:
+            if j == len(b) or b[j][0] >= hi:
+                found.append((lo, hi))
+                break
+            if b[j][0] > lo:
+                found.append((lo, b[j][0]))
+            lo = max(lo, b[j][1])
+            j += 1
+    return found
+
+
+def _outline(
+    edges: list[tuple[float, float, float]],
+) -> list[Polygon]:
+    """Returns the boundary of the union as polygons, given its vertical
+    edges directed with the union on their left."""
+    outgoing: dict[tuple[float, float], list[tuple[float, float]]] = {}
+    levels: dict[float, list[tuple[float, bool]]] = {}
+    for x, y0, y1 in edges:
+        outgoing.setdefault((x, y0), []).append((x, y1))
+        levels.setdefault(y0, []).append((x, False))
+        levels.setdefault(y1, []).append((x, True))
+
+    # along each horizontal line the vertical edge ends pair up in order,
+    # each horizontal edge running from where a vertical edge arrives
+    for y, ends in levels.items():
+        ends.sort()
+        for (xa, arrives), (xb, _) in zip(ends[0::2], ends[1::2]):
+            if xa != xb:
+                a, b = ((xa, y), (xb, y)) if arrives else ((xb, y), (xa, y))
+                outgoing.setdefault(a, []).append(b)
+
+    polygons = []
+    for start in list(outgoing):
+        if start not in outgoing:
+            continue
+        walk = [start]
+        point = start
+        dx = dy = 0.0
+        while True:
+            targets = outgoing[point]
+            if len(targets) > 1:
+                # where loops touch at a corner, turn left to keep them apart
+                targets.sort(
+                    key=lambda e: -(dx * (e[1] - point[1]) - dy * (e[0] - point[0]))
+                )
+            end = targets.pop(0)
+            if not targets:
+                del outgoing[point]
+            dx, dy = end[0] - point[0], end[1] - point[1]
+            point = end
+            walk.append(point)
+            if point == start:
+                break
+
+        # a hole touching the outer boundary at a corner is walked in
+        # the same loop, split it off wherever a vertex repeats
+        path: list[tuple[float, float]] = []
+        at: dict[tuple[float, float], int] = {}
+        for point in walk:
+            i = at.get(point)
+            if i is None:
+                at[point] = len(path)
+                path.append(point)
+                continue
+            polygons.append(_corners(path[i:]))
+            for q in path[i + 1 :]:
+                del at[q]
+            del path[i + 1 :]
+    return polygons
+
+
+def _corners(loop: list[tuple[float, float]]) -> Polygon:
+    """Returns loop as a Polygon without the vertices in the middle of
+    straight runs."""
+    n = len(loop)
+    corners = [
+        loop[i]
+        for i in range(n)
+        if not (
+            loop[i - 1][0] == loop[i][0] == loop[(i + 1) % n][0]
+            or loop[i - 1][1] == loop[i][1] == loop[(i + 1) % n][1]
+        )
+    ]
+    return Polygon.from_arrays([x for x, _ in corners], [y for _, y in corners])
+
+
+def _sweep(
+    rects: Iterable[Any],
+    outline: bool,
+) -> tuple[float, list[tuple[float, float, float]]]:
+    """Returns the area covered by at least one of rects and, if outline
+    is True, the vertical edges of the boundary of their union as
+    (x, y_from, y_to) directed with the union on their left.
+
+    A vertical line sweeps across the left and right edges of the rects
+    while a segment tree over their distinct y coordinates tracks how
+    much of the line is covered, so overlaps are counted once. The
+    vertical edges are read off the segment tree where the cover
+    changes.
+    """
+    x0s, y0s, x1s, y1s = extents(rects)
+    events = []
+    for x0, y0, x1, y1 in zip(x0s, y0s, x1s, y1s):
+        if x0 < x1 and y0 < y1:
+            events.append((x0, 1, y0, y1))
+            events.append((x1, -1, y0, y1))
+    events.sort()
+
+    ys = sorted({y for _, _, y0, y1 in events for y in (y0, y1)})
+    rank = {y: i for i, y in enumerate(ys)}
+    cover = _Cover(ys)
+
+    area = 0.0
+    edges: list[tuple[float, float, float]] = []
+    k = 0
+    last = events[0][0] if events else 0.0
+    while k < len(events):
+        x = events[k][0]
+        area += cover.covered * (x - last)
+        last = x
+        group = k
+        while k < len(events) and events[k][0] == x:
+            k += 1
+
+        if outline:
+            a = min(rank[y0] for _, _, y0, _ in events[group:k])
+            b = max(rank[y1] for _, _, _, y1 in events[group:k])
+            before = cover.intervals(a, b)
+        for _, delta, y0, y1 in events[group:k]:
+            cover.update(rank[y0], rank[y1], delta)
+        if outline:
+            after = cover.intervals(a, b)
+            # upwards where the union ends, downwards where it starts
+            edges.extend((x, lo, hi) for lo, hi in _subtract(before, after))
+            edges.extend((x, hi, lo) for lo, hi in _subtract(after, before))
+
+    return (area, edges)
+
+
+def union_area(rects: Iterable[Any]) -> float:
+    """Returns the area covered by at least one of rects.
+
+    A vertical line sweeps across the left and right edges of the rects
+    while a segment tree over their distinct y coordinates tracks how
+    much of the line is covered, so overlaps are counted once and the
+    area is found in O(n log n).
+
+    Rects may be Rects, CRects, (x, y, w, h) tuples or a packed buffer
+    of (x, y, w, h) values. Rects with no area are ignored.
+
+    >>> union_area([Rect(0, 0, 2, 2), Rect(1, 1, 2, 2)])
+    7.0
+
+    :param rects: Iterable of rects or a packed buffer
+    :return: float
+    """
+    return _sweep(rects, outline=False)[0]
+
+
+def union_outline(rects: Iterable[Any]) -> list[Polygon]:
+    """Returns the boundary of the area covered by at least one of rects
+    as a list of Polygons.
+
+    Outer boundaries wind counter clock-wise and holes wind clock-wise,
+    so their signed areas add up to union_area(rects). Each Polygon is
+    simple: where a hole or another piece of the union touches at a
+    corner, they are returned as separate Polygons. The vertical edges
+    of the outline are found by the same sweep as union_area, and the
+    horizontal edges join their ends.
+
+    Rects may be Rects, CRects, (x, y, w, h) tuples or a packed buffer
+    of (x, y, w, h) values. Rects with no area are ignored.
+
+    >>> outline = union_outline([Rect(0, 0, 2, 2), Rect(1, 1, 2, 2)])
+    >>> len(outline), outline[0].area
+    (1, 7.0)
+
+    :param rects: Iterable of rects or a packed buffer
+    :return: list of Polygon
+    """
+    return _outline(_sweep(rects, outline=True)[1])
@@ -0,0 +1,470 @@
+"""array kernels for humans™
+
+twod has no required dependencies, but batch operations on collections
+of points run much faster with NumPy. This module picks a set of kernels
+when it is imported:
+
+- NumPy kernels if NumPy can be imported
+- pure-Python loops over the stdlib array module otherwise
+
+The choice can be forced by setting the TWOD_BACKEND environment variable
+to "numpy" or "python" before importing twod, or at runtime with use().
+
+Collections like PointArray capture the kernels active when they are
+created, so switch backends before building them.
+"""
+
+from __future__ import annotations
+
+import cmath
+import math
+import operator
+import os
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from itertools import chain, repeat
+from typing import Any
+
+BACKEND_ENV = "TWOD_BACKEND"
+
+_DIVISION_OPS = (operator.truediv, operator.floordiv, operator.mod)
+_POWER_OPS = (operator.pow, operator.ipow)
+
+
+def _power(x: float, y: float) -> float:
+    # float ** returns a complex for a negative base and fractional
+    # exponent, which an array('d') can't hold
+    if x < 0 and y != math.floor(y):
+        raise ValueError("Negative number cannot be raised to a fractional power")
+    return x**y
+
+
+class PythonKernels:
+    """Kernels implemented with loops over array('d') buffers.
+
+    Complex buffers are arrays of doubles holding interleaved real and
+    imaginary parts.
+    """
+
+    name = "python"
+
+    # float buffers
+
+    @staticmethod
+    def floats(values: Iterable[float | int]) -> array:
+        return array("d", values)
+
+    @staticmethod
+    def zeros(count: int) -> array:
+        return array("d", bytes(8 * count))
+
+    @staticmethod
+    def copy(a: array) -> array:
+        return array("d", a)
+
+    @staticmethod
+    def extend(a: array, values: Iterable[float | int]) -> array:
+        a.extend(values)
+        return a
+
+    @staticmethod
+    def tolist(a: array) -> list[float]:
+        return a.tolist()
+
+    @staticmethod
+    def equal(a: array, b: array) -> bool:
+        return a == b
+
+    @staticmethod
+    def binop(op: Callable, a: array, b: array | float) -> array:
+        if op in _POWER_OPS:
+            op = _power
+        if isinstance(b, (int, float)):
+            return array("d", map(op, a, repeat(b)))
+        return array("d", map(op, a, b))
+
+    @staticmethod
+    def unop(op: Callable, a: array) -> array:
+        return array("d", map(op, a))
+
+    @staticmethod
+    def hypot(x: array, y: array) -> array:
+        return array("d", map(math.hypot, x, y))
+
+    @staticmethod
+    def atan2(y: array, x: array) -> array:
+        return array("d", map(math.atan2, y, x))
+
+    @staticmethod
+    def degrees(a: array) -> array:
+        return array("d", map(math.degrees, a))
+
+    @staticmethod
+    def distance_squared(xs: array, ys: array, x: float, y: float) -> array:
+        return array(
+            "d", ((px - x) * (px - x) + (py - y) * (py - y) for px, py in zip(xs, ys))
+        )
+
+    @staticmethod
+    def bounded(
+        xs: array,
+        ys: array,
+        p: tuple[float, float],
+        q: tuple[float, float],
+        op: Callable,
+    ) -> list[bool]:
+        x0, x1 = sorted((p[0], q[0]))
+        y0, y1 = sorted((p[1], q[1]))
+        return [
+            op(x0, x) and op(x, x1) and op(y0, y) and op(y, y1) for x, y in zip(xs, ys)
+        ]
+
+    @staticmethod
+    def outside_convex(
+        xs: array,
+        ys: array,
+        cxs: list[float],
+        cys: list[float],
+    ) -> list[int]:
+        """Returns the indices of points not strictly inside the convex
+        polygon with counter clock-wise corners (cxs, cys)."""
+        edges = list(zip(cxs, cys, cxs[1:] + cxs[:1], cys[1:] + cys[:1]))
+        found = []
+        for index, (x, y) in enumerate(zip(xs, ys)):
+            for ax, ay, bx, by in edges:
+                if (bx - ax) * (y - ay) - (x - ax) * (by - ay) <= 0:
+                    found.append(index)
+                    break
+        return found
+
+    @staticmethod
+    def along(
+        xs: array,
+        ys: array,
+        lengths: array,
+        distances: array,
+    ) -> tuple[array, array]:
+        """Returns the points at distances along the polyline (xs, ys)
+        with cumulative segment lengths, clamped to its ends."""
+        last = len(lengths) - 2
+        px, py = array("d"), array("d")
+        for d in distances:
+            i = min(max(bisect_right(lengths, d) - 1, 0), last)
+            start, span = lengths[i], lengths[i + 1] - lengths[i]
+            t = min(max((d - start) / span, 0.0), 1.0) if span else 0.0
+            px.append(xs[i] + (xs[i + 1] - xs[i]) * t)
+            py.append(ys[i] + (ys[i + 1] - ys[i]) * t)
+        return (px, py)
+
+    # complex buffers
+
+    @staticmethod
+    def complexes(values: Iterable[complex]) -> array:
+        return array("d", chain.from_iterable((z.real, z.imag) for z in values))
+
+    @staticmethod
+    def complex_polar(radii: Iterable[float], thetas: Iterable[float]) -> array:
+        return PythonKernels.complexes(map(cmath.rect, radii, thetas))
+
+    @staticmethod
+    def complex_tolist(a: array) -> list[complex]:
+        return list(map(complex, a[0::2], a[1::2]))
+
+    @staticmethod
+    def complex_len(a: array) -> int:
+        return len(a) // 2
+
+    @staticmethod
+    def complex_get(a: array, key: int) -> complex:
+        n = len(a) // 2
+        index = key + n if key < 0 else key
+        if not 0 <= index < n:
+            raise IndexError(f"Key out of range: {key}")
+        return complex(a[2 * index], a[2 * index + 1])
+
+    @staticmethod
+    def complex_set(a: array, key: int, z: complex) -> None:
+        n = len(a) // 2
+        index = key + n if key < 0 else key
+        if not 0 <= index < n:
+            raise IndexError(f"Key out of range: {key}")
+        a[2 * index] = z.real
+        a[2 * index + 1] = z.imag
+
+    @staticmethod
+    def complex_real(a: array) -> array:
+        return a[0::2]
+
+    @staticmethod
+    def complex_imag(a: array) -> array:
+        return a[1::2]
+
+    @staticmethod
+    def complex_abs(a: array) -> array:
+        return array("d", map(math.hypot, a[0::2], a[1::2]))
+
+    @staticmethod
+    def complex_angle(a: array) -> array:
+        return array("d", map(math.atan2, a[1::2], a[0::2]))
+
+    @staticmethod
+    def complex_affine(a: array, mul: complex, add: complex, inplace: bool) -> array:
+        """Computes a * mul + add for every value in a."""
+        result = PythonKernels.complexes(
+            z * mul + add for z in map(complex, a[0::2], a[1::2])
+        )
+        if inplace:
+            a[:] = result
+            return a
+        return result
+
+
+class NumpyKernels:
+    """Kernels implemented with NumPy float64 and complex128 arrays."""
+
+    name = "numpy"
+
+    def __init__(self, np: Any) -> None:
+        self.np = np
+
+    # float buffers
+
+    def floats(self, values: Iterable[float | int]) -> Any:
+        if isinstance(values, self.np.ndarray):
+            return values.astype(self.np.float64)
+        return self.np.fromiter(values, dtype=self.np.float64)
+
+    def zeros(self, count: int) -> Any:
+        return self.np.zeros(count, dtype=self.np.float64)
+
+    def copy(self, a: Any) -> Any:
+        return a.copy()
+
+    def extend(self, a: Any, values: Iterable[float | int]) -> Any:
+        """Returns a with values added to its end.
+
+        NumPy arrays can't grow, so buffers are grown into a larger
+        array with room to spare and returned as a view of its start.
+        Extending such a view fills in the spare room, so a run of
+        appends copies the buffer O(log n) times rather than each time.
+        """
+        added = self.floats(values)
+        n, m = len(a), len(added)
+        base = a.base
+        if (
+            base is not None
+            and base.ndim == 1
+            and len(base) >= n + m
+            and base.dtype == a.dtype
+            and a.strides == base.strides
+            and a.ctypes.data == base.ctypes.data
+        ):
+            grown = base[: n + m]
+        else:
+            grown = self.np.empty(max(2 * (n + m), 8), dtype=self.np.float64)
+            grown = grown[: n + m]
+            grown[:n] = a
+        grown[n:] = added
+        return grown
+
+    def tolist(self, a: Any) -> list[float]:
+        return a.tolist()
+
+    def equal(self, a: Any, b: Any) -> bool:
+        return bool(self.np.array_equal(a, b))
+
+    def _check_divisor(self, op: Callable, b: Any) -> None:
+        # NumPy returns inf/nan with a warning, Python raises.
+        if op in _DIVISION_OPS and self.np.any(self.np.asarray(b) == 0):
+            raise ZeroDivisionError("float division by zero")
+
+    def _power(self, a: Any, b: Any) -> Any:
+        # NumPy returns nan or inf with a warning, Python raises.
+        np = self.np
+        base, exponent = np.asarray(a), np.asarray(b)
+        if np.any((base < 0) & (exponent != np.floor(exponent))):
+            raise ValueError("Negative number cannot be raised to a fractional power")
+        if np.any((base == 0) & (exponent < 0)):
+            raise ZeroDivisionError("0.0 cannot be raised to a negative power")
+        with np.errstate(over="raise"):
+            try:
+                return base**exponent
+            except FloatingPointError:
+                raise OverflowError("Numerical result out of range") from None
+
+    def binop(self, op: Callable, a: Any, b: Any) -> Any:
+        if op in _POWER_OPS:
+            return self._power(a, b)
+        self._check_divisor(op, b)
+        return op(a, b)
+
+    def unop(self, op: Callable, a: Any) -> Any:
+        return op(a)
+
+    def hypot(self, x: Any, y: Any) -> Any:
+        return self.np.hypot(x, y)
+
+    def atan2(self, y: Any, x: Any) -> Any:
+        return self.np.arctan2(y, x)
+
+    def degrees(self, a: Any) -> Any:
+        return self.np.degrees(a)
+
+    def distance_squared(self, xs: Any, ys: Any, x: float, y: float) -> Any:
+        dx = xs - x
+        dy = ys - y
+        return dx * dx + dy * dy
+
+    def bounded(
+        self,
+        xs: Any,
+        ys: Any,
+        p: tuple[float, float],
+        q: tuple[float, float],
+        op: Callable,
+    ) -> Any:
+        x0, x1 = sorted((p[0], q[0]))
+        y0, y1 = sorted((p[1], q[1]))
+        return op(x0, xs) & op(xs, x1) & op(y0, ys) & op(ys, y1)
+
+    def outside_convex(
+        self,
+        xs: Any,
+        ys: Any,
+        cxs: list[float],
+        cys: list[float],
+    ) -> list[int]:
+        """Returns the indices of points not strictly inside the convex
+        polygon with counter clock-wise corners (cxs, cys)."""
+        inside = self.np.ones(len(xs), dtype=bool)
+        for ax, ay, bx, by in zip(cxs, cys, cxs[1:] + cxs[:1], cys[1:] + cys[:1]):
+            inside &= (bx - ax) * (ys - ay) - (xs - ax) * (by - ay) > 0
+        return self.np.flatnonzero(~inside).tolist()
+
+    def along(
+        self,
+        xs: Any,
+        ys: Any,
+        lengths: Any,
+        distances: Any,
+    ) -> tuple[Any, Any]:
+        """Returns the points at distances along the polyline (xs, ys)
+        with cumulative segment lengths, clamped to its ends."""
+        np = self.np
+        i = np.searchsorted(lengths, distances, side="right") - 1
+        i = np.clip(i, 0, len(lengths) - 2)
+        start = lengths[i]
+        span = lengths[i + 1] - start
+        t = np.divide(distances - start, span, out=np.zeros(len(i)), where=span > 0)
+        t = np.clip(t, 0.0, 1.0)
+        return (xs[i] + (xs[i + 1] - xs[i]) * t, ys[i] + (ys[i + 1] - ys[i]) * t)
+
+    # complex buffers
+
+    def complexes(self, values: Iterable[complex]) -> Any:
+        return self.np.fromiter(values, dtype=self.np.complex128)
+
+    def complex_polar(self, radii: Iterable[float], thetas: Iterable[float]) -> Any:
+        r, t = self.floats(radii), self.floats(thetas)
+        return r * self.np.exp(1j * t)
+
+    def complex_tolist(self, a: Any) -> list[complex]:
+        return a.tolist()
+
+    def complex_len(self, a: Any) -> int:
+        return len(a)
+
+    def complex_get(self, a: Any, key: int) -> complex:
+        return complex(a[key])
+
+    def complex_set(self, a: Any, key: int, z: complex) -> None:
+        a[key] = z
+
+    def complex_real(self, a: Any) -> Any:
+        return a.real
+
+    def complex_imag(self, a: Any) -> Any:
+        return a.imag
+
+    def complex_abs(self, a: Any) -> Any:
+        return self.np.abs(a)
+
+    def complex_angle(self, a: Any) -> Any:
+        return self.np.angle(a)
+
+    def complex_affine(self, a: Any, mul: complex, add: complex, inplace: bool) -> Any:
+        """Computes a * mul + add for every value in a."""
+        if not inplace:
+            return a * mul + add
+        if mul != 1:
+            a *= mul
+        if add:
+            a += add
+        return a
+
+
+Kernels = PythonKernels | NumpyKernels
+
+
+def available() -> list[str]:
+    """Returns the names of the backends that can be used here."""
+    names = ["python"]
+    try:
+        import numpy  # noqa: F401
+
+        names.insert(0, "numpy")
+    except ImportError:
+        pass
+    return names
+
+
+def select(name: str | None = None) -> Kernels:
+    """Returns kernels for the named backend.
+
+    If name is not given, the TWOD_BACKEND environment variable is
+    consulted and, failing that, NumPy is preferred when importable.
+
+    Raises ValueError for an unknown backend name and ImportError if
+    "numpy" is requested but NumPy is not installed.
+
+    :param name: "numpy", "python" or None
+    :return: Kernels
+    """
+    name = (name or os.environ.get(BACKEND_ENV) or "").strip().lower()
+
+    if name == "python":
+        return PythonKernels()
+
+    if name not in ("", "numpy"):
+        raise ValueError(f"Unknown backend {name!r}, expected 'numpy' or 'python'")
+
+    try:
+        import numpy
+    except ImportError:
+        if name == "numpy":
+            raise ImportError(
+                f"{BACKEND_ENV}=numpy but NumPy is not installed"
+            ) from None
+        return PythonKernels()
+
+    return NumpyKernels(numpy)
+
+
+_kernels: Kernels = select()
+
+
+def kernels() -> Kernels:
+    """Returns the active kernels."""
+    return _kernels
+
+
+def use(name: str | None = None) -> Kernels:
+    """Makes the named backend active and returns its kernels.
+
+    :param name: "numpy", "python" or None to re-run the default selection
+    :return: Kernels
+    """
+    global _kernels
+    _kernels = select(name)
+    return _kernels
@@ -0,0 +1,337 @@
+"""polygon boolean operations for humans™
+
+Shapes are given as rings: a Polygon, a sequence of points, or any
+nesting of lists of those, such as a list of polygons each made of an
+outer ring followed by its holes. A point is inside a shape if it is
+inside an odd number of its rings, so holes need no particular
+orientation.
+
+Results are multi-polygons: a list of polygons, each a list of Polygon
+rings starting with its outer ring. Outer rings wind counter clock-wise
+and holes wind clock-wise, see twod.constants.Winding.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from numbers import Real
+from typing import Any
+
+from ._coords import columns
+from .algorithms import segment_intersections
+from .algorithms.intersections import _TOLERANCE
+from .constants import Winding
+from .polygon import Polygon
+
+_Point = tuple[float, float]
+
+
+def _rings(shape: Any) -> list[tuple[list[float], list[float]]]:
+    """Returns the coordinates of every ring in shape."""
+    if isinstance(shape, Polygon):
+        return [(list(shape.x), list(shape.y))] if len(shape) else []
+
+    values = shape if isinstance(shape, list) else list(shape)
+    if not values:
+        return []
+    first = values[0]
+    if isinstance(first, (Real, complex)) or hasattr(first, "xy"):
+        return [columns(values)]
+    if (
+        not isinstance(first, Polygon)
+        and len(first) == 2
+        and all(isinstance(v, Real) for v in first)
+    ):
+        return [columns(values)]
+    return [ring for value in values for ring in _rings(value)]
+
+
+def _fragments(
+    a: list[tuple[list[float], list[float]]],
+    b: list[tuple[list[float], list[float]]],
+) -> dict[tuple[_Point, _Point], list[int]]:
+    """Returns the edges of both shapes cut wherever they touch or cross,
+    keyed by their endpoints in sweep order, with how many edges of each
+    shape run along them."""
+    edges: list[tuple[_Point, _Point]] = []
+    owners: list[int] = []
+    for owner, rings in enumerate((a, b)):
+        for xs, ys in rings:
+            n = len(xs)
+            for i in range(n):
+                p, q = (xs[i - 1], ys[i - 1]), (xs[i], ys[i])
+                if p != q:
+                    edges.append((p, q))
+                    owners.append(owner)
+
+    cuts: list[list[_Point]] = [[] for _ in edges]
+    for crossing, i, j in segment_intersections(edges):
+        cuts[i].append(crossing.xy)
+        cuts[j].append(crossing.xy)
+
+    snapped = _snap(
+        [p for edge in edges for p in edge] + [c for points in cuts for c in points]
+    )
+    fragments: dict[tuple[_Point, _Point], list[int]] = {}
+    for (p, q), owner, points in zip(edges, owners, cuts):
+        p, q = snapped[p], snapped[q]
+        if q < p:
+            p, q = q, p
+        dx, dy = q[0] - p[0], q[1] - p[1]
+        # the cuts by how far along the edge they are
+        ranked = sorted(
+            ((x - p[0]) * dx + (y - p[1]) * dy, (x, y))
+            for x, y in {snapped[c] for c in points}
+        )
+        end = dx * dx + dy * dy
+        start = p
+        for t, point in ranked + [(end, q)]:
+            if point == start or (point != q and not 0 < t < end):
+                continue
+            key = (start, point) if start < point else (point, start)
+            fragments.setdefault(key, [0, 0])[owner] += 1
+            start = point
+    return fragments
+
+
+def _snap(points: list[_Point]) -> dict[_Point, _Point]:
+    """Returns a map from each of points to the first point in sweep order
+    closer to it than the tolerance of segment_intersections.
+
+    Where three or more edges cross at one point, each pair may find it a
+    rounding error apart, so the pieces of the edges wouldn't meet.
+    """
+    ordered = sorted(set(points))
+    scale = max((max(abs(x), abs(y)) for x, y in ordered), default=0.0)
+    size = _TOLERANCE * max(1.0, scale)
+    cells: dict[tuple[int, int], list[_Point]] = {}
+    snapped: dict[_Point, _Point] = {}
+    for x, y in ordered:
+        i, j = math.floor(x / size), math.floor(y / size)
+        snapped[(x, y)] = next(
+            (
+                (rx, ry)
+                for ci in (i - 1, i, i + 1)
+                for cj in (j - 1, j, j + 1)
+                for rx, ry in cells.get((ci, cj), ())
+                if abs(rx - x) <= size and abs(ry - y) <= size
+            ),
+            (x, y),
+        )
+        if snapped[(x, y)] == (x, y):
+            cells.setdefault((i, j), []).append((x, y))
+    return snapped
+
+
+def _boolean(a: Any, b: Any, keep: Callable[[bool, bool], bool]) -> list[list[Polygon]]:
+    fragments = _fragments(_rings(a), _rings(b))
+    keys = list(fragments)
+    count = len(keys)
+
+    starts: dict[_Point, list[int]] = {}
+    ends: dict[_Point, list[int]] = {}
+    for f, (p, q) in enumerate(keys):
+        starts.setdefault(p, []).append(f)
+        ends.setdefault(q, []).append(f)
+
+    def y_at(f: int, x: float, y: float) -> float:
+        (x0, y0), (x1, y1) = keys[f]
+        if x0 == x1:
+            # a vertical fragment in the status always contains the event
+            return min(max(y, y0), y1)
+        if x == x0:
+            return y0
+        if x == x1:
+            return y1
+        return y0 + (x - x0) * (y1 - y0) / (x1 - x0)
+
+    def slope(f: int) -> float:
+        (x0, y0), (x1, y1) = keys[f]
+        return (y1 - y0) / (x1 - x0) if x1 != x0 else math.inf
+
+    # the inside flags of both shapes just above each fragment, whether
+    # it bounds the result and which way, and the nearest fragment below
+    # it bounding the result
+    above = [(False, False)] * count
+    boundary = bytearray(count)
+    forward = bytearray(count)
+    below_boundary = [-1] * count
+    order = [0] * count
+    live = bytearray(count)
+
+    status: list[int] = []
+    inserted = 0
+    for px, py in sorted(starts.keys() | ends.keys()):
+        lo, hi = 0, len(status)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if y_at(status[mid], px, py) < py:
+                lo = mid + 1
+            else:
+                hi = mid
+        j = lo
+        while j < len(status) and y_at(status[j], px, py) == py:
+            if keys[status[j]][1] == (px, py):
+                live[status[j]] = 0
+                del status[j]
+            else:
+                j += 1
+        # fragments out of order by rounding are removed explicitly
+        for f in ends.get((px, py), ()):
+            if live[f]:
+                position = status.index(f)
+                del status[position]
+                lo -= position < lo
+                live[f] = 0
+
+        new = sorted(starts.get((px, py), ()), key=slope)
+        previous = status[lo - 1] if lo else -1
+        for f in new:
+            s, c = above[previous] if previous >= 0 else (False, False)
+            inside = keep(s, c)
+            in_a, in_b = fragments[keys[f]]
+            s, c = s ^ (in_a % 2 == 1), c ^ (in_b % 2 == 1)
+            above[f] = (s, c)
+            if keep(s, c) != inside:
+                boundary[f] = 1
+                # the result on the left, counter clock-wise around it
+                forward[f] = not inside
+            if previous >= 0:
+                below_boundary[f] = (
+                    previous if boundary[previous] else below_boundary[previous]
+                )
+            order[f] = inserted
+            inserted += 1
+            live[f] = 1
+            previous = f
+        status[lo:lo] = new
+
+    # link the boundary into rings, turning as far left as possible
+    # where rings touch at a vertex so they stay apart
+    outgoing: dict[_Point, list[tuple[_Point, int]]] = {}
+    for f in range(count):
+        if boundary[f]:
+            p, q = keys[f] if forward[f] else keys[f][::-1]
+            outgoing.setdefault(p, []).append((q, f))
+
+    rings: list[Polygon] = []
+    ring_of = [-1] * count
+    first: list[int] = []
+    for start in sorted(outgoing):
+        while start in outgoing:
+            loop = [start]
+            used = []
+            point = start
+            bx = by = 0.0
+            lowest = -1
+            while True:
+                choices = outgoing.get(point)
+                if choices is None:
+                    raise ValueError(f"Boundary of the result is open at {point}")
+                if len(choices) > 1:
+                    # by the counter clock-wise angle from the way back
+                    choices.sort(
+                        key=lambda e: math.atan2(
+                            bx * (e[0][1] - point[1]) - by * (e[0][0] - point[0]),
+                            bx * (e[0][0] - point[0]) + by * (e[0][1] - point[1]),
+                        )
+                        % (2 * math.pi)
+                    )
+                end, f = choices.pop()
+                if not choices:
+                    del outgoing[point]
+                used.append(f)
+                if lowest < 0 or order[f] < order[lowest]:
+                    lowest = f
+                bx, by = point[0] - end[0], point[1] - end[1]
+                point = end
+                if point == start:
+                    break
+                loop.append(point)
+
+            corners = _corners(loop)
+            if len(corners) < 3:
+                continue
+            for f in used:
+                ring_of[f] = len(rings)
+            rings.append(
+                Polygon.from_arrays([x for x, _ in corners], [y for _, y in corners])
+            )
+            first.append(lowest)
+
+    # each hole belongs to the polygon bounding the region just below it
+    parent = list(range(len(rings)))
+    polygons: dict[int, list[Polygon]] = {}
+    for r in sorted(range(len(rings)), key=lambda r: order[first[r]]):
+        if rings[r].orientation == Winding.CCW:
+            polygons[r] = [rings[r]]
+            continue
+        f = below_boundary[first[r]]
+        while f >= 0 and ring_of[f] < 0:
+            f = below_boundary[f]
+        if f >= 0:
+            parent[r] = parent[ring_of[f]]
+        if parent[r] not in polygons:
+            raise ValueError(f"No outer ring found around the hole {rings[r]!r}")
+        polygons[parent[r]].append(rings[r])
+    return list(polygons.values())
+
+
+def _corners(loop: list[_Point]) -> list[_Point]:
+    """Returns the vertices of loop that aren't in the middle of a
+    straight run."""
+    n = len(loop)
+    corners = []
+    for i in range(n):
+        (ax, ay), (bx, by), (cx, cy) = loop[i - 1], loop[i], loop[(i + 1) % n]
+        # the same test as Point.ccw on raw coordinates
+        if (bx - ax) * (cy - ay) - (cx - ax) * (by - ay) != 0:
+            corners.append(loop[i])
+    return corners
+
+
+def union(a: Any, b: Any) -> list[list[Polygon]]:
+    """Returns the region inside a or b, or both.
+
+    The edges of both shapes are cut where they touch or cross with a
+    Bentley-Ottmann sweep, then a second sweep over the pieces finds
+    which side of each is inside each shape from the piece below it
+    (Martinez-Rueda), keeping the pieces bounding the result. This runs
+    in O((n + k) log n) for n edges crossing k times. Points closer
+    together than the tolerance of segment_intersections are merged.
+
+    >>> a = Polygon([Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)])
+    >>> b = Polygon([Point(1, 1), Point(3, 1), Point(3, 3), Point(1, 3)])
+    >>> [[ring.area for ring in polygon] for polygon in union(a, b)]
+    [[7.0]]
+
+    :param a: Polygon, sequence of points or nested lists of them
+    :param b: Polygon, sequence of points or nested lists of them
+    :return: list of polygons, each a list of Polygon rings
+    """
+    return _boolean(a, b, lambda s, c: s or c)
+
+
+def intersection(a: Any, b: Any) -> list[list[Polygon]]:
+    """Returns the region inside both a and b.
+
+    See union() for how shapes are combined.
+
+    :param a: Polygon, sequence of points or nested lists of them
+    :param b: Polygon, sequence of points or nested lists of them
+    :return: list of polygons, each a list of Polygon rings
+    """
+    return _boolean(a, b, lambda s, c: s and c)
+
+
+def difference(a: Any, b: Any) -> list[list[Polygon]]:
+    """Returns the region inside a but not b.
+
+    See union() for how shapes are combined.
+
+    :param a: Polygon, sequence of points or nested lists of them
+    :param b: Polygon, sequence of points or nested lists of them
+    :return: list of polygons, each a list of Polygon rings
+    """
+    return _boolean(a, b, lambda s, c: s and not c)
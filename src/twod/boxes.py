@@ -0,0 +1,133 @@
+"""batched bounding box operations for humans™"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from ._coords import extents
+
+
+def _overlaps(
+    a: tuple[list[float], ...],
+    b: tuple[list[float], ...] | None = None,
+) -> Iterator[tuple[int, int, float]]:
+    """Yields (i, j, area) for every pair of boxes i from a and j from b
+    whose intersection has a positive area, or every pair i < j within
+    a if b is None.
+
+    Boxes are swept left to right. Each box is only compared with the
+    boxes of the other set whose x extents it overlaps, which are
+    retired from the sweep once it has passed their right edges.
+    """
+    sides = (a,) if b is None else (a, b)
+    events = sorted(
+        (x0, s, i) for s, side in enumerate(sides) for i, x0 in enumerate(side[0])
+    )
+    active: list[dict[int, None]] = [{} for _ in sides]
+    expiry: list[list[tuple[float, int]]] = [[] for _ in sides]
+
+    for x, s, i in events:
+        for heap, boxes in zip(expiry, active):
+            while heap and heap[0][0] <= x:
+                del boxes[heapq.heappop(heap)[1]]
+
+        _, iy0, ix1, iy1 = (values[i] for values in sides[s])
+        o = len(sides) - 1 - s
+        _, oy0, ox1, oy1 = sides[o]
+        for j in active[o]:
+            h = min(iy1, oy1[j]) - max(iy0, oy0[j])
+            if h > 0:
+                w = min(ix1, ox1[j]) - x
+                if w > 0:
+                    if b is None:
+                        yield (j, i, w * h) if j < i else (i, j, w * h)
+                    elif s == 0:
+                        yield (i, j, w * h)
+                    else:
+                        yield (j, i, w * h)
+
+        if ix1 > x:
+            active[s][i] = None
+            heapq.heappush(expiry[s], (ix1, i))
+
+
+def _areas(boxes: tuple[list[float], ...]) -> list[float]:
+    x0s, y0s, x1s, y1s = boxes
+    return [(x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in zip(x0s, y0s, x1s, y1s)]
+
+
+def iou_matrix(rects_a: Iterable[Any], rects_b: Iterable[Any]) -> list[array]:
+    """Returns the intersection over union of every rect in rects_a with
+    every rect in rects_b.
+
+    Only pairs that overlap are measured, found with a sweep along x, so
+    the cost grows with the number of overlapping pairs rather than
+    with the size of the matrix. Every other entry is 0.0.
+
+    Rects may be Rects, CRects, (x, y, w, h) tuples or a packed buffer
+    of (x, y, w, h) values.
+
+    >>> iou_matrix([Rect(0, 0, 2, 2)], [Rect(1, 0, 2, 2), Rect(5, 5, 1, 1)])
+    [array('d', [0.3333333333333333, 0.0])]
+
+    :param rects_a: Iterable of rects or a packed buffer
+    :param rects_b: Iterable of rects or a packed buffer
+    :return: list of array('d'), one row per rect in rects_a
+    """
+    a, b = extents(rects_a), extents(rects_b)
+    area_a, area_b = _areas(a), _areas(b)
+    zeros = bytes(8 * len(area_b))
+    matrix = [array("d", zeros) for _ in area_a]
+    for i, j, overlap in _overlaps(a, b):
+        matrix[i][j] = overlap / (area_a[i] + area_b[j] - overlap)
+    return matrix
+
+
+def nms(rects: Iterable[Any], scores: Iterable[float], threshold: float) -> list[int]:
+    """Returns the indices of the rects kept by greedy non-maximum
+    suppression, highest scoring first.
+
+    Rects are visited from the highest score to the lowest, and each
+    one not yet suppressed is kept and suppresses every lower scoring
+    rect whose intersection over union with it is greater than
+    threshold. Overlapping pairs are found once with a sweep along x.
+
+    Raises ValueError if there isn't one score per rect.
+
+    >>> rects = [Rect(0, 0, 2, 2), Rect(0, 0, 2, 2.2), Rect(5, 5, 1, 1)]
+    >>> nms(rects, [0.8, 0.9, 0.5], 0.5)
+    [1, 2]
+
+    :param rects: Iterable of rects or a packed buffer
+    :param scores: Iterable of float
+    :param float threshold: largest intersection over union allowed
+    :return: list of indices into rects
+    """
+    boxes = extents(rects)
+    scores = list(scores)
+    if len(scores) != len(boxes[0]):
+        raise ValueError(
+            "Expected one score per rect, "
+            f"got {len(scores)} scores for {len(boxes[0])} rects"
+        )
+
+    areas = _areas(boxes)
+    neighbours: list[list[int]] = [[] for _ in areas]
+    for i, j, overlap in _overlaps(boxes):
+        if overlap / (areas[i] + areas[j] - overlap) > threshold:
+            neighbours[i].append(j)
+            neighbours[j].append(i)
+
+    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+    suppressed = bytearray(len(scores))
+    kept = []
+    for i in order:
+        if suppressed[i]:
+            continue
+        kept.append(i)
+        for j in neighbours[i]:
+            suppressed[j] = 1
+    return kept
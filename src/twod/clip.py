@@ -0,0 +1,178 @@
+"""clipping for humans™"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from numbers import Real
+from typing import Any
+
+from ._coords import bounds as rect_bounds
+from ._coords import columns, segments
+from .polygon import Polygon
+from .rect import _liang_barsky
+
+# outcode bits, one per side of the rectangle a point is beyond
+_LEFT = 1
+_RIGHT = 2
+_BOTTOM = 4
+_TOP = 8
+
+
+def clip_lines(
+    lines: Iterable[Any],
+    rect: Any,
+) -> tuple[array, array, array, array, bytearray]:
+    """Returns lines clipped to rect.
+
+    Each endpoint is classified by an outcode recording which sides of
+    rect it lies beyond (Cohen-Sutherland). Segments with both endpoints
+    inside are kept as they are and segments with both endpoints beyond
+    the same side are dropped, with only comparisons. The rest are
+    clipped with Liang-Barsky on their raw coordinates. No Points or
+    Lines are allocated.
+
+    The result is (x0, y0, x1, y1, keep): the clipped endpoints in four
+    arrays of doubles in the same order as lines, and a mask that is 1
+    for segments with any part inside rect. The endpoints of dropped
+    segments are left as they were. Segments touching the edges of rect
+    are kept.
+
+    >>> x0, y0, x1, y1, keep = clip_lines(
+    ...     [Line(Point(-1, 1), Point(3, 1)), Line(Point(5, 5), Point(6, 6))],
+    ...     Rect(0, 0, 2, 2),
+    ... )
+    >>> list(x0), list(x1), list(keep)
+    ([0.0, 5.0], [2.0, 6.0], [1, 0])
+
+    :param lines: Iterable of Line, (start, end) pairs or a packed buffer
+    :param rect: Rect, CRect or (x, y, w, h)
+    :return: (x0, y0, x1, y1, keep)
+    """
+    box = rect_bounds(rect)
+    bx0, by0, bx1, by1 = box
+    xs0, ys0, xs1, ys1 = (array("d", values) for values in segments(lines))
+    keep = bytearray(len(xs0))
+
+    for i in range(len(xs0)):
+        x0, y0, x1, y1 = xs0[i], ys0[i], xs1[i], ys1[i]
+        c0 = (_LEFT if x0 < bx0 else _RIGHT if x0 > bx1 else 0) | (
+            _BOTTOM if y0 < by0 else _TOP if y0 > by1 else 0
+        )
+        c1 = (_LEFT if x1 < bx0 else _RIGHT if x1 > bx1 else 0) | (
+            _BOTTOM if y1 < by0 else _TOP if y1 > by1 else 0
+        )
+        if not c0 | c1:
+            keep[i] = 1
+        elif not c0 & c1:
+            clipped = _liang_barsky(x0, y0, x1, y1, box)
+            if clipped is not None:
+                xs0[i], ys0[i], xs1[i], ys1[i] = clipped
+                keep[i] = 1
+    return (xs0, ys0, xs1, ys1, keep)
+
+
+def _halfplane(
+    xs: list[float],
+    ys: list[float],
+    nx: float,
+    ny: float,
+    c: float,
+) -> tuple[list[float], list[float]]:
+    """Returns the part of the polygon (xs, ys) where nx * x + ny * y <= c,
+    streaming its vertices through one Sutherland-Hodgman stage."""
+    cx: list[float] = []
+    cy: list[float] = []
+    if not xs:
+        return (cx, cy)
+    px, py = xs[-1], ys[-1]
+    pd = nx * px + ny * py - c
+    for qx, qy in zip(xs, ys):
+        qd = nx * qx + ny * qy - c
+        if (pd <= 0) != (qd <= 0):
+            t = pd / (pd - qd)
+            cx.append(px + (qx - px) * t)
+            cy.append(py + (qy - py) * t)
+        if qd <= 0:
+            cx.append(qx)
+            cy.append(qy)
+        px, py, pd = qx, qy, qd
+    return (cx, cy)
+
+
+def _box(
+    xs: list[float],
+    ys: list[float],
+    box: tuple[float, float, float, float],
+) -> tuple[list[float], list[float]]:
+    """Returns the part of the polygon (xs, ys) inside box."""
+    x0, y0, x1, y1 = box
+    xs, ys = _halfplane(xs, ys, -1.0, 0.0, -x0)
+    xs, ys = _halfplane(xs, ys, 1.0, 0.0, x1)
+    xs, ys = _halfplane(xs, ys, 0.0, -1.0, -y0)
+    return _halfplane(xs, ys, 0.0, 1.0, y1)
+
+
+def _is_rect(clip: Any) -> bool:
+    if hasattr(clip, "w") and hasattr(clip, "h"):
+        return True
+    try:
+        return len(clip) == 4 and all(isinstance(v, Real) for v in clip)
+    except TypeError:
+        return False
+
+
+def clip_polygon(polygon: Any, clip: Any) -> Polygon:
+    """Returns the part of polygon inside clip.
+
+    Clip is either a rectangle or a convex polygon wound either way.
+    The vertices of polygon are streamed through one Sutherland-Hodgman
+    stage per side of clip, computing which side of it each vertex is on
+    from raw coordinates, so no Lines or Points are built. Polygons
+    wholly inside or wholly outside a rectangle are decided from their
+    bounds alone.
+
+    Polygon may be concave. Where clipping cuts it into several pieces,
+    they are returned as one polygon joined by edges running along the
+    sides of clip.
+
+    >>> square = Polygon([Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)])
+    >>> clip_polygon(square, Rect(2, 2, 4, 4)).area
+    4.0
+
+    :param polygon: Polygon, iterable of points or a packed buffer
+    :param clip: Rect, CRect, (x, y, w, h) or a convex polygon
+    :return: Polygon
+    """
+    xs, ys = (
+        (polygon.x, polygon.y) if isinstance(polygon, Polygon) else columns(polygon)
+    )
+    if not len(xs):
+        return Polygon()
+
+    if _is_rect(clip):
+        box = rect_bounds(clip)
+        bx0, by0, bx1, by1 = box
+        x0, x1, y0, y1 = min(xs), max(xs), min(ys), max(ys)
+        if bx0 <= x0 and x1 <= bx1 and by0 <= y0 and y1 <= by1:
+            return Polygon.from_arrays(xs, ys)
+        if x1 < bx0 or bx1 < x0 or y1 < by0 or by1 < y0:
+            return Polygon()
+        return Polygon.from_arrays(*_box(list(xs), list(ys), box))
+
+    if not isinstance(clip, Polygon):
+        clip = Polygon(clip)
+    cxs, cys = clip.x, clip.y
+    if clip.signed_area < 0:
+        cxs, cys = cxs[::-1], cys[::-1]
+
+    xs, ys = list(xs), list(ys)
+    ax, ay = cxs[-1], cys[-1]
+    for bx, by in zip(cxs, cys):
+        # keep the left of each counter clock-wise edge, as Point.ccw
+        nx, ny = by - ay, ax - bx
+        xs, ys = _halfplane(xs, ys, nx, ny, nx * ax + ny * ay)
+        if not xs:
+            break
+        ax, ay = bx, by
+    return Polygon.from_arrays(xs, ys)
@@ -5,11 +5,14 @@ from __future__ import annotations
 import cmath
 import math
 import operator
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 from .constants import Quadrant
 from .exceptions import ColinearPoints
 
+# the first value of an empty iterable in from_any_many
+_MISSING = object()
+
 
 class CPoint:
     __slots__ = ("_z",)
@@ -45,6 +48,84 @@ class CPoint:
 
         raise TypeError(f"unable to convert {value!r} to {cls}")
 
+    @classmethod
+    def from_any_many(
+        cls,
+        values: Iterable[Any],
+        scalar_ok: bool = True,
+        is_polar: bool = False,
+    ) -> list[CPoint]:
+        """Returns a list of CPoints converted from values as if by
+        from_any.
+
+        The conversion is chosen once from the type of the first value
+        and applied to every value of exactly that type, values of any
+        other type fall back to from_any. Arrays with a tolist method
+        (NumPy, array.array) are unpacked to Python values first.
+        """
+
+        if hasattr(values, "tolist"):
+            values = values.tolist()
+
+        values = iter(values)
+        first = next(values, _MISSING)
+        if first is _MISSING:
+            return []
+
+        kind = type(first)
+        convert = cls._converter(kind, scalar_ok, is_polar)
+
+        def slow(value: Any) -> CPoint:
+            return cls.from_any(value, scalar_ok=scalar_ok, is_polar=is_polar)
+
+        result = [convert(first)]
+        result.extend(
+            convert(value) if type(value) is kind else slow(value) for value in values
+        )
+        return result
+
+    @classmethod
+    def _converter(
+        cls,
+        kind: type,
+        scalar_ok: bool,
+        is_polar: bool,
+    ) -> Callable[[Any], CPoint]:
+        """Returns a function converting values of type kind to CPoints,
+        matching the cases of from_any."""
+
+        def wrap(z: complex) -> CPoint:
+            point = cls.__new__(cls)
+            point._z = z
+            return point
+
+        def fail(value: Any) -> CPoint:
+            raise TypeError(f"unable to convert {value!r} to {cls}")
+
+        if issubclass(kind, cls):
+            return lambda value: value
+
+        if issubclass(kind, complex):
+            return lambda value: wrap(complex(value.real, value.imag))
+
+        if issubclass(kind, dict):
+            return lambda value: wrap(complex(value["x"], value["y"]))
+
+        if issubclass(kind, (list, tuple)):
+            if is_polar:
+                return lambda value: cls.from_polar(value[0], value[1])
+            return lambda value: wrap(complex(value[0], value[1]))
+
+        if issubclass(kind, (float, int)):
+            if not scalar_ok:
+                return fail
+            return lambda value: wrap(complex(value, value))
+
+        if issubclass(kind, str):
+            return lambda value: cls.from_any(value)
+
+        return fail
+
     @classmethod
     def from_complex(cls, z: complex) -> CPoint:
         return cls(z.real, z.imag)
@@ -256,6 +337,25 @@ class CPoint:
     def is_colinear(self, b: Any, c: Any) -> bool:
         return self.ccw(b, c) == 0
 
+    def incircle(self, b: Any, c: Any, d: Any) -> float:
+        """Returns a float indicating where d lies with respect to the
+        circle through the points [self, b, c].
+
+        If [self, b, c] winds counter clock-wise, the result is > 0 when
+        d is inside the circle, < 0 when it is outside and 0 when it is
+        on the circle. The signs are reversed for clock-wise winding.
+        """
+        d = self.__class__.from_any(d)
+        a = self - d
+        b = self.__class__.from_any(b) - d
+        c = self.__class__.from_any(c) - d
+
+        return (
+            (a.x * a.x + a.y * a.y) * b.cross(c)
+            - (b.x * b.x + b.y * b.y) * a.cross(c)
+            + (c.x * c.x + c.y * c.y) * a.cross(b)
+        )
+
     def midpoint(self, other: Any = None) -> CPoint:
         other = self.__class__.from_any(other)
         return (self + other) / 2
@@ -0,0 +1,185 @@
+"""a complex-backed collection of points for humans™"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from . import backend
+from .cpoint import CPoint
+
+
+class CPointArray:
+    """A sequence of two dimensional points stored as one contiguous
+    buffer of complex values.
+
+    With the NumPy twod.backend the buffer is a complex128 ndarray,
+    otherwise it is an array of doubles holding interleaved real and
+    imaginary parts (the same memory layout as complex128).
+
+    Batch operations like rotate and scale compute their complex factor
+    once and apply it to the whole buffer.
+
+    >>> ca = CPointArray([1, 1j])
+    >>> ca.scale(2)[1]
+    CPoint(x=0.0, y=2.0)
+    """
+
+    __slots__ = ("_k", "_z")
+
+    def __init__(self, values: Iterable[complex | float | int] = ()) -> None:
+        self._k = backend.kernels()
+        self._z = self._k.complexes(complex(v) for v in values)
+
+    @classmethod
+    def from_points(cls, points: Iterable[Any]) -> CPointArray:
+        """Returns a CPointArray holding points, each of which may be any
+        value accepted by CPoint.from_any.
+
+        :param points: Iterable[Any]
+        :return: CPointArray
+        """
+        return cls(CPoint.from_any(p, scalar_ok=False)._z for p in points)
+
+    @classmethod
+    def from_polar(
+        cls,
+        radii: Iterable[float | int],
+        thetas: Iterable[float | int],
+        is_radians: bool = True,
+        translate: Any = None,
+    ) -> CPointArray:
+        """Returns a CPointArray with polar coordinates (R, ϴ) taken
+        pairwise from radii and thetas.
+
+        :param radii: Iterable[float | int]
+        :param thetas: Iterable[float | int]
+        :param bool is_radians:
+        :param translate: optional offset accepted by CPoint.from_any
+        :return: CPointArray
+        """
+        result = cls()
+
+        if not is_radians:
+            thetas = map(math.radians, thetas)
+
+        result._z = result._k.complex_polar(radii, thetas)
+
+        if translate is not None:
+            result.translate(translate)
+        return result
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._k.complex_tolist(self._z)!r})"
+
+    def __len__(self) -> int:
+        return self._k.complex_len(self._z)
+
+    def __iter__(self) -> Iterator[CPoint]:
+        """An iterator over copies of each point."""
+        return map(CPoint.from_complex, self._k.complex_tolist(self._z))
+
+    def __getitem__(self, key: int) -> CPoint:
+        """Returns a CPoint copy of the point at key."""
+        if not isinstance(key, int):
+            raise TypeError(f"Expected int key, not {key!r}")
+        return CPoint.from_complex(self._k.complex_get(self._z, key))
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        if not isinstance(key, int):
+            raise TypeError(f"Expected int key, not {key!r}")
+        z = CPoint.from_any(value, scalar_ok=False)._z
+        self._k.complex_set(self._z, key, z)
+
+    def __eq__(self, other: object) -> bool:
+
+        if isinstance(other, (CPointArray, list, tuple)):
+            return len(self) == len(other) and all(p == q for p, q in zip(self, other))
+
+        return NotImplemented
+
+    @property
+    def x(self) -> Any:
+        """The real parts (x coordinates) of the buffer."""
+        return self._k.complex_real(self._z)
+
+    @property
+    def y(self) -> Any:
+        """The imaginary parts (y coordinates) of the buffer."""
+        return self._k.complex_imag(self._z)
+
+    @property
+    def radius(self) -> Any:
+        """The distance from each point to the origin."""
+        return self._k.complex_abs(self._z)
+
+    @property
+    def radians(self) -> Any:
+        """The angle of each point in radians measured counter-clockwise
+        from 3 o'clock."""
+        return self._k.complex_angle(self._z)
+
+    @property
+    def degrees(self) -> Any:
+        """The angle of each point in degrees measured counter-clockwise
+        from 3 o'clock."""
+        return self._k.degrees(self.radians)
+
+    @property
+    def polar(self) -> tuple[Any, Any]:
+        """A tuple of radii and angles in radians for every point."""
+        return (self.radius, self.radians)
+
+    def _affine(self, mul: complex, add: complex, inplace: bool) -> CPointArray:
+        """Computes z * mul + add for every point z."""
+        z = self._k.complex_affine(self._z, mul, add, inplace)
+        if inplace:
+            return self
+        result = self.__class__.__new__(self.__class__)
+        result._k = self._k
+        result._z = z
+        return result
+
+    def translate(self, offset: Any) -> CPointArray:
+        """Adds offset to every point in place.
+
+        :param offset: any value accepted by CPoint.from_any
+        :return: CPointArray
+        """
+        return self._affine(1, CPoint.from_any(offset)._z, inplace=True)
+
+    def rotate(
+        self,
+        theta: float,
+        origin: Any = None,
+        is_degrees: bool = False,
+        inplace: bool = True,
+    ) -> CPointArray:
+        """Rotates every point by theta about origin.
+
+        The rotor is computed once: z' = z * rotor + origin * (1 - rotor).
+
+        :param theta: angle, radians unless is_degrees is True
+        :param origin: center of rotation, defaults to the origin
+        :param bool is_degrees:
+        :param bool inplace: if False, a rotated copy is returned
+        :return: CPointArray
+        """
+        if is_degrees:
+            theta = math.radians(theta)
+
+        rotor = complex(math.cos(theta), math.sin(theta))
+        offset = 0j
+        if origin is not None:
+            offset = CPoint.from_any(origin)._z * (1 - rotor)
+
+        return self._affine(rotor, offset, inplace=inplace)
+
+    def scale(self, scale: float) -> CPointArray:
+        """Scales every point by scale in place.
+
+        :param float scale:
+        :return: CPointArray
+        """
+        return self._affine(scale, 0j, inplace=True)
@@ -0,0 +1,19 @@
+"""spatial indices for humans™"""
+
+from .aabbtree import AABBTree
+from .grid import GridIndex
+from .kdtree import KDTree
+from .locator import PolygonLocator
+from .quadtree import QuadTree
+from .rtree import RTree
+from .sweep import SweepAndPrune
+
+__all__ = [
+    "AABBTree",
+    "GridIndex",
+    "KDTree",
+    "PolygonLocator",
+    "QuadTree",
+    "RTree",
+    "SweepAndPrune",
+]
@@ -0,0 +1,450 @@
+"""a dynamic bounding volume tree for humans™"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+from .._coords import bounds as rect_bounds
+from .._coords import xy
+
+_NULL = -1
+
+
+class AABBTree:
+    """A dynamic axis-aligned bounding box tree for moving rectangles,
+    in the style of the Box2D broad-phase.
+
+    Each leaf stores a "fat" box: the rectangle grown by margin on every
+    side and stretched along its predicted displacement. update() only
+    touches the tree when a rectangle leaves its fat box, so objects that
+    jitter in place cost a containment check per frame. Inserts and
+    removals rebalance the tree with rotations so its height stays
+    logarithmic.
+
+    Node boxes, heights and links are kept in parallel arrays indexed by
+    node id, and leaves also keep the tight bounds last given for them so
+    queries report real overlaps rather than fat ones.
+
+    >>> tree = AABBTree()
+    >>> a = tree.insert(CRect(0, 0, 2, 2), item="a")
+    >>> b = tree.insert(CRect(1, 1, 2, 2), item="b")
+    >>> tree.query_pairs()
+    [('a', 'b')]
+    """
+
+    def __init__(
+        self,
+        margin: float = 0.1,
+        displacement_multiplier: float = 4.0,
+    ) -> None:
+        self.margin = margin
+        self.displacement_multiplier = displacement_multiplier
+        self._root = _NULL
+
+        # fat boxes, links and heights for every node
+        self._x0 = array("d")
+        self._y0 = array("d")
+        self._x1 = array("d")
+        self._y1 = array("d")
+        self._parent = array("i")
+        self._child1 = array("i")
+        self._child2 = array("i")
+        self._height = array("i")
+
+        # tight boxes and items for leaves
+        self._tx0 = array("d")
+        self._ty0 = array("d")
+        self._tx1 = array("d")
+        self._ty1 = array("d")
+        self._items: list[Any] = []
+
+        self._free: list[int] = []
+        self._count = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(margin={self.margin})"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        for leaf in self._leaves():
+            yield self._items[leaf]
+
+    @property
+    def height(self) -> int:
+        """The height of the tree, zero for a single leaf."""
+        return 0 if self._root == _NULL else self._height[self._root]
+
+    def _leaves(self) -> Iterator[int]:
+        if self._root == _NULL:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if self._child1[node] == _NULL:
+                yield node
+            else:
+                stack.append(self._child1[node])
+                stack.append(self._child2[node])
+
+    def _allocate(self) -> int:
+        if self._free:
+            node = self._free.pop()
+            self._parent[node] = _NULL
+            self._child1[node] = _NULL
+            self._child2[node] = _NULL
+            self._height[node] = 0
+            self._items[node] = None
+            return node
+        for buffer in (self._x0, self._y0, self._x1, self._y1):
+            buffer.append(0.0)
+        for buffer in (self._tx0, self._ty0, self._tx1, self._ty1):
+            buffer.append(0.0)
+        for links in (self._parent, self._child1, self._child2):
+            links.append(_NULL)
+        self._height.append(0)
+        self._items.append(None)
+        return len(self._items) - 1
+
+    def _release(self, node: int) -> None:
+        self._height[node] = -1
+        self._items[node] = None
+        self._free.append(node)
+
+    def _is_leaf_handle(self, handle: int) -> bool:
+        return (
+            0 <= handle < len(self._items)
+            and self._height[handle] == 0
+            and self._child1[handle] == _NULL
+        )
+
+    def _fatten(
+        self,
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
+        dx: float,
+        dy: float,
+    ) -> tuple[float, float, float, float]:
+        m = self.margin
+        x0, y0, x1, y1 = x0 - m, y0 - m, x1 + m, y1 + m
+        dx *= self.displacement_multiplier
+        dy *= self.displacement_multiplier
+        if dx < 0:
+            x0 += dx
+        else:
+            x1 += dx
+        if dy < 0:
+            y0 += dy
+        else:
+            y1 += dy
+        return (x0, y0, x1, y1)
+
+    def insert(self, rect: Any, item: Any = None) -> int:
+        """Adds rect to the tree and returns a handle for update() and
+        remove().
+
+        :param rect: Rect, CRect or (x, y, w, h)
+        :param item: optional item reported instead of rect
+        :return: int handle
+        """
+        x0, y0, x1, y1 = rect_bounds(rect)
+        leaf = self._allocate()
+        self._tx0[leaf], self._ty0[leaf] = x0, y0
+        self._tx1[leaf], self._ty1[leaf] = x1, y1
+        fat = self._fatten(x0, y0, x1, y1, 0.0, 0.0)
+        self._x0[leaf], self._y0[leaf], self._x1[leaf], self._y1[leaf] = fat
+        self._items[leaf] = rect if item is None else item
+        self._insert_leaf(leaf)
+        self._count += 1
+        return leaf
+
+    def remove(self, handle: int) -> Any:
+        """Removes the rect with handle and returns its item.
+
+        Raises KeyError if handle is not in the tree.
+
+        :param int handle: as returned by insert()
+        :return: the item stored with the rect
+        """
+        if not self._is_leaf_handle(handle):
+            raise KeyError(handle)
+        item = self._items[handle]
+        self._remove_leaf(handle)
+        self._release(handle)
+        self._count -= 1
+        return item
+
+    def update(self, handle: int, new_rect: Any, displacement: Any = None) -> bool:
+        """Records that the rect with handle now has the bounds of
+        new_rect, typically right after moving it in place with +=.
+
+        If new_rect still fits in the leaf's fat box, only the tight
+        bounds are updated. Otherwise the leaf is reinserted with a new
+        fat box, stretched along displacement (the motion per frame).
+
+        Raises KeyError if handle is not in the tree.
+
+        :param int handle: as returned by insert()
+        :param new_rect: Rect, CRect or (x, y, w, h)
+        :param displacement: optional Point, CPoint or (dx, dy)
+        :return: True if the leaf was reinserted
+        """
+        if not self._is_leaf_handle(handle):
+            raise KeyError(handle)
+
+        x0, y0, x1, y1 = rect_bounds(new_rect)
+        self._tx0[handle], self._ty0[handle] = x0, y0
+        self._tx1[handle], self._ty1[handle] = x1, y1
+
+        dx, dy = (0.0, 0.0) if displacement is None else xy(displacement)
+        fat = self._fatten(x0, y0, x1, y1, dx, dy)
+
+        fx0, fy0 = self._x0[handle], self._y0[handle]
+        fx1, fy1 = self._x1[handle], self._y1[handle]
+        if fx0 <= x0 and fy0 <= y0 and x1 <= fx1 and y1 <= fy1:
+            # still inside, unless the old fat box is now far too large
+            huge = 4 * self.margin
+            if not (
+                fx0 < fat[0] - huge
+                and fy0 < fat[1] - huge
+                and fat[2] + huge < fx1
+                and fat[3] + huge < fy1
+            ):
+                return False
+
+        self._remove_leaf(handle)
+        self._x0[handle], self._y0[handle], self._x1[handle], self._y1[handle] = fat
+        self._insert_leaf(handle)
+        return True
+
+    def _refit(self, node: int) -> None:
+        c1, c2 = self._child1[node], self._child2[node]
+        self._x0[node] = min(self._x0[c1], self._x0[c2])
+        self._y0[node] = min(self._y0[c1], self._y0[c2])
+        self._x1[node] = max(self._x1[c1], self._x1[c2])
+        self._y1[node] = max(self._y1[c1], self._y1[c2])
+        self._height[node] = 1 + max(self._height[c1], self._height[c2])
+
+    def _walk_up(self, node: int) -> None:
+        """Rebalances and refits node and its ancestors."""
+        while node != _NULL:
+            node = self._balance(node)
+            self._refit(node)
+            node = self._parent[node]
+
+    def _insert_leaf(self, leaf: int) -> None:
+        if self._root == _NULL:
+            self._root = leaf
+            self._parent[leaf] = _NULL
+            return
+
+        x0, y0, x1, y1 = self._x0, self._y0, self._x1, self._y1
+        lx0, ly0, lx1, ly1 = x0[leaf], y0[leaf], x1[leaf], y1[leaf]
+
+        def perimeter_with(node: int) -> float:
+            return (
+                max(x1[node], lx1)
+                - min(x0[node], lx0)
+                + max(y1[node], ly1)
+                - min(y0[node], ly0)
+            ) * 2
+
+        def descend_cost(child: int, inheritance: float) -> float:
+            cost = perimeter_with(child) + inheritance
+            if self._child1[child] != _NULL:
+                cost -= 2 * (x1[child] - x0[child] + y1[child] - y0[child])
+            return cost
+
+        # find the best sibling using the perimeter cost heuristic
+        index = self._root
+        while self._child1[index] != _NULL:
+            area = 2 * (x1[index] - x0[index] + y1[index] - y0[index])
+            combined = perimeter_with(index)
+            cost = 2 * combined
+            inheritance = 2 * (combined - area)
+
+            c1, c2 = self._child1[index], self._child2[index]
+            cost1 = descend_cost(c1, inheritance)
+            cost2 = descend_cost(c2, inheritance)
+            if cost < cost1 and cost < cost2:
+                break
+            index = c1 if cost1 < cost2 else c2
+
+        sibling = index
+        old_parent = self._parent[sibling]
+        new_parent = self._allocate()
+        self._parent[new_parent] = old_parent
+        self._child1[new_parent] = sibling
+        self._child2[new_parent] = leaf
+        self._parent[sibling] = new_parent
+        self._parent[leaf] = new_parent
+
+        if old_parent == _NULL:
+            self._root = new_parent
+        elif self._child1[old_parent] == sibling:
+            self._child1[old_parent] = new_parent
+        else:
+            self._child2[old_parent] = new_parent
+
+        self._walk_up(new_parent)
+
+    def _remove_leaf(self, leaf: int) -> None:
+        if leaf == self._root:
+            self._root = _NULL
+            return
+
+        parent = self._parent[leaf]
+        grandparent = self._parent[parent]
+        if self._child1[parent] == leaf:
+            sibling = self._child2[parent]
+        else:
+            sibling = self._child1[parent]
+
+        self._release(parent)
+        self._parent[leaf] = _NULL
+
+        if grandparent == _NULL:
+            self._root = sibling
+            self._parent[sibling] = _NULL
+            return
+
+        if self._child1[grandparent] == parent:
+            self._child1[grandparent] = sibling
+        else:
+            self._child2[grandparent] = sibling
+        self._parent[sibling] = grandparent
+        self._walk_up(grandparent)
+
+    def _replace_child(self, parent: int, old: int, new: int) -> None:
+        if parent == _NULL:
+            self._root = new
+        elif self._child1[parent] == old:
+            self._child1[parent] = new
+        else:
+            self._child2[parent] = new
+
+    def _union_into(self, node: int, a: int, b: int) -> None:
+        self._x0[node] = min(self._x0[a], self._x0[b])
+        self._y0[node] = min(self._y0[a], self._y0[b])
+        self._x1[node] = max(self._x1[a], self._x1[b])
+        self._y1[node] = max(self._y1[a], self._y1[b])
+        self._height[node] = 1 + max(self._height[a], self._height[b])
+
+    def _balance(self, a: int) -> int:
+        """Performs a left or right rotation if node a is imbalanced and
+        returns the new root of the subtree."""
+
+        if self._child1[a] == _NULL or self._height[a] < 2:
+            return a
+
+        height, parent = self._height, self._parent
+        b, c = self._child1[a], self._child2[a]
+        balance = height[c] - height[b]
+
+        if balance > 1:
+            # rotate c up
+            f, g = self._child1[c], self._child2[c]
+            self._child1[c] = a
+            parent[c] = parent[a]
+            parent[a] = c
+            self._replace_child(parent[c], a, c)
+            if height[f] > height[g]:
+                self._child2[c] = f
+                self._child2[a] = g
+                parent[g] = a
+                self._union_into(a, b, g)
+                self._union_into(c, a, f)
+            else:
+                self._child2[c] = g
+                self._child2[a] = f
+                parent[f] = a
+                self._union_into(a, b, f)
+                self._union_into(c, a, g)
+            return c
+
+        if balance < -1:
+            # rotate b up
+            d, e = self._child1[b], self._child2[b]
+            self._child1[b] = a
+            parent[b] = parent[a]
+            parent[a] = b
+            self._replace_child(parent[b], a, b)
+            if height[d] > height[e]:
+                self._child2[b] = d
+                self._child1[a] = e
+                parent[e] = a
+                self._union_into(a, c, e)
+                self._union_into(b, a, d)
+            else:
+                self._child2[b] = e
+                self._child1[a] = d
+                parent[d] = a
+                self._union_into(a, c, d)
+                self._union_into(b, a, e)
+            return b
+
+        return a
+
+    def _overlapping(
+        self,
+        qx0: float,
+        qy0: float,
+        qx1: float,
+        qy1: float,
+    ) -> Iterator[int]:
+        """Yields leaves whose tight boxes overlap the query box, pruning
+        by fat boxes."""
+        if self._root == _NULL:
+            return
+        x0, y0, x1, y1 = self._x0, self._y0, self._x1, self._y1
+        child1, child2 = self._child1, self._child2
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if x0[node] > qx1 or qx0 > x1[node] or y0[node] > qy1 or qy0 > y1[node]:
+                continue
+            if child1[node] != _NULL:
+                stack.append(child1[node])
+                stack.append(child2[node])
+                continue
+            if (
+                self._tx0[node] <= qx1
+                and qx0 <= self._tx1[node]
+                and self._ty0[node] <= qy1
+                and qy0 <= self._ty1[node]
+            ):
+                yield node
+
+    def query(self, rect: Any) -> list[Any]:
+        """Returns the items whose rects intersect rect, including rects
+        that only share an edge or corner with it.
+
+        :param rect: Rect, CRect or (x, y, w, h)
+        :return: list of items
+        """
+        return [self._items[leaf] for leaf in self._overlapping(*rect_bounds(rect))]
+
+    def query_pairs(self) -> list[tuple[Any, Any]]:
+        """Returns every pair of items whose rects intersect, each pair
+        once, ordered by handle.
+
+        :return: list of (item, item)
+        """
+        pairs = []
+        items = self._items
+        for leaf in sorted(self._leaves()):
+            bounds = (
+                self._tx0[leaf],
+                self._ty0[leaf],
+                self._tx1[leaf],
+                self._ty1[leaf],
+            )
+            for other in sorted(self._overlapping(*bounds)):
+                if other > leaf:
+                    pairs.append((items[leaf], items[other]))
+        return pairs
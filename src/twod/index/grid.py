@@ -0,0 +1,157 @@
+"""a uniform grid spatial hash for humans™"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from typing import Any
+
+from .._coords import bounds, xy
+
+
+class GridIndex:
+    """A spatial hash bucketing points into square cells of a fixed size.
+
+    Points may be Point or CPoint instances (or anything with x/y
+    attributes). Points are tracked by identity, so a point that has been
+    moved must be re-bucketed with move() before it is queried again.
+
+    Queries only visit the cells overlapping the query region and compare
+    squared distances, no square roots are taken.
+
+    >>> grid = GridIndex(10)
+    >>> grid.insert(Point(1, 1))
+    >>> grid.query_radius(Point(0, 0), 2)
+    [Point(x=1, y=1)]
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        if cell_size <= 0:
+            raise ValueError(f"Expected a positive cell_size, got {cell_size!r}")
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[int, Any]] = {}
+        self._keys: dict[int, tuple[int, int]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(cell_size={self.cell_size})"
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[Any]:
+        for cell in self._cells.values():
+            yield from cell.values()
+
+    def __contains__(self, point: Any) -> bool:
+        return id(point) in self._keys
+
+    def _key(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, point: Any) -> None:
+        """Adds point to the index.
+
+        Raises ValueError if point is already indexed.
+
+        :param point: Point or CPoint
+        """
+        ident = id(point)
+        if ident in self._keys:
+            raise ValueError(f"{point!r} is already indexed")
+        key = self._key(*xy(point))
+        self._cells.setdefault(key, {})[ident] = point
+        self._keys[ident] = key
+
+    def remove(self, point: Any) -> None:
+        """Removes point from the index.
+
+        Raises KeyError if point is not indexed.
+
+        :param point: Point or CPoint
+        """
+        key = self._keys.pop(id(point))
+        cell = self._cells[key]
+        del cell[id(point)]
+        if not cell:
+            del self._cells[key]
+
+    def move(self, point: Any, new_xy: Any = None) -> None:
+        """Re-buckets point after its coordinates have changed.
+
+        If new_xy is given, the point's xy is updated first. Points that
+        stay in the same cell cost two dictionary lookups.
+
+        Raises KeyError if point is not indexed.
+
+        :param point: Point or CPoint
+        :param new_xy: optional new (x, y) for point
+        """
+        ident = id(point)
+        old = self._keys[ident]
+        if new_xy is not None:
+            point.xy = new_xy
+        key = self._key(*xy(point))
+        if key == old:
+            return
+        cell = self._cells[old]
+        del cell[ident]
+        if not cell:
+            del self._cells[old]
+        self._cells.setdefault(key, {})[ident] = point
+        self._keys[ident] = key
+
+    def _visit(
+        self,
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
+    ) -> Iterator[dict[int, Any]]:
+        """Yields the occupied cells overlapping [x0, x1] x [y0, y1]."""
+        i0, j0 = self._key(x0, y0)
+        i1, j1 = self._key(x1, y1)
+        cells = self._cells
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(cells):
+            for (i, j), cell in cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    yield cell
+            return
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                occupied = cells.get((i, j))
+                if occupied:
+                    yield occupied
+
+    def query_radius(self, center: Any, radius: float) -> list[Any]:
+        """Returns the indexed points whose distance from center is less
+        than or equal to radius.
+
+        :param center: Point, CPoint or (x, y)
+        :param float radius:
+        :return: list of points
+        """
+        cx, cy = xy(center)
+        r2 = radius * radius
+        found = []
+        for cell in self._visit(cx - radius, cy - radius, cx + radius, cy + radius):
+            for point in cell.values():
+                dx = point.x - cx
+                dy = point.y - cy
+                if dx * dx + dy * dy <= r2:
+                    found.append(point)
+        return found
+
+    def query_rect(self, rect: Any) -> list[Any]:
+        """Returns the indexed points bounded by rect, including points
+        on its edges (see Point.between).
+
+        :param rect: Rect or CRect
+        :return: list of points
+        """
+        x0, y0, x1, y1 = bounds(rect)
+        found = []
+        for cell in self._visit(x0, y0, x1, y1):
+            for point in cell.values():
+                if x0 <= point.x <= x1 and y0 <= point.y <= y1:
+                    found.append(point)
+        return found
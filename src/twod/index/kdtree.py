@@ -0,0 +1,224 @@
+"""a static two-dimensional k-d tree for humans™"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from .._coords import xy
+
+
+class KDTree:
+    """A static k-d tree over a fixed set of points.
+
+    The tree is built once by splitting on the median, alternating x and
+    y, and is stored implicitly: the coordinates are permuted so that the
+    median of every range [lo, hi) sits at (lo + hi) // 2. Besides the two
+    coordinate arrays, only an array mapping tree positions back to the
+    caller's indices is kept, so no per-node objects are allocated.
+
+    All queries return indices into the sequence of points the tree was
+    built from.
+
+    >>> tree = KDTree([Point(0, 0), Point(5, 5), Point(1, 1)])
+    >>> tree.nearest(Point(2, 2))
+    (2, 1.4142135623730951)
+    """
+
+    def __init__(self, points: Iterable[Any] = ()) -> None:
+        xs = array("d")
+        ys = array("d")
+        for point in points:
+            x, y = xy(point)
+            xs.append(x)
+            ys.append(y)
+        self._build(xs, ys)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        xs: Iterable[float | int],
+        ys: Iterable[float | int],
+    ) -> KDTree:
+        """Returns a KDTree built from flat coordinate arrays, e.g. the
+        x and y buffers of a PointArray.
+
+        :param xs: Iterable[float | int]
+        :param ys: Iterable[float | int]
+        :return: KDTree
+        """
+        xs = array("d", xs)
+        ys = array("d", ys)
+        if len(xs) != len(ys):
+            raise ValueError(
+                f"Expected equal length coordinates, got {len(xs)} and {len(ys)}"
+            )
+        tree = cls.__new__(cls)
+        tree._build(xs, ys)
+        return tree
+
+    def _build(self, xs: array, ys: array) -> None:
+        """Permutes xs and ys into implicit tree order.
+
+        Indices are presorted by x and by y once; every level then
+        partitions both sorted lists around the median in linear time,
+        for O(n log n) overall.
+        """
+        n = len(xs)
+        by_x = sorted(range(n), key=xs.__getitem__)
+        by_y = sorted(range(n), key=ys.__getitem__)
+        order = array("i", bytes(4 * n))
+        side = array("i", [-1]) * n
+
+        stack = [(0, n, 0, by_x, by_y)]
+        while stack:
+            lo, hi, axis, sorted_x, sorted_y = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if axis == 0:
+                primary, secondary = sorted_x, sorted_y
+            else:
+                primary, secondary = sorted_y, sorted_x
+            split = mid - lo
+            median = primary[split]
+            order[mid] = median
+
+            left, right = primary[:split], primary[split + 1 :]
+            for i in left:
+                side[i] = mid
+            side[median] = -2
+            other_left = [i for i in secondary if side[i] == mid]
+            other_right = [i for i in secondary if side[i] != mid and i != median]
+
+            if axis == 0:
+                stack.append((lo, mid, 1, left, other_left))
+                stack.append((mid + 1, hi, 1, right, other_right))
+            else:
+                stack.append((lo, mid, 0, other_left, left))
+                stack.append((mid + 1, hi, 0, other_right, right))
+
+        self._index = order
+        self._x = array("d", (xs[i] for i in order))
+        self._y = array("d", (ys[i] for i in order))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} points>)"
+
+    def _knn(self, qx: float, qy: float, k: int) -> list[tuple[float, int]]:
+        """Returns up to k (squared distance, tree position) pairs closest
+        to (qx, qy), nearest first."""
+
+        xs, ys = self._x, self._y
+        best: list[tuple[float, int]] = []  # max-heap of (-d2, position)
+        stack = [(0, len(xs), 0, 0.0)]
+
+        while stack:
+            lo, hi, axis, bound = stack.pop()
+            if lo >= hi or (len(best) == k and bound > -best[0][0]):
+                continue
+
+            mid = (lo + hi) // 2
+            dx = qx - xs[mid]
+            dy = qy - ys[mid]
+            d2 = dx * dx + dy * dy
+            if len(best) < k:
+                heapq.heappush(best, (-d2, mid))
+            elif d2 < -best[0][0]:
+                heapq.heapreplace(best, (-d2, mid))
+
+            diff = dx if axis == 0 else dy
+            if diff < 0:
+                stack.append((mid + 1, hi, 1 - axis, diff * diff))
+                stack.append((lo, mid, 1 - axis, bound))
+            else:
+                stack.append((lo, mid, 1 - axis, diff * diff))
+                stack.append((mid + 1, hi, 1 - axis, bound))
+
+        return sorted((-d2, position) for d2, position in best)
+
+    def nearest(self, point: Any) -> tuple[int, float]:
+        """Returns the index of and distance to the point closest to point.
+
+        Raises ValueError if the tree is empty.
+
+        :param point: Point, CPoint or (x, y)
+        :return: (index, distance)
+        """
+        if not len(self):
+            raise ValueError("nearest() on an empty KDTree")
+        (d2, position), *_ = self._knn(*xy(point), 1)
+        return (self._index[position], math.sqrt(d2))
+
+    def knn(self, point: Any, k: int) -> tuple[list[int], list[float]]:
+        """Returns the indices of and distances to the k points closest
+        to point, nearest first.
+
+        :param point: Point, CPoint or (x, y)
+        :param int k:
+        :return: (indices, distances)
+        """
+        if k < 1:
+            return ([], [])
+        found = self._knn(*xy(point), k)
+        return (
+            [self._index[position] for _, position in found],
+            [math.sqrt(d2) for d2, _ in found],
+        )
+
+    def within(self, point: Any, radius: float) -> list[int]:
+        """Returns the indices of points whose distance from point is less
+        than or equal to radius.
+
+        :param point: Point, CPoint or (x, y)
+        :param float radius:
+        :return: list of indices
+        """
+        qx, qy = xy(point)
+        r2 = radius * radius
+        xs, ys, index = self._x, self._y, self._index
+        found = []
+        stack = [(0, len(xs), 0)]
+
+        while stack:
+            lo, hi, axis = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            dx = qx - xs[mid]
+            dy = qy - ys[mid]
+            if dx * dx + dy * dy <= r2:
+                found.append(index[mid])
+            diff = dx if axis == 0 else dy
+            if diff >= 0 or diff * diff <= r2:
+                stack.append((mid + 1, hi, 1 - axis))
+            if diff <= 0 or diff * diff <= r2:
+                stack.append((lo, mid, 1 - axis))
+
+        return found
+
+    def query_many(self, points: Iterable[Any]) -> tuple[array, array]:
+        """Returns the nearest neighbour of each of points as an array of
+        indices and an array of distances.
+
+        Raises ValueError if the tree is empty.
+
+        :param points: Iterable of Point, CPoint or (x, y)
+        :return: (array('i') indices, array('d') distances)
+        """
+        if not len(self):
+            raise ValueError("query_many() on an empty KDTree")
+        indices = array("i")
+        distances = array("d")
+        index, knn = self._index, self._knn
+        for point in points:
+            (d2, position), *_ = knn(*xy(point), 1)
+            indices.append(index[position])
+            distances.append(math.sqrt(d2))
+        return (indices, distances)
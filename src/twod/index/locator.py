@@ -0,0 +1,156 @@
+"""polygon point location for humans™"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import Any
+
+from .._coords import columns, xy
+from ..constants import Winding
+from ..point import Point
+from ..polygon import Polygon
+
+
+class PolygonLocator:
+    """A slab decomposition answering which of a fixed set of
+    non-overlapping polygons contains a point.
+
+    Vertical lines through every vertex cut the plane into slabs. No
+    edge starts or ends inside a slab and edges don't cross, so the
+    edges spanning a slab are sorted bottom to top once, each noting
+    the polygon just above it. A query is a binary search for the slab
+    followed by a binary search over its edges with Point.ccw, so it
+    takes O(log n) for n edges. The slabs may hold O(n²) edges in total
+    for unfavourable layouts.
+
+    Points on an edge or vertex are assigned to one of the polygons it
+    touches, or to none.
+
+    >>> locator = PolygonLocator([
+    ...     Polygon([Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)]),
+    ...     Polygon([Point(1, 0), Point(2, 0), Point(2, 1), Point(1, 1)]),
+    ... ])
+    >>> locator.locate(Point(1.5, 0.5))
+    1
+    """
+
+    def __init__(self, polygons: Iterable[Any]) -> None:
+        starts: list[Point] = []
+        ends: list[Point] = []
+        owners = array("i")
+
+        for index, polygon in enumerate(polygons):
+            if not isinstance(polygon, Polygon):
+                polygon = Polygon(polygon)
+            orientation = polygon.orientation
+            if orientation == Winding.Colinear:
+                continue
+            previous = polygon[-1]
+            for vertex in polygon:
+                if previous.x != vertex.x:
+                    rightward = previous.x < vertex.x
+                    # a counter clock-wise polygon lies left of its
+                    # edges, so above those heading right
+                    above = rightward == (orientation == Winding.CCW)
+                    starts.append(previous if rightward else vertex)
+                    ends.append(vertex if rightward else previous)
+                    owners.append(index if above else -1)
+                previous = vertex
+
+        self._slab_x = array("d", sorted({p.x for p in starts} | {p.x for p in ends}))
+        slabs: list[list[int]] = [[] for _ in range(max(0, len(self._slab_x) - 1))]
+        for edge, (a, b) in enumerate(zip(starts, ends)):
+            first = bisect_right(self._slab_x, a.x) - 1
+            last = bisect_right(self._slab_x, b.x) - 1
+            for slab in range(first, last):
+                slabs[slab].append(edge)
+
+        # order each slab by height at its middle, edges below their
+        # polygon after the coincident edge of the polygon beneath
+        for slab, edges in enumerate(slabs):
+            mid = (self._slab_x[slab] + self._slab_x[slab + 1]) / 2
+            edges.sort(
+                key=lambda e: (
+                    starts[e].y
+                    + (mid - starts[e].x)
+                    * (ends[e].y - starts[e].y)
+                    / (ends[e].x - starts[e].x),
+                    owners[e] >= 0,
+                )
+            )
+
+        self._starts = starts
+        self._ends = ends
+        self._owners = owners
+        self._slabs = slabs
+        self._ax = array("d", (p.x for p in starts))
+        self._ay = array("d", (p.y for p in starts))
+        self._bx = array("d", (p.x for p in ends))
+        self._by = array("d", (p.y for p in ends))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self._slabs)} slabs>)"
+
+    def locate(self, point: Any) -> int | None:
+        """Returns the index of the polygon containing point, or None if
+        no polygon contains it.
+
+        :param point: Point, CPoint or (x, y)
+        :return: index into the polygons the locator was built from
+        """
+        if not isinstance(point, Point):
+            point = Point(*xy(point))
+
+        slab = bisect_right(self._slab_x, point.x) - 1
+        if slab < 0 or slab >= len(self._slabs):
+            return None
+
+        edges, starts, ends = self._slabs[slab], self._starts, self._ends
+        # count the edges the point is on or above
+        lo, hi = 0, len(edges)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            edge = edges[mid]
+            if starts[edge].ccw(ends[edge], point) >= 0:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo == 0:
+            return None
+        owner = self._owners[edges[lo - 1]]
+        return owner if owner >= 0 else None
+
+    def locate_many(self, points: Iterable[Any]) -> array:
+        """Returns the index of the polygon containing each of points,
+        -1 where no polygon contains the point.
+
+        :param points: Iterable of points, a PointArray or a packed buffer
+        :return: array('i')
+        """
+        pxs, pys = columns(points)
+        slab_x, slabs, owners = self._slab_x, self._slabs, self._owners
+        ax, ay, bx, by = self._ax, self._ay, self._bx, self._by
+        count = len(slabs)
+
+        found = array("i")
+        for px, py in zip(pxs, pys):
+            slab = bisect_right(slab_x, px) - 1
+            if slab < 0 or slab >= count:
+                found.append(-1)
+                continue
+            edges = slabs[slab]
+            lo, hi = 0, len(edges)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                e = edges[mid]
+                # the same test as Point.ccw on raw coordinates
+                x, y = ax[e], ay[e]
+                if (bx[e] - x) * (py - y) - (px - x) * (by[e] - y) >= 0:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            found.append(owners[edges[lo - 1]] if lo else -1)
+        return found
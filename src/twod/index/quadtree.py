@@ -0,0 +1,327 @@
+"""an adaptive quadtree for humans™"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .._coords import bounds as rect_bounds
+from .._coords import xy
+from ..rect import Rect
+
+
+class _Node:
+    """A quadtree node covering [x0, x1] x [y0, y1].
+
+    Leaves hold (x, y, item) entries and no children, internal nodes hold
+    four children ordered SW, SE, NW, NE.
+    """
+
+    __slots__ = ("children", "depth", "entries", "mx", "my", "x0", "x1", "y0", "y1")
+
+    def __init__(self, x0: float, y0: float, x1: float, y1: float, depth: int) -> None:
+        self.x0, self.y0, self.x1, self.y1 = x0, y0, x1, y1
+        self.mx = (x0 + x1) / 2
+        self.my = (y0 + y1) / 2
+        self.depth = depth
+        self.entries: list[tuple[float, float, Any]] = []
+        self.children: list[_Node] = []
+
+    def child_for(self, x: float, y: float) -> _Node:
+        return self.children[(x >= self.mx) + 2 * (y >= self.my)]
+
+    def split(self) -> None:
+        x0, y0, x1, y1, mx, my = self.x0, self.y0, self.x1, self.y1, self.mx, self.my
+        depth = self.depth + 1
+        self.children = [
+            _Node(x0, y0, mx, my, depth),
+            _Node(mx, y0, x1, my, depth),
+            _Node(x0, my, mx, y1, depth),
+            _Node(mx, my, x1, y1, depth),
+        ]
+        entries, self.entries = self.entries, []
+        for entry in entries:
+            self.child_for(entry[0], entry[1]).entries.append(entry)
+
+    def distance_squared(self, x: float, y: float) -> float:
+        """Squared distance from (x, y) to the closest point of this node."""
+        dx = max(self.x0 - x, 0.0, x - self.x1)
+        dy = max(self.y0 - y, 0.0, y - self.y1)
+        return dx * dx + dy * dy
+
+
+class QuadTree:
+    """A point quadtree bounded by a Rect or CRect.
+
+    Leaves split into four quadrants when they hold more than capacity
+    points, until max_depth is reached, so dense regions get deep
+    subtrees while sparse regions stay shallow.
+
+    A point is accepted if it is between the corners of the bounds, so
+    points on the edges of the bounds are indexed (see Point.between).
+    Coordinates are read when a point is inserted, call move() after
+    changing a point's coordinates.
+
+    >>> tree = QuadTree(Rect(0, 0, 100, 100))
+    >>> tree.insert(Point(1, 1))
+    >>> tree.nearest(Point(0, 0))
+    [Point(x=1, y=1)]
+    """
+
+    def __init__(
+        self,
+        bounds: Any,
+        capacity: int = 8,
+        max_depth: int = 16,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(f"Expected a positive capacity, got {capacity!r}")
+        self.bounds = bounds
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self._root = _Node(*rect_bounds(bounds), depth=0)
+        self._where: dict[int, tuple[float, float]] = {}
+
+    @classmethod
+    def from_points(
+        cls,
+        points: Iterable[Any],
+        bounds: Any = None,
+        capacity: int = 8,
+        max_depth: int = 16,
+    ) -> QuadTree:
+        """Returns a QuadTree bulk loaded with points.
+
+        The points are partitioned top down in a single pass per level
+        rather than inserted one at a time. If bounds is not given, the
+        bounding Rect of the points is used.
+
+        Raises ValueError if a point lies outside bounds.
+
+        :param points: Iterable of Point or CPoint
+        :param bounds: Rect or CRect
+        :param int capacity:
+        :param int max_depth:
+        :return: QuadTree
+        """
+        entries = [(*xy(p), p) for p in points]
+
+        extent = None
+        if bounds is None:
+            if entries:
+                x0 = min(e[0] for e in entries)
+                y0 = min(e[1] for e in entries)
+                x1 = max(e[0] for e in entries)
+                y1 = max(e[1] for e in entries)
+            else:
+                x0 = y0 = x1 = y1 = 0.0
+            bounds = Rect(x0, y0, x1 - x0, y1 - y0)
+            extent = (x0, y0, x1, y1)
+
+        tree = cls(bounds, capacity=capacity, max_depth=max_depth)
+        if extent is not None:
+            # x0 + (x1 - x0) may round below x1, keep the exact extremes
+            tree._root = _Node(*extent, depth=0)
+        root = tree._root
+
+        for x, y, p in entries:
+            tree._check(x, y, p)
+            if id(p) in tree._where:
+                raise ValueError(f"{p!r} is already indexed")
+            tree._where[id(p)] = (x, y)
+
+        root.entries = entries
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if len(node.entries) > capacity and node.depth < max_depth:
+                node.split()
+                stack.extend(node.children)
+        return tree
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.bounds!r}, "
+            f"capacity={self.capacity}, max_depth={self.max_depth})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __iter__(self) -> Iterator[Any]:
+        for node in self._leaves():
+            for entry in node.entries:
+                yield entry[2]
+
+    def __contains__(self, point: Any) -> bool:
+        return id(point) in self._where
+
+    def _leaves(self) -> Iterator[_Node]:
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if not node.children:
+                yield node
+            else:
+                stack.extend(node.children)
+
+    def _check(self, x: float, y: float, point: Any) -> None:
+        root = self._root
+        if not (root.x0 <= x <= root.x1 and root.y0 <= y <= root.y1):
+            raise ValueError(f"{point!r} is outside {self.bounds!r}")
+
+    def _leaf_for(self, x: float, y: float) -> tuple[_Node, list[_Node]]:
+        """Returns the leaf containing (x, y) and the path to it."""
+        node = self._root
+        path = []
+        while node.children:
+            path.append(node)
+            node = node.child_for(x, y)
+        return node, path
+
+    def insert(self, point: Any) -> None:
+        """Adds point to the tree.
+
+        Raises ValueError if point is outside the bounds of the tree or
+        is already indexed.
+
+        :param point: Point or CPoint
+        """
+        x, y = xy(point)
+        self._check(x, y, point)
+        if id(point) in self._where:
+            raise ValueError(f"{point!r} is already indexed")
+        self._where[id(point)] = (x, y)
+
+        node, _ = self._leaf_for(x, y)
+        node.entries.append((x, y, point))
+        while len(node.entries) > self.capacity and node.depth < self.max_depth:
+            node.split()
+            node = node.child_for(x, y)
+
+    def remove(self, point: Any) -> None:
+        """Removes point from the tree, merging quadrants that no longer
+        hold more than capacity points.
+
+        Raises KeyError if point is not indexed.
+
+        :param point: Point or CPoint
+        """
+        x, y = self._where.pop(id(point))
+        node, path = self._leaf_for(x, y)
+        node.entries = [e for e in node.entries if e[2] is not point]
+
+        for parent in reversed(path):
+            if any(child.children for child in parent.children):
+                break
+            if sum(len(child.entries) for child in parent.children) > self.capacity:
+                break
+            parent.entries = [e for child in parent.children for e in child.entries]
+            parent.children = []
+
+    def move(self, point: Any, new_xy: Any = None) -> None:
+        """Re-indexes point after its coordinates have changed.
+
+        If new_xy is given, the point's xy is updated first.
+
+        Raises KeyError if point is not indexed and ValueError if its
+        new position is outside the bounds of the tree.
+
+        :param point: Point or CPoint
+        :param new_xy: optional new (x, y) for point
+        """
+        if id(point) not in self._where:
+            raise KeyError(point)
+        x, y = xy(new_xy if new_xy is not None else point)
+        self._check(x, y, point)
+        self.remove(point)
+        if new_xy is not None:
+            point.xy = new_xy
+        self.insert(point)
+
+    def query(self, rect: Any, inclusive: bool = True) -> list[Any]:
+        """Returns the points within rect.
+
+        If inclusive is True, points on the edges of rect are included
+        (Point.between), otherwise they are excluded (Point.inside).
+
+        :param rect: Rect or CRect
+        :param bool inclusive:
+        :return: list of points
+        """
+        x0, y0, x1, y1 = rect_bounds(rect)
+        found: list[Any] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.x0 > x1 or node.x1 < x0 or node.y0 > y1 or node.y1 < y0:
+                continue
+            if node.children:
+                stack.extend(node.children)
+                continue
+            if inclusive:
+                found.extend(
+                    p for x, y, p in node.entries if x0 <= x <= x1 and y0 <= y <= y1
+                )
+            else:
+                found.extend(
+                    p for x, y, p in node.entries if x0 < x < x1 and y0 < y < y1
+                )
+        return found
+
+    def query_circle(self, center: Any, radius: float) -> list[Any]:
+        """Returns the points whose distance from center is less than or
+        equal to radius.
+
+        :param center: Point, CPoint or (x, y)
+        :param float radius:
+        :return: list of points
+        """
+        cx, cy = xy(center)
+        r2 = radius * radius
+        found: list[Any] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.distance_squared(cx, cy) > r2:
+                continue
+            if node.children:
+                stack.extend(node.children)
+                continue
+            for x, y, p in node.entries:
+                if (x - cx) * (x - cx) + (y - cy) * (y - cy) <= r2:
+                    found.append(p)
+        return found
+
+    def nearest(self, point: Any, k: int = 1) -> list[Any]:
+        """Returns up to k points closest to point, nearest first.
+
+        Nodes and points are visited best first in order of their
+        squared distance from point.
+
+        :param point: Point, CPoint or (x, y)
+        :param int k:
+        :return: list of points
+        """
+        px, py = xy(point)
+        counter = itertools.count()
+        heap: list[tuple[float, int, bool, Any]] = [
+            (self._root.distance_squared(px, py), next(counter), False, self._root)
+        ]
+        found: list[Any] = []
+        while heap and len(found) < k:
+            _, _, is_point, value = heapq.heappop(heap)
+            if is_point:
+                found.append(value)
+                continue
+            if value.children:
+                for child in value.children:
+                    d2 = child.distance_squared(px, py)
+                    heapq.heappush(heap, (d2, next(counter), False, child))
+                continue
+            for x, y, p in value.entries:
+                d2 = (x - px) * (x - px) + (y - py) * (y - py)
+                heapq.heappush(heap, (d2, next(counter), True, p))
+        return found
@@ -0,0 +1,400 @@
+"""an R-tree of axis-aligned rectangles for humans™"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .._coords import bounds as rect_bounds
+from .._coords import xy
+
+
+class RTree:
+    """An R-tree indexing Rect and CRect bounds.
+
+    Node and entry bounds are kept in parallel arrays of doubles indexed
+    by integer ids, no Rect is allocated per node. The tree can be bulk
+    loaded with Sort-Tile-Recursive packing and then updated with insert
+    and delete.
+
+    Every entry carries an item, which defaults to the rectangle it was
+    inserted with, and queries return items. Rectangles are treated as
+    closed, so rectangles sharing an edge intersect.
+
+    >>> tree = RTree.from_rects([Rect(0, 0, 2, 2), Rect(5, 5, 1, 1)])
+    >>> tree.containing(Point(1, 1))
+    [Rect(x=0, y=0, w=2, h=2)]
+    """
+
+    def __init__(self, max_entries: int = 16) -> None:
+        if max_entries < 4:
+            raise ValueError(f"Expected max_entries >= 4, got {max_entries!r}")
+        self.max_entries = max_entries
+        self.min_entries = max(2, max_entries * 2 // 5)
+
+        # node bounds, children (node or entry ids), leaf flags and parents
+        self._nx0 = array("d")
+        self._ny0 = array("d")
+        self._nx1 = array("d")
+        self._ny1 = array("d")
+        self._children: list[list[int]] = []
+        self._leaf = bytearray()
+        self._nparent = array("i")
+        self._free_nodes: list[int] = []
+
+        # entry bounds, items and the leaf holding each entry
+        self._ex0 = array("d")
+        self._ey0 = array("d")
+        self._ex1 = array("d")
+        self._ey1 = array("d")
+        self._items: list[Any] = []
+        self._eparent = array("i")
+        self._free_entries: list[int] = []
+
+        self._count = 0
+        self._root = self._new_node(leaf=True, parent=-1)
+
+    @classmethod
+    def from_rects(
+        cls,
+        rects: Iterable[Any],
+        items: Iterable[Any] | None = None,
+        max_entries: int = 16,
+    ) -> RTree:
+        """Returns an RTree bulk loaded with rects using Sort-Tile-Recursive
+        packing.
+
+        :param rects: Iterable of Rect, CRect or (x, y, w, h)
+        :param items: optional items to store instead of the rects
+        :param int max_entries: node capacity
+        :return: RTree
+        """
+        rects = list(rects)
+        items = rects if items is None else list(items)
+        if len(items) != len(rects):
+            raise ValueError(f"Expected {len(rects)} items, got {len(items)}")
+
+        tree = cls(max_entries=max_entries)
+        if not rects:
+            return tree
+
+        for rect, item in zip(rects, items):
+            tree._new_entry(rect_bounds(rect), item)
+        tree._count = len(rects)
+
+        # pack entries into leaves, then nodes into parents, until one
+        # node remains
+        tree._free_nodes.append(tree._root)
+        ids = list(range(len(rects)))
+        bounds = (tree._ex0, tree._ey0, tree._ex1, tree._ey1)
+        leaf = True
+        while True:
+            groups = tree._str_groups(ids, bounds)
+            ids = [tree._pack(group, leaf) for group in groups]
+            if len(ids) == 1:
+                break
+            bounds = (tree._nx0, tree._ny0, tree._nx1, tree._ny1)
+            leaf = False
+        tree._root = ids[0]
+        tree._nparent[tree._root] = -1
+        return tree
+
+    def _str_groups(self, ids: list[int], bounds: tuple) -> list[list[int]]:
+        """Tiles ids into groups of at most max_entries by center x, then
+        center y within each vertical slice."""
+        x0, y0, x1, y1 = bounds
+        m = self.max_entries
+        leaves = math.ceil(len(ids) / m)
+        slices = math.ceil(math.sqrt(leaves))
+        per_slice = slices * m
+
+        ids = sorted(ids, key=lambda i: x0[i] + x1[i])
+        groups: list[list[int]] = []
+        for start in range(0, len(ids), per_slice):
+            column = sorted(ids[start : start + per_slice], key=lambda i: y0[i] + y1[i])
+            groups.extend(column[k : k + m] for k in range(0, len(column), m))
+        return groups
+
+    def _new_node(self, leaf: bool, parent: int) -> int:
+        if self._free_nodes:
+            node = self._free_nodes.pop()
+            self._children[node] = []
+            self._leaf[node] = leaf
+            self._nparent[node] = parent
+            return node
+        self._nx0.append(math.inf)
+        self._ny0.append(math.inf)
+        self._nx1.append(-math.inf)
+        self._ny1.append(-math.inf)
+        self._children.append([])
+        self._leaf.append(leaf)
+        self._nparent.append(parent)
+        return len(self._children) - 1
+
+    def _new_entry(self, bounds: tuple[float, float, float, float], item: Any) -> int:
+        x0, y0, x1, y1 = bounds
+        if self._free_entries:
+            entry = self._free_entries.pop()
+            self._ex0[entry], self._ey0[entry] = x0, y0
+            self._ex1[entry], self._ey1[entry] = x1, y1
+            self._items[entry] = item
+            return entry
+        self._ex0.append(x0)
+        self._ey0.append(y0)
+        self._ex1.append(x1)
+        self._ey1.append(y1)
+        self._items.append(item)
+        self._eparent.append(-1)
+        return len(self._items) - 1
+
+    def _pack(self, children: list[int], leaf: bool) -> int:
+        """Returns a new node holding children."""
+        node = self._new_node(leaf, -1)
+        self._children[node] = children
+        parents = self._eparent if leaf else self._nparent
+        for child in children:
+            parents[child] = node
+        self._refit(node)
+        return node
+
+    def _child_bounds(self, node: int) -> tuple:
+        if self._leaf[node]:
+            return (self._ex0, self._ey0, self._ex1, self._ey1)
+        return (self._nx0, self._ny0, self._nx1, self._ny1)
+
+    def _refit(self, node: int) -> None:
+        """Recomputes the bounds of node from its children."""
+        children = self._children[node]
+        x0, y0, x1, y1 = self._child_bounds(node)
+        if children:
+            self._nx0[node] = min(x0[c] for c in children)
+            self._ny0[node] = min(y0[c] for c in children)
+            self._nx1[node] = max(x1[c] for c in children)
+            self._ny1[node] = max(y1[c] for c in children)
+        else:
+            self._nx0[node] = self._ny0[node] = math.inf
+            self._nx1[node] = self._ny1[node] = -math.inf
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} rects>)"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        for _, item in self._entries():
+            yield item
+
+    def _entries(self) -> Iterator[tuple[int, Any]]:
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if self._leaf[node]:
+                for entry in self._children[node]:
+                    yield entry, self._items[entry]
+            else:
+                stack.extend(self._children[node])
+
+    def insert(self, rect: Any, item: Any = None) -> int:
+        """Adds rect to the tree and returns a handle for delete().
+
+        :param rect: Rect, CRect or (x, y, w, h)
+        :param item: optional item returned by queries instead of rect
+        :return: int handle
+        """
+        entry = self._new_entry(rect_bounds(rect), rect if item is None else item)
+        self._insert_entry(entry)
+        self._count += 1
+        return entry
+
+    def _insert_entry(self, entry: int) -> None:
+        x0, y0 = self._ex0[entry], self._ey0[entry]
+        x1, y1 = self._ex1[entry], self._ey1[entry]
+
+        # descend by least enlargement, then least area
+        node = self._root
+        nx0, ny0, nx1, ny1 = self._nx0, self._ny0, self._nx1, self._ny1
+        while not self._leaf[node]:
+            best, best_cost = -1, None
+            for child in self._children[node]:
+                w = nx1[child] - nx0[child]
+                h = ny1[child] - ny0[child]
+                ew = max(nx1[child], x1) - min(nx0[child], x0)
+                eh = max(ny1[child], y1) - min(ny0[child], y0)
+                cost = (ew * eh - w * h, w * h)
+                if best_cost is None or cost < best_cost:
+                    best, best_cost = child, cost
+            node = best
+
+        self._children[node].append(entry)
+        self._eparent[entry] = node
+
+        while node != -1:
+            nx0[node] = min(nx0[node], x0)
+            ny0[node] = min(ny0[node], y0)
+            nx1[node] = max(nx1[node], x1)
+            ny1[node] = max(ny1[node], y1)
+            if len(self._children[node]) > self.max_entries:
+                self._split(node)
+            node = self._nparent[node]
+
+    def _split(self, node: int) -> None:
+        """Splits an overflowing node in two along the axis whose sorted
+        halves have the smallest total perimeter."""
+        children = self._children[node]
+        x0, y0, x1, y1 = self._child_bounds(node)
+        half = len(children) // 2
+
+        def perimeter(group: list[int]) -> float:
+            return (
+                max(x1[c] for c in group)
+                - min(x0[c] for c in group)
+                + max(y1[c] for c in group)
+                - min(y0[c] for c in group)
+            )
+
+        best_cost, ordered = math.inf, children
+        for lo, hi in ((x0, x1), (y0, y1)):
+            candidate = sorted(children, key=lambda c: lo[c] + hi[c])
+            cost = perimeter(candidate[:half]) + perimeter(candidate[half:])
+            if cost < best_cost:
+                best_cost, ordered = cost, candidate
+
+        leaf = bool(self._leaf[node])
+        parent = self._nparent[node]
+        self._children[node] = ordered[:half]
+        self._refit(node)
+        sibling = self._pack(ordered[half:], leaf)
+
+        if parent == -1:
+            root = self._pack([node, sibling], leaf=False)
+            self._root = root
+            self._nparent[root] = -1
+            return
+
+        self._children[parent].append(sibling)
+        self._nparent[sibling] = parent
+
+    def delete(self, handle: int) -> Any:
+        """Removes the rect with handle from the tree and returns its item.
+
+        Underfull nodes are dissolved and their entries reinserted.
+
+        Raises KeyError if handle is not in the tree.
+
+        :param int handle: as returned by insert()
+        :return: the item stored with the rect
+        """
+        if not 0 <= handle < len(self._items) or self._eparent[handle] == -1:
+            raise KeyError(handle)
+
+        node = self._eparent[handle]
+        self._children[node].remove(handle)
+        self._eparent[handle] = -1
+        item = self._items[handle]
+        self._items[handle] = None
+        self._free_entries.append(handle)
+        self._count -= 1
+
+        orphans: list[int] = []
+        while node != self._root:
+            parent = self._nparent[node]
+            if len(self._children[node]) < self.min_entries:
+                self._children[parent].remove(node)
+                orphans.extend(self._dissolve(node))
+            else:
+                self._refit(node)
+            node = parent
+        self._refit(self._root)
+
+        # shorten the tree while the root has a single inner child
+        while not self._leaf[self._root] and len(self._children[self._root]) == 1:
+            old = self._root
+            self._root = self._children[old][0]
+            self._nparent[self._root] = -1
+            self._free_nodes.append(old)
+        if not self._children[self._root]:
+            self._leaf[self._root] = True
+
+        for entry in orphans:
+            self._insert_entry(entry)
+        return item
+
+    def _dissolve(self, node: int) -> list[int]:
+        """Frees node and its descendants, returning their entries."""
+        entries: list[int] = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if self._leaf[current]:
+                entries.extend(self._children[current])
+            else:
+                stack.extend(self._children[current])
+            self._children[current] = []
+            self._free_nodes.append(current)
+        return entries
+
+    def intersecting(self, rect: Any) -> list[Any]:
+        """Returns the items whose rects intersect rect, including rects
+        that only share an edge or corner with it.
+
+        :param rect: Rect, CRect or (x, y, w, h)
+        :return: list of items
+        """
+        qx0, qy0, qx1, qy1 = rect_bounds(rect)
+        found: list[Any] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            x0, y0, x1, y1 = self._child_bounds(node)
+            hits = [
+                c
+                for c in self._children[node]
+                if x0[c] <= qx1 and qx0 <= x1[c] and y0[c] <= qy1 and qy0 <= y1[c]
+            ]
+            if self._leaf[node]:
+                found.extend(self._items[e] for e in hits)
+            else:
+                stack.extend(hits)
+        return found
+
+    def containing(self, point: Any) -> list[Any]:
+        """Returns the items whose rects contain point, including rects
+        with point on an edge.
+
+        :param point: Point, CPoint or (x, y)
+        :return: list of items
+        """
+        px, py = xy(point)
+        return self.intersecting((px, py, 0, 0))
+
+    def nearest(self, point: Any, k: int = 1) -> list[Any]:
+        """Returns up to k items whose rects are closest to point, nearest
+        first. Rects containing point have a distance of zero.
+
+        :param point: Point, CPoint or (x, y)
+        :param int k:
+        :return: list of items
+        """
+        px, py = xy(point)
+        counter = itertools.count()
+        heap: list[tuple[float, int, bool, int]] = [
+            (0.0, next(counter), False, self._root)
+        ]
+        found: list[Any] = []
+        while heap and len(found) < k:
+            _, _, is_entry, value = heapq.heappop(heap)
+            if is_entry:
+                found.append(self._items[value])
+                continue
+            x0, y0, x1, y1 = self._child_bounds(value)
+            leaf = bool(self._leaf[value])
+            for c in self._children[value]:
+                dx = max(x0[c] - px, 0.0, px - x1[c])
+                dy = max(y0[c] - py, 0.0, py - y1[c])
+                heapq.heappush(heap, (dx * dx + dy * dy, next(counter), leaf, c))
+        return found
@@ -0,0 +1,203 @@
+"""a sweep-and-prune broad-phase for humans™"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+from .._coords import bounds as rect_bounds
+
+
+class SweepAndPrune:
+    """A sort-and-sweep broad-phase over Rect and CRect bounds.
+
+    The min and max endpoints of every rectangle are kept sorted along x
+    and y between calls. update_pairs() re-sorts them with an insertion
+    sort, which is close to linear when objects move a little each frame,
+    and every endpoint swap tells it which pair may have started or
+    stopped overlapping. Only those changes are reported.
+
+    Rectangles are treated as closed, so rectangles sharing an edge
+    overlap.
+
+    >>> sap = SweepAndPrune()
+    >>> a = sap.insert(Rect(0, 0, 2, 2), item="a")
+    >>> b = sap.insert(Rect(1, 1, 2, 2), item="b")
+    >>> sap.update_pairs()
+    ([('a', 'b')], [])
+    """
+
+    def __init__(self) -> None:
+        # per axis bounds indexed by handle
+        self._lo = (array("d"), array("d"))
+        self._hi = (array("d"), array("d"))
+        # per axis endpoints encoded as handle * 2 + is_max
+        self._ends: tuple[list[int], list[int]] = ([], [])
+        self._items: list[Any] = []
+        self._free: list[int] = []
+        # handles removed since the last update_pairs(), held back so
+        # their pending exits can't cancel a new rect's enters
+        self._released: list[int] = []
+        self._partners: dict[int, set[int]] = {}
+        self._entered: dict[tuple[int, int], tuple[Any, Any]] = {}
+        self._exited: dict[tuple[int, int], tuple[Any, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} rects>)"
+
+    def __len__(self) -> int:
+        return len(self._partners)
+
+    def __iter__(self) -> Iterator[Any]:
+        for handle in self._partners:
+            yield self._items[handle]
+
+    def _set_bounds(self, handle: int, rect: Any) -> None:
+        x0, y0, x1, y1 = rect_bounds(rect)
+        self._lo[0][handle], self._hi[0][handle] = x0, x1
+        self._lo[1][handle], self._hi[1][handle] = y0, y1
+
+    def insert(self, rect: Any, item: Any = None) -> int:
+        """Adds rect and returns a handle for update() and remove().
+
+        Overlaps involving the new rect are reported by the next call to
+        update_pairs().
+
+        :param rect: Rect, CRect or (x, y, w, h)
+        :param item: optional item reported instead of rect
+        :return: int handle
+        """
+        if self._free:
+            handle = self._free.pop()
+            self._items[handle] = rect if item is None else item
+        else:
+            handle = len(self._items)
+            self._items.append(rect if item is None else item)
+            for axis in (0, 1):
+                self._lo[axis].append(0.0)
+                self._hi[axis].append(0.0)
+        self._set_bounds(handle, rect)
+        self._partners[handle] = set()
+        for ends in self._ends:
+            ends.append(handle * 2)
+            ends.append(handle * 2 + 1)
+        return handle
+
+    def update(self, handle: int, rect: Any) -> None:
+        """Records new bounds for the rect with handle, typically right
+        after moving it in place with +=.
+
+        Raises KeyError if handle is not present.
+
+        :param int handle: as returned by insert()
+        :param rect: Rect, CRect or (x, y, w, h)
+        """
+        if handle not in self._partners:
+            raise KeyError(handle)
+        self._set_bounds(handle, rect)
+
+    def remove(self, handle: int) -> Any:
+        """Removes the rect with handle and returns its item. Pairs it was
+        part of are reported as exited by the next update_pairs().
+
+        Raises KeyError if handle is not present.
+
+        :param int handle: as returned by insert()
+        :return: the item stored with the rect
+        """
+        partners = self._partners.pop(handle)
+        for other in partners:
+            self._partners[other].discard(handle)
+            self._exit(handle, other)
+        for ends in self._ends:
+            ends.remove(handle * 2)
+            ends.remove(handle * 2 + 1)
+        item = self._items[handle]
+        self._items[handle] = None
+        self._released.append(handle)
+        return item
+
+    @property
+    def pairs(self) -> list[tuple[Any, Any]]:
+        """Every pair of items currently known to overlap, as of the last
+        update_pairs()."""
+        items = self._items
+        return [
+            (items[a], items[b])
+            for a, partners in self._partners.items()
+            for b in partners
+            if a < b
+        ]
+
+    def _overlaps(self, a: int, b: int) -> bool:
+        lo, hi = self._lo, self._hi
+        return (
+            lo[0][a] <= hi[0][b]
+            and lo[0][b] <= hi[0][a]
+            and lo[1][a] <= hi[1][b]
+            and lo[1][b] <= hi[1][a]
+        )
+
+    def _enter(self, a: int, b: int) -> None:
+        if b in self._partners[a] or not self._overlaps(a, b):
+            return
+        self._partners[a].add(b)
+        self._partners[b].add(a)
+        key = (a, b) if a < b else (b, a)
+        if self._exited.pop(key, None) is None:
+            self._entered[key] = (self._items[key[0]], self._items[key[1]])
+
+    def _exit(self, a: int, b: int) -> None:
+        key = (a, b) if a < b else (b, a)
+        if self._entered.pop(key, None) is None:
+            self._exited[key] = (self._items[key[0]], self._items[key[1]])
+
+    def _sort(self, axis: int) -> None:
+        """Insertion sorts the endpoints of axis, min before max on ties,
+        tracking overlap changes at every swap."""
+        ends, lo, hi = self._ends[axis], self._lo[axis], self._hi[axis]
+        partners = self._partners
+
+        for i in range(1, len(ends)):
+            code = ends[i]
+            is_max = code & 1
+            value = hi[code >> 1] if is_max else lo[code >> 1]
+            j = i - 1
+            while j >= 0:
+                other = ends[j]
+                other_is_max = other & 1
+                other_value = hi[other >> 1] if other_is_max else lo[other >> 1]
+                if other_value < value or (
+                    other_value == value and other_is_max <= is_max
+                ):
+                    break
+                if not is_max and other_is_max:
+                    # a min moved below a max: the pair may now overlap
+                    self._enter(code >> 1, other >> 1)
+                elif is_max and not other_is_max:
+                    # a max moved below a min: the pair is now apart
+                    a, b = code >> 1, other >> 1
+                    if b in partners[a]:
+                        partners[a].discard(b)
+                        partners[b].discard(a)
+                        self._exit(a, b)
+                ends[j + 1] = other
+                j -= 1
+            ends[j + 1] = code
+
+    def update_pairs(self) -> tuple[list[tuple[Any, Any]], list[tuple[Any, Any]]]:
+        """Re-sorts the endpoints and returns the pairs of items that
+        started and stopped overlapping since the previous call.
+
+        :return: (entered, exited) lists of (item, item)
+        """
+        self._sort(0)
+        self._sort(1)
+        entered = list(self._entered.values())
+        exited = list(self._exited.values())
+        self._entered.clear()
+        self._exited.clear()
+        self._free.extend(self._released)
+        self._released.clear()
+        return (entered, exited)
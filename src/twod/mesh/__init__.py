@@ -0,0 +1,10 @@
+"""triangle meshes for humans™"""
+
+from .delaunay import Triangulation, delaunay
+from .voronoi import voronoi
+
+__all__ = [
+    "Triangulation",
+    "delaunay",
+    "voronoi",
+]
@@ -0,0 +1,312 @@
+"""Delaunay triangulation for humans™"""
+
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .._coords import columns
+
+# the vertex at infinity shared by the triangles outside the hull
+_GHOST = -1
+
+# insertion rounds smaller than this are not split further
+_ROUND_MIN = 64
+
+
+class Triangulation:
+    """Triangles over a set of points, stored as flat arrays of ints.
+
+    triangles holds three point indices per triangle in counter
+    clock-wise order. neighbours holds, for the same positions, the
+    triangle across the edge opposite that vertex, or -1 on the hull:
+    the triangle across the edge (triangles[3t + 1], triangles[3t + 2])
+    is neighbours[3t].
+    """
+
+    __slots__ = ("neighbours", "triangles", "x", "y")
+
+    def __init__(
+        self,
+        x: array,
+        y: array,
+        triangles: array,
+        neighbours: array,
+    ) -> None:
+        self.x = x
+        self.y = y
+        self.triangles = triangles
+        self.neighbours = neighbours
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} triangles>)"
+
+    def __len__(self) -> int:
+        return len(self.triangles) // 3
+
+    def __iter__(self) -> Iterator[tuple[int, int, int]]:
+        t = self.triangles
+        for i in range(0, len(t), 3):
+            yield (t[i], t[i + 1], t[i + 2])
+
+    def __getitem__(self, key: int) -> tuple[int, int, int]:
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(f"Triangle index {key} out of range")
+        t = self.triangles
+        return (t[3 * key], t[3 * key + 1], t[3 * key + 2])
+
+
+def _insertion_order(
+    xs: list[float],
+    ys: list[float],
+    indices: list[int],
+) -> list[int]:
+    """Returns a biased randomized insertion order of indices.
+
+    The points are shuffled and cut into rounds that double in size,
+    then each round is sorted along a snaking grid so that consecutive
+    insertions are close together and the walks locating them are
+    short.
+    """
+    n = len(indices)
+    order = list(indices)
+    random.Random(n).shuffle(order)
+
+    y0 = min(ys)
+    height = (max(ys) - y0) or 1.0
+
+    rounds = []
+    end = n
+    while end > _ROUND_MIN:
+        rounds.append((end // 2, end))
+        end //= 2
+    rounds.append((0, end))
+
+    result: list[int] = []
+    for start, stop in reversed(rounds):
+        chunk = order[start:stop]
+        cells = max(1, int(math.sqrt(len(chunk) / 2)))
+        sy = cells / height
+
+        # rows of the grid bottom to top, alternately left to right and
+        # right to left
+        snake = []
+        for i in chunk:
+            row = int((ys[i] - y0) * sy)
+            snake.append((row, xs[i] if row % 2 == 0 else -xs[i], i))
+        snake.sort()
+        result.extend(i for _, _, i in snake)
+    return result
+
+
+def delaunay(points: Iterable[Any]) -> Triangulation:
+    """Returns the Delaunay triangulation of points.
+
+    Points are inserted one at a time in a biased randomized order,
+    each located by walking across triangles from the last one created
+    using the Point.ccw orientation test, then edges are flipped until
+    no triangle's circumcircle holds another point (Point.incircle). The
+    hull is closed off with triangles sharing a vertex at infinity, so
+    points outside the current hull are inserted the same way. This
+    runs in expected O(n log n).
+
+    Repeated points are triangulated once, at their smallest index. If
+    all points are collinear there are no triangles.
+
+    >>> mesh = delaunay([Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)])
+    >>> len(mesh)
+    2
+
+    :param points: Iterable of points, a PointArray or a packed buffer
+    :return: Triangulation
+    """
+    return _triangulate(*columns(points))
+
+
+def _triangulate(xs: list[float], ys: list[float]) -> Triangulation:
+    """Returns the Delaunay triangulation of the points (xs[i], ys[i])."""
+    mesh = Triangulation(array("d", xs), array("d", ys), array("i"), array("i"))
+
+    # repeated points are inserted once, at their smallest index
+    first: dict[tuple[float, float], int] = {}
+    for i, point in enumerate(zip(xs, ys)):
+        first.setdefault(point, i)
+    if len(first) < 3:
+        return mesh
+
+    order = _insertion_order(xs, ys, list(first.values()))
+
+    def ccw(a: int, b: int, c: int) -> float:
+        ax, ay = xs[a], ys[a]
+        return (xs[b] - ax) * (ys[c] - ay) - (xs[c] - ax) * (ys[b] - ay)
+
+    # the first triangle needs three points that aren't collinear
+    a, b = order[0], order[1]
+    c = next((i for i in order[2:] if ccw(a, b, i)), -1)
+    if c < 0:
+        return mesh
+    if ccw(a, b, c) < 0:
+        b, c = c, b
+
+    tri = [a, b, c, b, a, _GHOST, c, b, _GHOST, a, c, _GHOST]
+    adj = [2, 3, 1, 3, 2, 0, 1, 3, 0, 2, 1, 0]
+
+    def replace(t: int, old: int, new: int) -> None:
+        j = 3 * t
+        if adj[j] == old:
+            adj[j] = new
+        elif adj[j + 1] == old:
+            adj[j + 1] = new
+        else:
+            adj[j + 2] = new
+
+    def rotate(t: int, r: int) -> None:
+        """Rotates triangle t so that slot r becomes slot 0."""
+        j = 3 * t
+        tri[j : j + 3] = tri[j + r : j + 3] + tri[j : j + r]
+        adj[j : j + 3] = adj[j + r : j + 3] + adj[j : j + r]
+
+    def is_ghost(t: int) -> bool:
+        j = 3 * t
+        return tri[j] < 0 or tri[j + 1] < 0 or tri[j + 2] < 0
+
+    def split(t: int, p: int) -> list[int]:
+        """Splits t into three triangles around p."""
+        j = 3 * t
+        a, b, c = tri[j : j + 3]
+        na, nb, nc = adj[j : j + 3]
+        t1 = len(tri) // 3
+        t2 = t1 + 1
+        tri[j : j + 3] = (a, b, p)
+        adj[j : j + 3] = (t1, t2, nc)
+        tri.extend((b, c, p, c, a, p))
+        adj.extend((t2, t, na, t, t1, nb))
+        replace(na, t, t1)
+        replace(nb, t, t2)
+        return [t, t1, t2]
+
+    def split_edge(t: int, p: int) -> list[int]:
+        """Splits t and its neighbour across the edge opposite slot 2,
+        which p lies on, into four triangles around p."""
+        i = 3 * t
+        a, b, c = tri[i : i + 3]
+        ta, tb, n = adj[i : i + 3]
+        j = 3 * n
+        k = 0 if adj[j] == t else 1 if adj[j + 1] == t else 2
+        rotate(n, k)
+        d = tri[j]
+        _, nb, na = adj[j : j + 3]
+        t1 = len(tri) // 3
+        n1 = t1 + 1
+        tri[i : i + 3] = (c, a, p)
+        adj[i : i + 3] = (n, t1, tb)
+        tri[j : j + 3] = (a, d, p)
+        adj[j : j + 3] = (n1, t, nb)
+        tri.extend((b, c, p, d, b, p))
+        adj.extend((t, n1, ta, t1, n, na))
+        replace(ta, t, t1)
+        replace(na, n, n1)
+        return [t, t1, n, n1]
+
+    def legalize(stack: list[int], p: int) -> None:
+        """Flips the edges opposite p until they are locally Delaunay."""
+        px, py = xs[p], ys[p]
+        while stack:
+            t = stack.pop()
+            i = 3 * t
+            u, v = tri[i], tri[i + 1]
+            n = adj[i + 2]
+            j = 3 * n
+            k = 0 if adj[j] == t else 1 if adj[j + 1] == t else 2
+            w = tri[j + k]
+
+            if u < 0:
+                illegal = ccw(v, w, p) < 0
+            elif v < 0:
+                illegal = ccw(w, u, p) < 0
+            elif w < 0:
+                illegal = False
+            else:
+                # the same test as Point.incircle on raw coordinates
+                ax, ay = xs[v] - px, ys[v] - py
+                bx, by = xs[u] - px, ys[u] - py
+                cx, cy = xs[w] - px, ys[w] - py
+                illegal = (
+                    (ax * ax + ay * ay) * (bx * cy - cx * by)
+                    - (bx * bx + by * by) * (ax * cy - cx * ay)
+                    + (cx * cx + cy * cy) * (ax * by - bx * ay)
+                ) > 0
+            if not illegal:
+                continue
+
+            k1, k2 = (k + 1) % 3, (k + 2) % 3
+            n_uw, n_wv = adj[j + k1], adj[j + k2]
+            t_vp, t_pu = adj[i], adj[i + 1]
+            tri[i : i + 3] = (u, w, p)
+            adj[i : i + 3] = (n, t_pu, n_uw)
+            tri[j : j + 3] = (w, v, p)
+            adj[j : j + 3] = (t_vp, t, n_wv)
+            replace(n_uw, n, t)
+            replace(t_vp, t, n)
+            stack.append(t)
+            stack.append(n)
+
+    last = 0
+    for p in order:
+        if p == a or p == b or p == c:
+            continue
+
+        # walk towards p, never straight back across the edge just crossed
+        t, previous = last, -1
+        while True:
+            i = 3 * t
+            u, v, w = tri[i], tri[i + 1], tri[i + 2]
+            if adj[i + 2] != previous and ccw(u, v, p) < 0:
+                step = adj[i + 2]
+            elif adj[i] != previous and ccw(v, w, p) < 0:
+                step = adj[i]
+            elif adj[i + 1] != previous and ccw(w, u, p) < 0:
+                step = adj[i + 1]
+            else:
+                break
+            previous, t = t, step
+            if is_ghost(t):
+                break
+
+        if is_ghost(t):
+            created = split(t, p)
+        else:
+            i = 3 * t
+            u, v, w = tri[i : i + 3]
+            on_edge = [ccw(v, w, p) == 0, ccw(w, u, p) == 0, ccw(u, v, p) == 0]
+            if any(on_edge):
+                rotate(t, (on_edge.index(True) + 1) % 3)
+                created = split_edge(t, p)
+            else:
+                created = split(t, p)
+
+        last = created[0]
+        legalize(list(created), p)
+        if is_ghost(last):
+            last = next(t for t in created if not is_ghost(t))
+
+    # drop the triangles at infinity and renumber the rest
+    count = len(tri) // 3
+    renumber = array("i", [-1]) * count
+    real = 0
+    for t in range(count):
+        if not is_ghost(t):
+            renumber[t] = real
+            real += 1
+
+    for t in range(count):
+        if renumber[t] >= 0:
+            i = 3 * t
+            mesh.triangles.extend(tri[i : i + 3])
+            mesh.neighbours.extend(renumber[n] for n in adj[i : i + 3])
+    return mesh
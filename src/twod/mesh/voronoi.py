@@ -0,0 +1,162 @@
+"""Voronoi diagrams for humans™"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from .._coords import bounds as rect_bounds
+from .._coords import columns
+from ..clip import _box, _halfplane
+from ..polygon import Polygon
+from .delaunay import _triangulate
+
+
+def _collinear_cells(
+    xs: list[float],
+    ys: list[float],
+    box: tuple[float, float, float, float],
+) -> list[Polygon]:
+    """Returns the cells of sites that all lie on one line, the strips
+    between the perpendicular bisectors of neighbouring sites."""
+    x0, y0, x1, y1 = box
+    sites = sorted(set(zip(xs, ys)))
+    strips: dict[tuple[float, float], tuple[list[float], list[float]]] = {}
+    for k, (sx, sy) in enumerate(sites):
+        cx, cy = [x0, x1, x1, x0], [y0, y0, y1, y1]
+        for ox, oy in sites[max(0, k - 1) : k] + sites[k + 1 : k + 2]:
+            # keep the side of the bisector nearer to the site
+            cx, cy = _halfplane(
+                cx,
+                cy,
+                ox - sx,
+                oy - sy,
+                (ox * ox + oy * oy - sx * sx - sy * sy) / 2,
+            )
+        strips[(sx, sy)] = (cx, cy)
+    return [Polygon.from_arrays(*strips[site]) for site in zip(xs, ys)]
+
+
+def voronoi(points: Iterable[Any], bounds: Any) -> list[Polygon]:
+    """Returns the Voronoi cell of each of points clipped to bounds.
+
+    The cell of a site is the region closer to it than to any other
+    site. Cells are read off the Delaunay triangulation: the corners of
+    a site's cell are the circumcenters of the triangles around it, in
+    counter clock-wise order. Cells of sites on the hull are unbounded
+    and are closed off far outside bounds before clipping. Only cells
+    crossing the edges of bounds are clipped.
+
+    The result is a list of Polygons in the same order as points, each
+    backed by two arrays of doubles. Repeated sites get equal cells,
+    and sites whose cells miss bounds get empty polygons.
+
+    >>> cells = voronoi([Point(1, 1), Point(3, 1)], Rect(0, 0, 4, 2))
+    >>> cells[0].area, cells[1].area
+    (4.0, 4.0)
+
+    :param points: Iterable of points, a PointArray or a packed buffer
+    :param bounds: Rect, CRect or (x, y, w, h)
+    :return: list of Polygon
+    """
+    xs, ys = columns(points)
+    box = rect_bounds(bounds)
+    x0, y0, x1, y1 = box
+    n = len(xs)
+
+    mesh = _triangulate(xs, ys)
+    if not len(mesh):
+        return _collinear_cells(xs, ys, box) if n else []
+
+    triangles, neighbours = mesh.triangles, mesh.neighbours
+    count = len(mesh)
+
+    # circumcenters, and a triangle around each vertex
+    ccx, ccy = array("d", bytes(8 * count)), array("d", bytes(8 * count))
+    around = array("i", [-1]) * n
+    for t in range(count):
+        a, b, c = triangles[3 * t : 3 * t + 3]
+        ax, ay = xs[a], ys[a]
+        bx, by = xs[b] - ax, ys[b] - ay
+        cx, cy = xs[c] - ax, ys[c] - ay
+        d = 2 * (bx * cy - by * cx)
+        b2, c2 = bx * bx + by * by, cx * cx + cy * cy
+        ccx[t] = ax + (cy * b2 - by * c2) / d
+        ccy[t] = ay + (bx * c2 - cx * b2) / d
+        around[a] = around[b] = around[c] = t
+
+    diagonal = math.hypot(x1 - x0, y1 - y0) + 1.0
+    mx, my = (x0 + x1) / 2, (y0 + y1) / 2
+
+    cells: dict[int, Polygon] = {}
+    first: dict[tuple[float, float], int] = {}
+    for v in range(n):
+        t = around[v]
+        if t < 0:
+            continue
+        first[(xs[v], ys[v])] = v
+
+        # turn clockwise to the hull, or all the way around
+        start = t
+        while True:
+            j = 3 * t
+            k = 0 if triangles[j] == v else 1 if triangles[j + 1] == v else 2
+            previous = neighbours[j + (k + 2) % 3]
+            if previous < 0 or previous == start:
+                break
+            t = previous
+
+        cx, cy = [], []
+        start = t
+        while True:
+            cx.append(ccx[t])
+            cy.append(ccy[t])
+            j = 3 * t
+            k = 0 if triangles[j] == v else 1 if triangles[j + 1] == v else 2
+            following = neighbours[j + (k + 1) % 3]
+            if following < 0 or following == start:
+                break
+            t = following
+
+        vx, vy = xs[v], ys[v]
+        if following < 0:
+            # rays out through the hull edges on either side of v
+            j = 3 * t
+            last = triangles[j + (k + 2) % 3]
+            lx, ly = vy - ys[last], xs[last] - vx
+            j = 3 * start
+            k = 0 if triangles[j] == v else 1 if triangles[j + 1] == v else 2
+            after = triangles[j + (k + 1) % 3]
+            fx, fy = ys[after] - vy, vx - xs[after]
+
+            lr, fr = math.hypot(lx, ly), math.hypot(fx, fy)
+            lx, ly, fx, fy = lx / lr, ly / lr, fx / fr, fy / fr
+            # far enough out that the cap is well clear of bounds
+            far = 4 * (
+                diagonal
+                + math.hypot(vx - mx, vy - my)
+                + max(
+                    math.hypot(cx[0] - vx, cy[0] - vy),
+                    math.hypot(cx[-1] - vx, cy[-1] - vy),
+                )
+            )
+            ox, oy = lx + fx, ly + fy
+            r = 2 * far / (math.hypot(ox, oy) or 1.0)
+            cx.extend((cx[-1] + lx * far, vx + ox * r, cx[0] + fx * far))
+            cy.extend((cy[-1] + ly * far, vy + oy * r, cy[0] + fy * far))
+
+        if not (x0 <= min(cx) and max(cx) <= x1 and y0 <= min(cy) and max(cy) <= y1):
+            cx, cy = _box(cx, cy, box)
+        cells[v] = Polygon.from_arrays(cx, cy)
+
+    result = []
+    for v in range(n):
+        polygon = cells.get(v)
+        if polygon is None:
+            site = first.get((xs[v], ys[v]))
+            polygon = cells[site] if site is not None else Polygon()
+            polygon = Polygon.from_arrays(polygon.x, polygon.y)
+        result.append(polygon)
+    return result
@@ -5,7 +5,7 @@ from __future__ import annotations
 import math
 import operator
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from .constants import EPSILON_EXP_MINUS_1, Quadrant
 from .exceptions import ColinearPoints
@@ -49,6 +49,48 @@ class Point:
             point += translate
         return point
 
+    @classmethod
+    def from_polar_many(
+        cls,
+        radii: Iterable[float],
+        thetas: Iterable[float],
+        is_radians: bool = True,
+        translate: Point | None = None,
+    ) -> list[Point]:
+        """Returns a list of Points with polar coordinates (R, ϴ) taken
+        pairwise from radii and thetas.
+
+        Equivalent to calling from_polar for each pair, but the argument
+        handling and translation lookup are done once per batch instead
+        of once per point.
+
+        :param radii: Iterable[float], an array or list of radii
+        :param thetas: Iterable[float], an array or list of angles
+        :param bool is_radians:
+        :param translate: Point or (x, y) added to every point
+        :return: list[Point]
+        """
+        if hasattr(radii, "tolist"):
+            radii = radii.tolist()
+        if hasattr(thetas, "tolist"):
+            thetas = thetas.tolist()
+        if not is_radians:
+            thetas = map(math.radians, thetas)
+
+        cos, sin, ndigits = math.cos, math.sin, EPSILON_EXP_MINUS_1
+
+        if not translate:
+            return [
+                cls(round(r * cos(t), ndigits), round(r * sin(t), ndigits))
+                for r, t in zip(radii, thetas)
+            ]
+
+        tx, ty, *_ = translate
+        return [
+            cls(round(r * cos(t), ndigits) + tx, round(r * sin(t), ndigits) + ty)
+            for r, t in zip(radii, thetas)
+        ]
+
     @property
     def is_origin(self) -> bool:
         """True if and only if x == 0 and y == 0."""
@@ -177,7 +219,7 @@ class Point:
                 f"Expected a Iterable[int | float], got {new_values!r}"
             ) from None
 
-    def __iter__(self) -> Iterable[float]:
+    def __iter__(self) -> Iterator[float]:
         """An iterator over x and y coordinates."""
         return iter(self.xy)
 
@@ -394,6 +436,31 @@ class Point:
         # EJO ccw can raise IndexError if len(b)|len(c) < 2
         return self.ccw(b, c) == 0
 
+    def incircle(self, b: Point, c: Point, d: Point) -> float:
+        """Return a floating point value indicating where d lies with
+        respect to the circle through the points [self, b, c].
+
+        If [self, b, c] has counter clock-wise winding:
+        If incircle > 0,  d is inside the circle
+        If incircle < 0,  d is outside the circle
+        If incircle == 0, d is on the circle
+
+        The signs are reversed if [self, b, c] winds clock-wise.
+
+        :param b: Point
+        :param c: Point
+        :param d: Point
+        :return: float
+        """
+        ax, ay = self.x - d.x, self.y - d.y
+        bx, by = b.x - d.x, b.y - d.y
+        cx, cy = c.x - d.x, c.y - d.y
+        return (
+            (ax * ax + ay * ay) * (bx * cy - cx * by)
+            - (bx * bx + by * by) * (ax * cy - cx * ay)
+            + (cx * cx + cy * cy) * (ax * by - bx * ay)
+        )
+
     def midpoint(self, other: Optional[Point] = None) -> Point:
         """Return a new Point midway between self and other..
 
@@ -435,7 +502,7 @@ class Point:
         :return: bool
         """
 
-        # XXX re-implement with ccw and a list of points instead of a pair
+        # see Polygon.contains for points inside arbitrary polygons
 
         i = min(p.x, q.x) < self.x < max(p.x, q.x)
         j = min(p.y, q.y) < self.y < max(p.y, q.y)
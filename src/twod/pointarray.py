@@ -0,0 +1,314 @@
+"""a struct-of-arrays collection of points for humans™"""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from . import backend
+from .point import Point
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class PointArray:
+    """A sequence of two dimensional points stored as two contiguous
+    arrays of doubles, one for the x coordinates and one for the y
+    coordinates.
+
+    Arithmetic is applied element-wise against a scalar, a Point (or a
+    two item list/tuple) or another PointArray of the same length, without
+    allocating a Point per element.
+
+    The buffers are array('d') or NumPy float64 arrays depending on the
+    twod.backend active when the PointArray is created.
+
+    >>> pa = PointArray([0, 1, 2], [0, 1, 2])
+    >>> (pa + 1)[2]
+    Point(x=3.0, y=3.0)
+    """
+
+    __slots__ = ("_k", "_x", "_y")
+
+    def __init__(
+        self,
+        xs: Iterable[float | int] = (),
+        ys: Iterable[float | int] = (),
+    ) -> None:
+        self._k = backend.kernels()
+        self._x = self._k.floats(xs)
+        self._y = self._k.floats(ys)
+        if len(self._x) != len(self._y):
+            raise ValueError(
+                "Expected equal length coordinates, "
+                f"got {len(self._x)} and {len(self._y)}"
+            )
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point | Iterable[float | int]]) -> PointArray:
+        """Returns a PointArray holding the coordinates of points.
+
+        :param points: Iterable of Point or (x, y) pairs
+        :return: PointArray
+        """
+        xs, ys = [], []
+        for point in points:
+            x, y, *_ = point
+            xs.append(x)
+            ys.append(y)
+        return cls(xs, ys)
+
+    @classmethod
+    def zeros(cls, count: int) -> PointArray:
+        """Returns a PointArray of count points at the origin.
+
+        :param int count:
+        :return: PointArray
+        """
+        result = cls()
+        result._x = result._k.zeros(count)
+        result._y = result._k.zeros(count)
+        return result
+
+    def _new(self, x: Any, y: Any) -> PointArray:
+        """Returns a PointArray sharing this array's kernels that wraps
+        the buffers x and y without copying them."""
+        result = self.__class__.__new__(self.__class__)
+        result._k = self._k
+        result._x = x
+        result._y = y
+        return result
+
+    @property
+    def x(self) -> Any:
+        """The buffer of x coordinates."""
+        return self._x
+
+    @property
+    def y(self) -> Any:
+        """The buffer of y coordinates."""
+        return self._y
+
+    def __repr__(self) -> str:
+        x, y = self._k.tolist(self._x), self._k.tolist(self._y)
+        return f"{self.__class__.__name__}({x!r}, {y!r})"
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def __iter__(self) -> Iterator[Point]:
+        """An iterator over copies of each point."""
+        return map(Point, self._k.tolist(self._x), self._k.tolist(self._y))
+
+    def __getitem__(self, key: int | slice) -> Point | PointArray:
+        """Returns a Point copy for an int key and a new PointArray
+        for a slice key.
+        """
+
+        if isinstance(key, int):
+            return Point(float(self._x[key]), float(self._y[key]))
+
+        if isinstance(key, slice):
+            return self._new(self._k.copy(self._x[key]), self._k.copy(self._y[key]))
+
+        raise TypeError(f"Expected int or slice key, not {key!r}")
+
+    def __setitem__(self, key: int, value: Point | Iterable[float | int]) -> None:
+        if not isinstance(key, int):
+            raise TypeError(f"Expected int key, not {key!r}")
+        x, y, *_ = value
+        self._x[key] = x
+        self._y[key] = y
+
+    def __eq__(self, other: object) -> bool:
+
+        if isinstance(other, PointArray):
+            return self._k.equal(self._x, other._x) and self._k.equal(self._y, other._y)
+
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(p == q for p, q in zip(self, other))
+
+        return NotImplemented
+
+    def append(self, point: Point | Iterable[float | int]) -> None:
+        """Appends the coordinates of point to the end of this array.
+
+        :param point: Point or (x, y) pair
+        """
+        x, y, *_ = point
+        self._x = self._k.extend(self._x, (x,))
+        self._y = self._k.extend(self._y, (y,))
+
+    def extend(self, points: Iterable[Point | Iterable[float | int]]) -> None:
+        """Appends the coordinates of each of points to this array.
+
+        :param points: Iterable of Point or (x, y) pairs
+        """
+        if not isinstance(points, PointArray):
+            points = PointArray.from_points(points)
+        self._x = self._k.extend(self._x, points._x)
+        self._y = self._k.extend(self._y, points._y)
+
+    def _operands(self, other: Any) -> tuple[Any, Any] | None:
+        """Returns x and y operands, either scalars or buffers matching
+        the length of this array, or None if other is not supported.
+        """
+
+        if isinstance(other, PointArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    f"Expected PointArray of length {len(self)}, got {len(other)}"
+                )
+            return other._x, other._y
+
+        if isinstance(other, Point):
+            return float(other.x), float(other.y)
+
+        if isinstance(other, (list, tuple)):
+            return float(other[0]), float(other[1])
+
+        if isinstance(other, (float, int)):
+            return float(other), float(other)
+
+        return None
+
+    def _op(self, other: Any, op: Callable) -> PointArray:
+        """Applies op to each component of this array and other."""
+
+        operands = self._operands(other)
+        if operands is None:
+            return NotImplemented
+
+        try:
+            return self._new(
+                self._k.binop(op, self._x, operands[0]),
+                self._k.binop(op, self._y, operands[1]),
+            )
+        except ZeroDivisionError:
+            raise ZeroDivisionError(repr(other)) from None
+
+    def _iop(self, other: Any, op: Callable) -> Self:
+        """Updates this array in place by applying op to each component
+        of this array and other."""
+
+        operands = self._operands(other)
+        if operands is None:
+            return NotImplemented
+
+        try:
+            x = self._k.binop(op, self._x, operands[0])
+            y = self._k.binop(op, self._y, operands[1])
+        except ZeroDivisionError:
+            raise ZeroDivisionError(repr(other)) from None
+
+        self._x[:] = x
+        self._y[:] = y
+        return self
+
+    def _rop(self, other: Any, op: Callable) -> PointArray:
+        """Applies op to each component of other and this array."""
+        return self._op(other, lambda a, b: op(b, a))
+
+    def __add__(self, other: Any) -> PointArray:
+        return self._op(other, operator.add)
+
+    def __radd__(self, other: Any) -> PointArray:
+        return self._op(other, operator.add)
+
+    def __iadd__(self, other: Any) -> Self:
+        return self._iop(other, operator.add)
+
+    def __sub__(self, other: Any) -> PointArray:
+        return self._op(other, operator.sub)
+
+    def __rsub__(self, other: Any) -> PointArray:
+        return self._rop(other, operator.sub)
+
+    def __isub__(self, other: Any) -> Self:
+        return self._iop(other, operator.sub)
+
+    def __mul__(self, other: Any) -> PointArray:
+        return self._op(other, operator.mul)
+
+    def __rmul__(self, other: Any) -> PointArray:
+        return self._op(other, operator.mul)
+
+    def __imul__(self, other: Any) -> Self:
+        return self._iop(other, operator.mul)
+
+    def __truediv__(self, other: Any) -> PointArray:
+        return self._op(other, operator.truediv)
+
+    def __itruediv__(self, other: Any) -> Self:
+        return self._iop(other, operator.truediv)
+
+    def __floordiv__(self, other: Any) -> PointArray:
+        return self._op(other, operator.floordiv)
+
+    def __ifloordiv__(self, other: Any) -> Self:
+        return self._iop(other, operator.floordiv)
+
+    def __pow__(self, exponent: float) -> PointArray:
+        return self._op(exponent, operator.pow)
+
+    def __ipow__(self, exponent: float) -> Self:
+        return self._iop(exponent, operator.pow)
+
+    def __abs__(self) -> PointArray:
+        return self._new(self._k.unop(abs, self._x), self._k.unop(abs, self._y))
+
+    def __neg__(self) -> PointArray:
+        return self._new(
+            self._k.unop(operator.neg, self._x),
+            self._k.unop(operator.neg, self._y),
+        )
+
+    @property
+    def radius(self) -> Any:
+        """The distance from each point to the origin."""
+        return self._k.hypot(self._x, self._y)
+
+    @property
+    def radians(self) -> Any:
+        """The angle of each point in radians measured counter-clockwise
+        from 3 o'clock."""
+        return self._k.atan2(self._y, self._x)
+
+    def distance_squared(self, other: Point | None = None) -> Any:
+        """Returns a buffer of squared distances between each point and
+        other.
+
+        If other is not given, the squared distances to the origin are
+        returned.
+
+        :param other: Point
+        :return: buffer of floats
+        """
+        x, y = (0.0, 0.0) if other is None else tuple(other)[:2]
+        return self._k.distance_squared(self._x, self._y, x, y)
+
+    def between(self, p: Point, q: Point) -> Any:
+        """Returns a mask which is True for each point bounded by the
+        points [p, q], see Point.between.
+
+        :param p: Point
+        :param q: Point
+        :return: sequence of bool
+        """
+        return self._k.bounded(
+            self._x, self._y, (p[0], p[1]), (q[0], q[1]), operator.le
+        )
+
+    def inside(self, p: Point, q: Point) -> Any:
+        """Returns a mask which is True for each point bounded by the
+        points (p, q), see Point.inside.
+
+        :param p: Point
+        :param q: Point
+        :return: sequence of bool
+        """
+        return self._k.bounded(
+            self._x, self._y, (p[0], p[1]), (q[0], q[1]), operator.lt
+        )
@@ -0,0 +1,202 @@
+"""a simple polygon for humans™"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from ._coords import columns, xy
+from ._vertices import _Vertices
+from .constants import Winding
+from .point import Point
+from .rect import Rect
+
+
+class Polygon(_Vertices):
+    """A polygon with vertices stored in two flat arrays of doubles.
+
+    The polygon is closed implicitly, the last vertex connects back to
+    the first. Bounds, area, centroid, orientation and the edge table
+    used by contains_many() are computed when first needed and cached
+    until the vertices are changed.
+
+    Containment uses the non-zero winding rule with half-open edges, so
+    a point on an edge shared by two adjacent polygons is inside exactly
+    one of them.
+
+    >>> square = Polygon([Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)])
+    >>> square.contains(Point(1, 1))
+    True
+    >>> square.area
+    4.0
+    """
+
+    __slots__ = ("_area", "_bounds", "_centroid", "_edges")
+
+    def _invalidate(self) -> None:
+        self._bounds: tuple[float, float, float, float] | None = None
+        self._area: float | None = None
+        self._centroid: tuple[float, float] | None = None
+        self._edges: tuple | None = None
+
+    def _extent(self) -> tuple[float, float, float, float]:
+        if self._bounds is None:
+            if not self._x:
+                self._bounds = (0.0, 0.0, 0.0, 0.0)
+            else:
+                self._bounds = (min(self._x), min(self._y), max(self._x), max(self._y))
+        return self._bounds
+
+    @property
+    def bounds(self) -> Rect:
+        """The smallest Rect containing every vertex."""
+        x0, y0, x1, y1 = self._extent()
+        return Rect(x0, y0, x1 - x0, y1 - y0)
+
+    def _measure(self) -> tuple[float, tuple[float, float]]:
+        """Returns the signed area and centroid, computing both in one
+        pass over the vertices when either is first needed."""
+        if self._area is None or self._centroid is None:
+            xs, ys = self._x, self._y
+            twice = 0.0
+            cx = cy = 0.0
+            n = len(xs)
+            for i in range(n):
+                x0, y0 = xs[i - 1], ys[i - 1]
+                x1, y1 = xs[i], ys[i]
+                cross = x0 * y1 - x1 * y0
+                twice += cross
+                cx += (x0 + x1) * cross
+                cy += (y0 + y1) * cross
+            self._area = twice / 2
+            if twice:
+                self._centroid = (cx / (3 * twice), cy / (3 * twice))
+            elif n:
+                self._centroid = (sum(xs) / n, sum(ys) / n)
+            else:
+                self._centroid = (0.0, 0.0)
+        return (self._area, self._centroid)
+
+    @property
+    def signed_area(self) -> float:
+        """The area of the polygon, positive if its vertices wind
+        counter clock-wise and negative if they wind clock-wise."""
+        return self._measure()[0]
+
+    @property
+    def area(self) -> float:
+        """The area of the polygon."""
+        return abs(self.signed_area)
+
+    @property
+    def centroid(self) -> Point:
+        """The center of mass of the polygon, or the mean of its
+        vertices if it has no area."""
+        return Point(*self._measure()[1])
+
+    @property
+    def orientation(self) -> Winding:
+        """The winding direction of the vertices, Winding.Colinear if
+        the polygon has no area."""
+        area = self.signed_area
+        if area > 0:
+            return Winding.CCW
+        if area < 0:
+            return Winding.CW
+        return Winding.Colinear
+
+    def winding_number(self, point: Any) -> int:
+        """Returns the number of times the polygon winds counter
+        clock-wise around point, negative for clock-wise.
+
+        :param point: Point, CPoint or (x, y)
+        :return: int
+        """
+        px, py = xy(point)
+        x0, y0, x1, y1 = self._extent()
+        if not self._x or not (x0 <= px <= x1 and y0 <= py <= y1):
+            return 0
+
+        xs, ys = self._x, self._y
+        winding = 0
+        ax, ay = xs[-1], ys[-1]
+        for bx, by in zip(xs, ys):
+            if ay <= py:
+                if by > py and (bx - ax) * (py - ay) - (px - ax) * (by - ay) > 0:
+                    winding += 1
+            elif by <= py and (bx - ax) * (py - ay) - (px - ax) * (by - ay) < 0:
+                winding -= 1
+            ax, ay = bx, by
+        return winding
+
+    def contains(self, point: Any) -> bool:
+        """Returns True if point is inside the polygon.
+
+        :param point: Point, CPoint or (x, y)
+        :return: bool
+        """
+        return self.winding_number(point) != 0
+
+    def _edge_table(self) -> tuple:
+        """Returns the non-horizontal edges bucketed into horizontal bands.
+
+        Each edge is stored as (y_lo, y_hi, x, y, dx/dy, direction), so
+        the x where it crosses a given y is one multiply and add away.
+        """
+        if self._edges is not None:
+            return self._edges
+
+        xs, ys = self._x, self._y
+        edges = []
+        for ax, ay, bx, by in zip(xs[-1:] + xs[:-1], ys[-1:] + ys[:-1], xs, ys):
+            if ay != by:
+                edges.append(
+                    (
+                        min(ay, by),
+                        max(ay, by),
+                        ax,
+                        ay,
+                        (bx - ax) / (by - ay),
+                        1 if by > ay else -1,
+                    )
+                )
+
+        _, y0, _, y1 = self._extent()
+        count = max(1, len(edges))
+        scale = count / (y1 - y0) if y1 > y0 else 0.0
+        bands: list[list[tuple]] = [[] for _ in range(count)]
+        for edge in edges:
+            first = min(count - 1, int((edge[0] - y0) * scale))
+            last = min(count - 1, int((edge[1] - y0) * scale))
+            for band in range(first, last + 1):
+                bands[band].append(edge)
+
+        self._edges = (y0, scale, count, bands)
+        return self._edges
+
+    def contains_many(self, points: Iterable[Any]) -> list[bool]:
+        """Returns whether each of points is inside the polygon.
+
+        Edges are prepared once and bucketed by height, so each point
+        is only tested against the few edges spanning its y coordinate.
+
+        :param points: Iterable of points, a PointArray or a packed buffer
+        :return: list of bool
+        """
+        pxs, pys = columns(points)
+        x0, y0, x1, y1 = self._extent()
+        origin, scale, count, bands = self._edge_table()
+        last = count - 1
+
+        found = []
+        for px, py in zip(pxs, pys):
+            if not (x0 <= px <= x1 and y0 <= py <= y1):
+                found.append(False)
+                continue
+            winding = 0
+            band = min(int((py - origin) * scale), last)
+            for lo, hi, ex, ey, slope, direction in bands[band]:
+                if lo <= py < hi and px < ex + (py - ey) * slope:
+                    winding += direction
+            found.append(winding != 0)
+        return found
@@ -0,0 +1,143 @@
+"""an open polyline for humans™"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_right
+from typing import Any
+
+from . import backend
+from ._coords import xy
+from ._vertices import _Vertices
+from .point import Point
+from .pointarray import PointArray
+
+
+class Polyline(_Vertices):
+    """A path through a sequence of vertices stored in two flat arrays
+    of doubles.
+
+    The cumulative length of the path at each vertex is computed once
+    when first needed and cached until the vertices are changed, so
+    finding the point a given distance along the path is a binary search
+    over the segments rather than a walk along them.
+
+    >>> path = Polyline([Point(0, 0), Point(3, 0), Point(3, 4)])
+    >>> path.length
+    7.0
+    >>> path.point_at_distance(5)
+    Point(x=3.0, y=2.0)
+    """
+
+    __slots__ = ("_lengths",)
+
+    def _invalidate(self) -> None:
+        self._lengths: array | None = None
+
+    def append(self, point: Any) -> None:
+        """Adds point as the last vertex, extending the cached lengths
+        rather than discarding them.
+
+        :param point: Point, CPoint or (x, y)
+        """
+        x, y = xy(point)
+        if self._lengths is not None and self._x:
+            self._lengths.append(
+                self._lengths[-1] + math.hypot(x - self._x[-1], y - self._y[-1])
+            )
+        elif self._lengths is not None:
+            self._lengths.append(0.0)
+        self._x.append(x)
+        self._y.append(y)
+
+    @property
+    def lengths(self) -> memoryview:
+        """A read-only view of the length of the path from the first
+        vertex to each vertex, starting with 0.0."""
+        return memoryview(self._measure()).toreadonly()
+
+    def _measure(self) -> array:
+        """Returns the cached cumulative lengths, computing them when
+        first needed."""
+        if self._lengths is None:
+            xs, ys = self._x, self._y
+            lengths = array("d", bytes(8 * len(xs)))
+            total = 0.0
+            for i in range(1, len(xs)):
+                total += math.hypot(xs[i] - xs[i - 1], ys[i] - ys[i - 1])
+                lengths[i] = total
+            self._lengths = lengths
+        return self._lengths
+
+    @property
+    def length(self) -> float:
+        """The total length of the path."""
+        lengths = self._measure()
+        return lengths[-1] if lengths else 0.0
+
+    def point_at_distance(self, distance: float) -> Point:
+        """Returns the point distance along the path from its first
+        vertex, clamped to the ends of the path.
+
+        Raises ValueError if the polyline has no vertices.
+
+        :param float distance:
+        :return: Point
+        """
+        lengths = self._measure()
+        n = len(lengths)
+        if not n:
+            raise ValueError("Polyline has no vertices")
+        if n == 1:
+            return Point(self._x[0], self._y[0])
+
+        i = min(max(bisect_right(lengths, distance) - 1, 0), n - 2)
+        start, span = lengths[i], lengths[i + 1] - lengths[i]
+        t = min(max((distance - start) / span, 0.0), 1.0) if span else 0.0
+        xs, ys = self._x, self._y
+        return Point(xs[i] + (xs[i + 1] - xs[i]) * t, ys[i] + (ys[i + 1] - ys[i]) * t)
+
+    def point_at_fraction(self, t: float) -> Point:
+        """Returns the point the fraction t of the way along the path,
+        where 0 is the first vertex and 1 is the last.
+
+        Raises ValueError if the polyline has no vertices.
+
+        :param float t:
+        :return: Point
+        """
+        return self.point_at_distance(t * self.length)
+
+    def resample(self, count: int) -> PointArray:
+        """Returns count points spaced evenly along the path, including
+        both of its ends.
+
+        Every sample is located in one batched pass with the active
+        twod.backend kernels.
+
+        Raises ValueError if count is negative or the polyline has no
+        vertices.
+
+        :param int count:
+        :return: PointArray
+        """
+        if count < 0:
+            raise ValueError(f"Expected a non-negative count, got {count}")
+        if not count:
+            return PointArray()
+        if not self._x:
+            raise ValueError("Polyline has no vertices")
+        if len(self._x) == 1:
+            return PointArray([self._x[0]] * count, [self._y[0]] * count)
+
+        length = self.length
+        step = length / (count - 1) if count > 1 else 0.0
+        k = backend.kernels()
+        xs, ys = k.along(
+            k.floats(self._x),
+            k.floats(self._y),
+            k.floats(self._measure()),
+            k.floats(i * step for i in range(count)),
+        )
+        return PointArray(xs, ys)
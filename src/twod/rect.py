@@ -5,9 +5,60 @@ from __future__ import annotations
 import operator
 from typing import Callable
 
+from .line import Line
 from .point import Point
 
 
+def _liang_barsky(
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+    box: tuple[float, float, float, float],
+) -> tuple[float, float, float, float] | None:
+    """Returns the part of the segment (x0, y0)-(x1, y1) inside box, or
+    None if it misses box."""
+    bx0, by0, bx1, by1 = box
+    dx, dy = x1 - x0, y1 - y0
+    t0, t1 = 0.0, 1.0
+    side0 = side1 = -1
+    for side, p, q in (
+        (0, -dx, x0 - bx0),
+        (1, dx, bx1 - x0),
+        (2, -dy, y0 - by0),
+        (3, dy, by1 - y0),
+    ):
+        if not p:
+            if q < 0:
+                return None
+            continue
+        r = q / p
+        if p < 0:
+            if r > t1:
+                return None
+            if r > t0:
+                t0, side0 = r, side
+        else:
+            if r < t0:
+                return None
+            if r < t1:
+                t1, side1 = r, side
+
+    # endpoints moved onto a side are put exactly on it
+    edges = (bx0, bx1, by0, by1)
+    if side0 >= 0:
+        if side0 < 2:
+            x0, y0 = edges[side0], y0 + t0 * dy
+        else:
+            x0, y0 = x0 + t0 * dx, edges[side0]
+    if side1 >= 0:
+        if side1 < 2:
+            x1, y1 = edges[side1], y1 - (1 - t1) * dy
+        else:
+            x1, y1 = x1 - (1 - t1) * dx, edges[side1]
+    return (x0, y0, x1, y1)
+
+
 class Rect:
     """A rectangle specified by an origin at (x,y) and
     dimensions (w,h).
@@ -159,6 +210,24 @@ class Rect:
 
         return any(v in self for v in other.vertices)
 
+    def clip_line(self, line: Line) -> Line | None:
+        """Returns the part of line inside this rectangle, or None if
+        the line misses it. Lines touching an edge are kept.
+
+        See twod.clip.clip_lines to clip many lines at once.
+
+        :param line: Line
+        :return: Line or None
+        """
+        x0, x1 = sorted((self.x, self.x + self.w))
+        y0, y1 = sorted((self.y, self.y + self.h))
+        clipped = _liang_barsky(
+            line.start.x, line.start.y, line.end.x, line.end.y, (x0, y0, x1, y1)
+        )
+        if clipped is None:
+            return None
+        return Line(Point(*clipped[:2]), Point(*clipped[2:]))
+
     def _op(self, other: Point | Rect, op: Callable) -> Rect:
         x = op(self.x, other.x)
         y = op(self.y, other.y)
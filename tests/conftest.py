@@ -2,9 +2,17 @@
 """
 
 import pytest
-from twod import Point
+from twod import Point, backend
 
 
 @pytest.fixture()
 def point():
     return Point()
+
+
+@pytest.fixture(params=backend.available())
+def kernels(request):
+    """Runs a test once for each twod.backend usable here."""
+    previous = backend.kernels()
+    yield backend.use(request.param)
+    backend._kernels = previous
@@ -0,0 +1,67 @@
+"""testing closest_pair like a human™"""
+
+import math
+import random
+from array import array
+
+import pytest
+
+from twod import CPoint, Point, PointArray
+from twod.algorithms import closest_pair
+
+
+def brute_distance(points):
+    return min(
+        math.dist(points[i], points[j])
+        for i in range(len(points))
+        for j in range(i + 1, len(points))
+    )
+
+
+@pytest.mark.parametrize("points", [[], [Point(1, 1)]])
+def test_closest_pair_too_few(points) -> None:
+    with pytest.raises(ValueError):
+        closest_pair(points)
+
+
+@pytest.mark.parametrize(
+    "points, expected",
+    [
+        ([Point(0, 0), Point(3, 4)], (0, 1, 5.0)),
+        ([Point(0, 0), Point(5, 5), Point(1, 1), Point(5, 6)], (1, 3, 1.0)),
+        ([Point(2, 2), Point(0, 0), Point(2, 2)], (0, 2, 0.0)),
+        ([Point(0, 0), Point(0, 10), Point(0, 3), Point(0, 4.5)], (2, 3, 1.5)),
+    ],
+)
+def test_closest_pair_simple(points, expected) -> None:
+    assert closest_pair(points) == expected
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [CPoint(0, 0), CPoint(5, 5), CPoint(1, 1), CPoint(5, 6)],
+        [(0, 0), (5, 5), (1, 1), (5, 6)],
+        PointArray([0, 5, 1, 5], [0, 5, 1, 6]),
+        array("d", [0, 0, 5, 5, 1, 1, 5, 6]),
+    ],
+)
+def test_closest_pair_accepts(points) -> None:
+    assert closest_pair(points) == (1, 3, 1.0)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_closest_pair_brute_force(seed) -> None:
+    rng = random.Random(seed)
+    points = [(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(150)]
+    i, j, distance = closest_pair(points)
+    assert i < j
+    assert distance == pytest.approx(math.dist(points[i], points[j]))
+    assert distance == pytest.approx(brute_distance(points))
+
+
+def test_closest_pair_integer_grid_ties() -> None:
+    points = [(x, y) for x in range(10) for y in range(10)]
+    i, j, distance = closest_pair(points)
+    assert distance == 1.0
+    assert math.dist(points[i], points[j]) == 1.0
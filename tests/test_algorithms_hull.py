@@ -0,0 +1,92 @@
+"""testing convex_hull like a human™"""
+
+import random
+from array import array
+
+import pytest
+
+from twod import CPoint, CPointArray, Point, PointArray
+from twod.algorithms import convex_hull
+
+SQUARE = [(0, 0), (2, 0), (1, 1), (2, 2), (0, 2), (1, 0), (0, 0)]
+
+
+def brute_hull(points):
+    """Corners of the hull: ends of every directed edge with no point to
+    its right and no point beyond its ends on its line."""
+    unique = set(points)
+    if len(unique) == 1:
+        return unique
+    corners = set()
+    for a in unique:
+        for b in unique:
+            if a == b:
+                continue
+            for c in unique:
+                ccw = (b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])
+                if ccw < 0:
+                    break
+                if ccw == 0 and not (
+                    min(a[0], b[0]) <= c[0] <= max(a[0], b[0])
+                    and min(a[1], b[1]) <= c[1] <= max(a[1], b[1])
+                ):
+                    break
+            else:
+                corners.update((a, b))
+    return corners
+
+
+@pytest.mark.parametrize(
+    "points, expected",
+    [
+        ([], []),
+        ([(1, 1)], [0]),
+        ([(1, 1), (1, 1)], [0]),
+        ([(0, 0), (1, 1)], [0, 1]),
+        ([(0, 0), (1, 1), (2, 2)], [0, 2]),
+        ([(0, 0), (0, 1), (1, 0)], [0, 2, 1]),
+        (SQUARE, [0, 1, 3, 4]),
+    ],
+)
+def test_convex_hull_simple(points, expected) -> None:
+    assert convex_hull(points) == expected
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [Point(x, y) for x, y in SQUARE],
+        [CPoint(x, y) for x, y in SQUARE],
+        [complex(x, y) for x, y in SQUARE],
+        PointArray([x for x, _ in SQUARE], [y for _, y in SQUARE]),
+        CPointArray(complex(x, y) for x, y in SQUARE),
+        array("d", [v for p in SQUARE for v in p]),
+        [v for p in SQUARE for v in p],
+    ],
+)
+def test_convex_hull_accepts(kernels, points) -> None:
+    assert convex_hull(points) == [0, 1, 3, 4]
+
+
+def test_convex_hull_packed_odd_length() -> None:
+    with pytest.raises(ValueError):
+        convex_hull(array("d", [0, 0, 1]))
+
+
+def test_convex_hull_is_ccw() -> None:
+    rng = random.Random(5)
+    points = [Point(rng.random(), rng.random()) for _ in range(200)]
+    hull = convex_hull(points)
+    for i in range(len(hull)):
+        a, b, c = (points[hull[(i + k) % len(hull)]] for k in range(3))
+        assert a.ccw(b, c) > 0
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("count", [5, 30, 100])
+def test_convex_hull_brute_force(kernels, seed, count) -> None:
+    rng = random.Random(seed)
+    points = [(rng.randint(0, 8), rng.randint(0, 8)) for _ in range(count)]
+    hull = convex_hull(points)
+    assert len(hull) == len({points[i] for i in hull})
+    assert {points[i] for i in hull} == brute_hull(points)
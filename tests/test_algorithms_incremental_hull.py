@@ -0,0 +1,80 @@
+"""testing IncrementalHull like a human™"""
+
+import random
+
+import pytest
+
+from twod import CPoint, Point
+from twod.algorithms import IncrementalHull, convex_hull
+
+
+def corners(points):
+    return {tuple(points[i]) for i in convex_hull(points)}
+
+
+def test_incremental_hull_empty() -> None:
+    hull = IncrementalHull()
+    assert len(hull) == 0
+    assert list(hull) == []
+
+
+def test_incremental_hull_degenerate() -> None:
+    hull = IncrementalHull()
+    assert hull.add(Point(1, 1))
+    assert not hull.add(Point(1, 1))
+    assert hull.add(Point(2, 2))
+    assert not hull.add(Point(1.5, 1.5))
+    assert hull.add(Point(0, 0))
+    assert list(hull) == [Point(0, 0), Point(2, 2)]
+    assert hull.add(Point(3, 3))
+    assert list(hull) == [Point(0, 0), Point(3, 3)]
+    assert hull.add(Point(3, 0))
+    assert list(hull) == [Point(0, 0), Point(3, 0), Point(3, 3)]
+
+
+def test_incremental_hull_is_read_only_sequence() -> None:
+    points = [Point(0, 0), Point(2, 0), Point(0, 2)]
+    hull = IncrementalHull(points)
+    assert hull[0] is points[0]
+    assert hull[-1] is points[2]
+    assert hull[1:] == points[1:]
+    assert points[1] in hull
+    assert hull.index(points[2]) == 2
+    with pytest.raises(TypeError):
+        hull[0] = Point()
+
+
+def test_incremental_hull_rejects_interior_and_edges() -> None:
+    hull = IncrementalHull([Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)])
+    for p in [Point(2, 2), Point(2, 0), Point(4, 1), Point(0, 0), Point(0, 3)]:
+        assert not hull.add(p)
+    assert len(hull) == 4
+
+
+def test_incremental_hull_drops_collinear_vertices() -> None:
+    hull = IncrementalHull([Point(0, 0), Point(2, 0), Point(0, 2)])
+    assert hull.add(Point(4, 0))
+    assert list(hull) == [Point(0, 0), Point(4, 0), Point(0, 2)]
+    assert hull.add(Point(-2, 0))
+    assert list(hull) == [Point(4, 0), Point(0, 2), Point(-2, 0)]
+
+
+def test_incremental_hull_ccw() -> None:
+    rng = random.Random(3)
+    hull = IncrementalHull(Point(rng.random(), rng.random()) for _ in range(500))
+    for i in range(len(hull)):
+        a, b, c = (hull[(i + k) % len(hull)] for k in range(3))
+        assert a.ccw(b, c) > 0
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_incremental_hull_matches_convex_hull(seed) -> None:
+    rng = random.Random(seed)
+    grid = rng.choice([3, 8, 1000])
+    points = []
+    hull = IncrementalHull()
+    for _ in range(120):
+        p = CPoint(rng.randint(0, grid), rng.randint(0, grid))
+        points.append(p)
+        hull.add(p)
+        assert {tuple(q) for q in hull} == corners(points)
@@ -0,0 +1,197 @@
+"""testing segment_intersections like a human™"""
+
+import random
+
+import pytest
+
+from twod import CPoint, Line, Point
+from twod.algorithms import segment_intersections
+
+
+def orientation(p, q, r):
+    value = (q[0] - p[0]) * (r[1] - p[1]) - (r[0] - p[0]) * (q[1] - p[1])
+    return (value > 0) - (value < 0)
+
+
+def on_segment(p, q, r):
+    return min(p[0], q[0]) <= r[0] <= max(p[0], q[0]) and min(p[1], q[1]) <= r[
+        1
+    ] <= max(p[1], q[1])
+
+
+def touches(s, t):
+    (a, b), (c, d) = s, t
+    o1, o2 = orientation(a, b, c), orientation(a, b, d)
+    o3, o4 = orientation(c, d, a), orientation(c, d, b)
+    if o1 != o2 and o3 != o4:
+        return True
+    return (
+        (o1 == 0 and on_segment(a, b, c))
+        or (o2 == 0 and on_segment(a, b, d))
+        or (o3 == 0 and on_segment(c, d, a))
+        or (o4 == 0 and on_segment(c, d, b))
+    )
+
+
+def brute_pairs(segments):
+    return {
+        (i, j)
+        for i in range(len(segments))
+        for j in range(i + 1, len(segments))
+        if touches(segments[i], segments[j])
+    }
+
+
+def found_pairs(segments):
+    return {(i, j) for _, i, j in segment_intersections(segments)}
+
+
+def brute_counts(segments):
+    """How many times each touching pair should be reported: once, or at
+    each distinct end of the shared piece of collinear segments."""
+    counts = {}
+    for i, j in brute_pairs(segments):
+        (a, b), (c, d) = sorted(segments[i]), sorted(segments[j])
+        if orientation(a, b, c) == orientation(a, b, d) == 0:
+            counts[(i, j)] = 1 if max(a, c) == min(b, d) else 2
+        else:
+            counts[(i, j)] = 1
+    return counts
+
+
+@pytest.mark.parametrize(
+    "lines, expected",
+    [
+        ([], []),
+        ([Line(Point(0, 0), Point(1, 1))], []),
+        (
+            [Line(Point(0, 0), Point(2, 2)), Line(Point(0, 2), Point(2, 0))],
+            [(Point(1, 1), 0, 1)],
+        ),
+        (
+            [Line(Point(0, 0), Point(1, 0)), Line(Point(0, 1), Point(1, 1))],
+            [],
+        ),
+        (
+            [Line(Point(0, 0), Point(2, 0)), Line(Point(1, 0), Point(1, 5))],
+            [(Point(1, 0), 0, 1)],
+        ),
+        (
+            [Line(Point(0, 0), Point(1, 1)), Line(Point(1, 1), Point(2, 0))],
+            [(Point(1, 1), 0, 1)],
+        ),
+        (
+            [Line(Point(1, -1), Point(1, 1)), Line(Point(0, 0), Point(2, 0))],
+            [(Point(1, 0), 0, 1)],
+        ),
+    ],
+)
+def test_segment_intersections_simple(lines, expected) -> None:
+    assert segment_intersections(lines) == expected
+
+
+def test_segment_intersections_accepts_pairs() -> None:
+    result = segment_intersections(
+        [((0, 0), (2, 2)), (CPoint(0, 2), CPoint(2, 0))],
+    )
+    assert result == [(Point(1, 1), 0, 1)]
+
+
+def test_segment_intersections_collinear_overlap() -> None:
+    lines = [Line(Point(0, 0), Point(4, 4)), Line(Point(3, 3), Point(1, 1))]
+    result = segment_intersections(lines)
+    assert sorted((p.x, p.y, i, j) for p, i, j in result) == [
+        (1, 1, 0, 1),
+        (3, 3, 0, 1),
+    ]
+
+
+def test_segment_intersections_collinear_only_at_ends() -> None:
+    lines = [((0, 0), (4, 0)), ((1, 0), (5, 0)), ((2, -1), (2, 1))]
+    assert segment_intersections(lines) == [
+        (Point(1.0, 0.0), 0, 1),
+        (Point(2.0, 0.0), 0, 2),
+        (Point(2.0, 0.0), 1, 2),
+        (Point(4.0, 0.0), 0, 1),
+    ]
+
+
+def test_segment_intersections_float_points() -> None:
+    lines = [((0, 0), (2, 0)), ((0, 0), (0, 2)), ((1, -1), (1, 1))]
+    for point, _, _ in segment_intersections(lines):
+        assert type(point.x) is float
+        assert type(point.y) is float
+
+
+def test_segment_intersections_collinear_vertical() -> None:
+    lines = [Line(Point(0, 0), Point(0, 3)), Line(Point(0, 2), Point(0, 5))]
+    result = segment_intersections(lines)
+    assert sorted((p.x, p.y) for p, _, _ in result) == [(0, 2), (0, 3)]
+
+
+def test_segment_intersections_many_through_one_point() -> None:
+    lines = [
+        Line(Point(-1, -1), Point(1, 1)),
+        Line(Point(-1, 1), Point(1, -1)),
+        Line(Point(-1, 0), Point(1, 0)),
+        Line(Point(0, -1), Point(0, 1)),
+    ]
+    result = segment_intersections(lines)
+    assert len(result) == 6
+    assert all(p == Point(0, 0) for p, _, _ in result)
+    assert {(i, j) for _, i, j in result} == {
+        (0, 1),
+        (0, 2),
+        (0, 3),
+        (1, 2),
+        (1, 3),
+        (2, 3),
+    }
+
+
+def test_segment_intersections_points_are_on_both_lines() -> None:
+    rng = random.Random(11)
+    lines = [
+        Line(Point(rng.random(), rng.random()), Point(rng.random(), rng.random()))
+        for _ in range(50)
+    ]
+    for point, i, j in segment_intersections(lines):
+        assert i < j
+        assert lines[i].contains_point(point, tolerance=1e-9)
+        assert lines[j].contains_point(point, tolerance=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(40))
+@pytest.mark.parametrize("grid", [4, 10, 1000])
+def test_segment_intersections_brute_force_integer(seed, grid) -> None:
+    rng = random.Random(seed)
+    segments = [
+        (
+            (rng.randint(0, grid), rng.randint(0, grid)),
+            (rng.randint(0, grid), rng.randint(0, grid)),
+        )
+        for _ in range(rng.randint(2, 40))
+    ]
+    counts = {}
+    for _, i, j in segment_intersections(segments):
+        counts[(i, j)] = counts.get((i, j), 0) + 1
+    assert counts == brute_counts(segments)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_segment_intersections_brute_force_float(seed) -> None:
+    rng = random.Random(seed)
+    segments = [
+        ((rng.random(), rng.random()), (rng.random(), rng.random())) for _ in range(60)
+    ]
+    assert found_pairs(segments) == brute_pairs(segments)
+
+
+def test_segment_intersections_street_grid() -> None:
+    segments = []
+    for i in range(12):
+        for j in range(12):
+            segments.append(((i, j), (i + 1, j)))
+            segments.append(((i, j), (i, j + 1)))
+    segments.extend([((0, 0), (12, 12)), ((0, 12), (12, 0)), ((0, 6), (12, 6))])
+    assert found_pairs(segments) == brute_pairs(segments)
@@ -0,0 +1,113 @@
+"""testing simplify like a human™"""
+
+import math
+import random
+from array import array
+from itertools import pairwise
+
+import pytest
+
+from twod import Line, Point, PointArray
+from twod.algorithms import simplify
+
+
+def trace(count, seed=0):
+    rng = random.Random(seed)
+    x = y = 0.0
+    points = []
+    for _ in range(count):
+        x += rng.random()
+        y += rng.random() - 0.5
+        points.append(Point(x, y))
+    return points
+
+
+def test_simplify_unknown_method() -> None:
+    with pytest.raises(ValueError):
+        simplify([Point(0, 0), Point(1, 1), Point(2, 2)], 1.0, method="rdp")
+
+
+@pytest.mark.parametrize("method", ["dp", "vw"])
+@pytest.mark.parametrize("count", [0, 1, 2])
+def test_simplify_too_few(method, count) -> None:
+    points = [Point(i, i) for i in range(count)]
+    assert simplify(points, 10.0, method=method) == list(range(count))
+
+
+@pytest.mark.parametrize("method", ["dp", "vw"])
+def test_simplify_straight_line(method) -> None:
+    points = [Point(i, 2 * i) for i in range(100)]
+    assert simplify(points, 0.01, method=method) == [0, 99]
+
+
+@pytest.mark.parametrize("method", ["dp", "vw"])
+def test_simplify_drops_collinear(method) -> None:
+    points = [Point(0, 0), Point(1, 0), Point(2, 0), Point(2, 1), Point(2, 2)]
+    assert simplify(points, 1e-12, method=method) == [0, 2, 4]
+
+
+def test_simplify_dp() -> None:
+    points = [Point(0, 0), Point(1, 0.1), Point(2, 0), Point(3, 5)]
+    assert simplify(points, 0.5) == [0, 2, 3]
+    assert simplify(points, 0.05) == [0, 1, 2, 3]
+    assert simplify(points, 10) == [0, 3]
+
+
+@pytest.mark.parametrize("tolerance", [0.1, 0.5, 2.0])
+def test_simplify_dp_within_tolerance(tolerance) -> None:
+    points = trace(500)
+    kept = simplify(points, tolerance)
+    assert kept[0] == 0 and kept[-1] == len(points) - 1
+    assert kept == sorted(set(kept))
+    for a, b in pairwise(kept):
+        line = Line(points[a], points[b])
+        for i in range(a + 1, b):
+            assert line.distance_to_point(points[i]) <= tolerance + 1e-9
+
+
+def test_simplify_dp_closed_loop() -> None:
+    # first and last points coincide, spans measured from a point
+    points = [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1), Point(0, 0)]
+    assert simplify(points, 0.5) == [0, 1, 2, 3, 4]
+    assert simplify(points, 1.2) == [0, 2, 4]
+
+
+def test_simplify_vw() -> None:
+    points = [Point(0, 0), Point(1, 0.1), Point(2, 0), Point(3, 5)]
+    # triangle areas 0.1 at index 1 and 5.0 at index 2
+    assert simplify(points, 0.5, method="vw") == [0, 2, 3]
+    assert simplify(points, 0.05, method="vw") == [0, 1, 2, 3]
+    assert simplify(points, 100, method="vw") == [0, 3]
+
+
+@pytest.mark.parametrize("tolerance", [0.1, 1.0, 5.0])
+def test_simplify_vw_areas(tolerance) -> None:
+    points = trace(500, seed=1)
+    kept = simplify(points, tolerance, method="vw")
+    assert kept[0] == 0 and kept[-1] == len(points) - 1
+    assert kept == sorted(set(kept))
+    # every interior point left spans at least tolerance with its neighbours
+    for a, b, c in zip(kept, kept[1:], kept[2:]):
+        area = abs(points[a].ccw(points[b], points[c])) / 2
+        assert area >= tolerance or math.isclose(area, tolerance)
+    looser = simplify(points, tolerance * 2, method="vw")
+    assert set(looser) <= set(kept)
+
+
+@pytest.mark.parametrize("method", ["dp", "vw"])
+def test_simplify_input_types(method) -> None:
+    points = trace(50, seed=2)
+    expected = simplify(points, 0.3, method=method)
+    xs = [p.x for p in points]
+    ys = [p.y for p in points]
+    packed = array("d", [v for p in points for v in (p.x, p.y)])
+    assert simplify(PointArray(xs, ys), 0.3, method=method) == expected
+    assert simplify(packed, 0.3, method=method) == expected
+    assert simplify(list(zip(xs, ys)), 0.3, method=method) == expected
+
+
+def test_simplify_deep_trace() -> None:
+    # a zig-zag of growing amplitude splits off one point at a time,
+    # deeper than the recursion limit, and every point is kept
+    points = [Point(i, (i % 2) * i * i) for i in range(1500)]
+    assert len(simplify(points, 0.1)) == 1500
@@ -0,0 +1,120 @@
+"""testing union_area like a human™"""
+
+import random
+from array import array
+from itertools import pairwise
+
+import pytest
+
+from twod import CRect, Point, Rect
+from twod.algorithms import union_area, union_outline
+from twod.constants import Winding
+
+
+def brute_area(rects):
+    xs = sorted({v for r in rects for v in (r.x, r.x + r.w)})
+    ys = sorted({v for r in rects for v in (r.y, r.y + r.h)})
+    area = 0.0
+    for x0, x1 in pairwise(xs):
+        for y0, y1 in pairwise(ys):
+            cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+            if any(r.x < cx < r.x + r.w and r.y < cy < r.y + r.h for r in rects):
+                area += (x1 - x0) * (y1 - y0)
+    return area
+
+
+def inside_union(rects, x, y):
+    return any(r.x < x < r.x + r.w and r.y < y < r.y + r.h for r in rects)
+
+
+def check_outline(rects, polygons):
+    """Asserts the polygons trace the boundary of the union of rects."""
+    for polygon in polygons:
+        assert polygon.orientation != Winding.Colinear
+        for a, b in zip(polygon, list(polygon)[1:] + [polygon[0]]):
+            assert a.x == b.x or a.y == b.y
+    rng = random.Random(len(rects))
+    for _ in range(300):
+        x, y = rng.random() * 12 - 1, rng.random() * 12 - 1
+        winding = sum(polygon.winding_number(Point(x, y)) for polygon in polygons)
+        assert winding == (1 if inside_union(rects, x, y) else 0)
+
+
+def test_union_area_empty() -> None:
+    assert union_area([]) == 0.0
+    assert union_outline([]) == []
+    assert union_area([Rect(0, 0, 0, 5), Rect(1, 1, 3, 0)]) == 0.0
+
+
+@pytest.mark.parametrize(
+    "rects, expected",
+    [
+        ([Rect(0, 0, 2, 2)], 4.0),
+        ([Rect(0, 0, 2, 2), Rect(1, 1, 2, 2)], 7.0),
+        ([Rect(0, 0, 2, 2), Rect(0, 0, 2, 2)], 4.0),
+        ([Rect(0, 0, 4, 4), Rect(1, 1, 1, 1)], 16.0),
+        ([Rect(0, 0, 1, 1), Rect(1, 0, 1, 1)], 2.0),
+        ([Rect(0, 0, 1, 1), Rect(5, 5, 1, 1)], 2.0),
+        ([Rect(0, 1, 3, 1), Rect(1, 0, 1, 3)], 5.0),
+    ],
+)
+def test_union_area(rects, expected) -> None:
+    assert union_area(rects) == expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_union_area_random(seed) -> None:
+    rng = random.Random(seed)
+    rects = [
+        Rect(rng.randint(0, 8), rng.randint(0, 8), rng.randint(1, 3), rng.randint(1, 3))
+        for _ in range(25)
+    ]
+    area, polygons = union_area(rects), union_outline(rects)
+    assert area == brute_area(rects)
+    assert sum(polygon.signed_area for polygon in polygons) == pytest.approx(area)
+    check_outline(rects, polygons)
+
+
+def test_union_area_input_types() -> None:
+    rects = [Rect(0, 0, 2, 2), Rect(1, 1, 2, 2)]
+    assert union_area([CRect(r.x, r.y, r.w, r.h) for r in rects]) == 7.0
+    assert union_area([(0, 0, 2, 2), (1, 1, 2, 2)]) == 7.0
+    assert union_area(array("d", [0, 0, 2, 2, 1, 1, 2, 2])) == 7.0
+    assert union_area([(2, 2, -2, -2), (1, 1, 2, 2)]) == 7.0
+
+
+def test_union_outline_square() -> None:
+    polygons = union_outline([Rect(0, 0, 2, 2), Rect(0, 0, 1, 2)])
+    assert len(polygons) == 1
+    assert len(polygons[0]) == 4
+    assert polygons[0].orientation == Winding.CCW
+    assert polygons[0].bounds == Rect(0, 0, 2, 2)
+
+
+def test_union_outline_hole() -> None:
+    frame = [Rect(0, 0, 3, 1), Rect(0, 2, 3, 1), Rect(0, 0, 1, 3), Rect(2, 0, 1, 3)]
+    assert union_area(frame) == 8.0
+    polygons = union_outline(frame)
+    assert sorted(p.orientation.value for p in polygons) == sorted(
+        [Winding.CCW.value, Winding.CW.value]
+    )
+    assert sorted(p.area for p in polygons) == [1.0, 9.0]
+    check_outline(frame, polygons)
+
+
+def test_union_outline_corners_touching() -> None:
+    rects = [Rect(0, 0, 1, 1), Rect(1, 1, 1, 1)]
+    assert union_area(rects) == 2.0
+    polygons = union_outline(rects)
+    assert len(polygons) == 2
+    assert all(len(p) == 4 and p.area == 1.0 for p in polygons)
+
+
+def test_union_outline_hole_touching_at_a_corner() -> None:
+    rects = [Rect(0, 0, 3, 1), Rect(0, 1, 1, 2), Rect(1, 2, 1, 1), Rect(2, 1, 1, 1)]
+    polygons = union_outline(rects)
+    assert len(polygons) == 2
+    for polygon in polygons:
+        assert len(set(zip(polygon.x, polygon.y))) == len(polygon)
+    assert sorted(p.signed_area for p in polygons) == [-1.0, 8.0]
+    check_outline(rects, polygons)
@@ -0,0 +1,181 @@
+"""testing twod.backend like a human™"""
+
+import math
+import operator
+
+import pytest
+
+from twod import backend
+
+
+def test_backend_available() -> None:
+    names = backend.available()
+    assert "python" in names
+    assert names[-1] == "python"
+
+
+def test_backend_select_python() -> None:
+    assert backend.select("python").name == "python"
+    assert backend.select("PYTHON").name == "python"
+
+
+def test_backend_select_unknown() -> None:
+    with pytest.raises(ValueError):
+        backend.select("fortran")
+
+
+def test_backend_select_environment(monkeypatch) -> None:
+    monkeypatch.setenv(backend.BACKEND_ENV, "python")
+    assert backend.select().name == "python"
+
+
+def test_backend_select_default(monkeypatch) -> None:
+    monkeypatch.delenv(backend.BACKEND_ENV, raising=False)
+    assert backend.select().name == backend.available()[0]
+
+
+@pytest.mark.skipif("numpy" in backend.available(), reason="NumPy is installed")
+def test_backend_select_numpy_missing() -> None:
+    with pytest.raises(ImportError):
+        backend.select("numpy")
+
+
+def test_backend_use(kernels) -> None:
+    assert backend.kernels() is kernels
+
+
+XS = [0.0, 1.5, -2.0, 3.25]
+YS = [4.0, -0.5, 2.0, -1.0]
+
+
+@pytest.mark.parametrize(
+    "op, b",
+    [
+        (operator.add, 2.0),
+        (operator.sub, YS),
+        (operator.mul, -1.5),
+        (operator.truediv, 2.0),
+        (operator.floordiv, 0.75),
+        (operator.pow, 2.0),
+    ],
+)
+def test_backend_binop(kernels, op, b) -> None:
+    a = kernels.floats(XS)
+    operand = kernels.floats(b) if isinstance(b, list) else b
+    result = kernels.tolist(kernels.binop(op, a, operand))
+    expected = [op(x, y) for x, y in zip(XS, b if isinstance(b, list) else [b] * 4)]
+    assert result == expected
+
+
+@pytest.mark.parametrize("b", [0.0, [1.0, 0.0, 1.0, 1.0]])
+def test_backend_binop_zero_division(kernels, b) -> None:
+    a = kernels.floats(XS)
+    operand = kernels.floats(b) if isinstance(b, list) else b
+    with pytest.raises(ZeroDivisionError):
+        kernels.binop(operator.truediv, a, operand)
+
+
+@pytest.mark.parametrize(
+    "values, exponent, error",
+    [
+        ([4.0, -4.0], 0.5, ValueError),
+        ([1e200, 1.0], 2.0, OverflowError),
+        ([0.0, 1.0], -1.0, ZeroDivisionError),
+    ],
+)
+def test_backend_binop_power_errors(kernels, values, exponent, error) -> None:
+    a = kernels.floats(values)
+    with pytest.raises(error):
+        kernels.binop(operator.pow, a, exponent)
+    with pytest.raises(error):
+        kernels.binop(operator.pow, a, kernels.floats([exponent] * len(values)))
+
+
+def test_backend_binop_power_negative_base(kernels) -> None:
+    a = kernels.floats([-2.0, 3.0, -0.5])
+    assert kernels.tolist(kernels.binop(operator.pow, a, 3.0)) == [-8.0, 27.0, -0.125]
+
+
+def test_backend_unop(kernels) -> None:
+    a = kernels.floats(XS)
+    assert kernels.tolist(kernels.unop(abs, a)) == [abs(x) for x in XS]
+    assert kernels.tolist(kernels.unop(operator.neg, a)) == [-x for x in XS]
+
+
+def test_backend_extend(kernels) -> None:
+    a = kernels.floats([])
+    for x in XS:
+        a = kernels.extend(a, (x,))
+    a = kernels.extend(a, kernels.floats(YS))
+    assert kernels.tolist(a) == XS + YS
+
+
+def test_backend_extend_copies_shared_buffers(kernels) -> None:
+    a = kernels.extend(kernels.floats([]), XS)
+    b = kernels.extend(kernels.copy(a), (1.0,))
+    a = kernels.extend(a, (2.0,))
+    assert kernels.tolist(a) == XS + [2.0]
+    assert kernels.tolist(b) == XS + [1.0]
+
+
+def test_backend_polar(kernels) -> None:
+    x, y = kernels.floats(XS), kernels.floats(YS)
+    assert list(kernels.hypot(x, y)) == [math.hypot(*p) for p in zip(XS, YS)]
+    assert list(kernels.atan2(y, x)) == [math.atan2(q, p) for p, q in zip(XS, YS)]
+
+
+def test_backend_distance_squared(kernels) -> None:
+    x, y = kernels.floats(XS), kernels.floats(YS)
+    result = kernels.distance_squared(x, y, 1.0, 1.0)
+    assert list(result) == [(p - 1) ** 2 + (q - 1) ** 2 for p, q in zip(XS, YS)]
+
+
+@pytest.mark.parametrize("op", [operator.le, operator.lt])
+def test_backend_bounded(kernels, op) -> None:
+    x, y = kernels.floats(XS), kernels.floats(YS)
+    result = kernels.bounded(x, y, (3.25, 4.0), (0.0, -1.0), op)
+    expected = [
+        op(0.0, p) and op(p, 3.25) and op(-1.0, q) and op(q, 4.0)
+        for p, q in zip(XS, YS)
+    ]
+    assert [bool(v) for v in result] == expected
+
+
+def test_backend_outside_convex(kernels) -> None:
+    x = kernels.floats([1.0, 0.0, 2.0, 1.0, 5.0, 0.5])
+    y = kernels.floats([1.0, 0.0, 1.0, 2.0, 5.0, 0.5])
+    square = ([0.0, 2.0, 2.0, 0.0], [0.0, 0.0, 2.0, 2.0])
+    assert kernels.outside_convex(x, y, *square) == [1, 2, 3, 4]
+
+
+def test_backend_complex(kernels) -> None:
+    values = [1 + 2j, -3j, 4.5]
+    a = kernels.complexes(values)
+    assert kernels.complex_len(a) == 3
+    assert kernels.complex_tolist(a) == values
+    assert kernels.complex_get(a, -1) == 4.5
+    kernels.complex_set(a, 0, 1j)
+    assert list(kernels.complex_real(a)) == [0, 0, 4.5]
+    assert list(kernels.complex_imag(a)) == [1, -3, 0]
+    assert list(kernels.complex_abs(a)) == [1, 3, 4.5]
+    assert list(kernels.complex_angle(a)) == [math.pi / 2, -math.pi / 2, 0]
+
+
+def test_backend_complex_affine(kernels) -> None:
+    values = [1 + 2j, -3j, 4.5]
+    a = kernels.complexes(values)
+    copy = kernels.complex_affine(a, 2j, 1, inplace=False)
+    assert kernels.complex_tolist(copy) == [z * 2j + 1 for z in values]
+    assert kernels.complex_tolist(a) == values
+    assert kernels.complex_affine(a, 2j, 1, inplace=True) is a
+    assert kernels.complex_tolist(a) == [z * 2j + 1 for z in values]
+
+
+def test_backend_along(kernels) -> None:
+    x = kernels.floats([0.0, 3.0, 3.0, 3.0])
+    y = kernels.floats([0.0, 0.0, 0.0, 4.0])
+    lengths = kernels.floats([0.0, 3.0, 3.0, 7.0])
+    distances = kernels.floats([-1.0, 0.0, 1.5, 3.0, 5.0, 7.0, 9.0])
+    px, py = kernels.along(x, y, lengths, distances)
+    assert list(px) == [0.0, 0.0, 1.5, 3.0, 3.0, 3.0, 3.0]
+    assert list(py) == [0.0, 0.0, 0.0, 0.0, 2.0, 4.0, 4.0]
@@ -0,0 +1,196 @@
+"""testing boolean like a human™"""
+
+import math
+import random
+
+import pytest
+
+from twod import Point, Polygon
+from twod.boolean import difference, intersection, union
+from twod.constants import Winding
+
+SQUARE = [(0, 0), (2, 0), (2, 2), (0, 2)]
+SHIFTED = [(1, 1), (3, 1), (3, 3), (1, 3)]
+
+OPERATIONS = [
+    (union, lambda s, c: s or c),
+    (intersection, lambda s, c: s and c),
+    (difference, lambda s, c: s and not c),
+]
+
+
+def star(seed, cx=5, cy=5, count=16, radius=(1, 5)):
+    rng = random.Random(seed)
+    return Polygon(
+        [
+            (
+                cx + rng.uniform(*radius) * math.cos(2 * math.pi * i / count),
+                cy + rng.uniform(*radius) * math.sin(2 * math.pi * i / count),
+            )
+            for i in range(count)
+        ]
+    )
+
+
+def inside(rings, x, y):
+    """Even-odd containment over any number of rings."""
+    return sum(ring.winding_number(Point(x, y)) for ring in rings) % 2 == 1
+
+
+def check(result, shape_a, shape_b, rule, seed=0, samples=400):
+    """Asserts result covers exactly the points rule keeps."""
+    for polygon in result:
+        outer, *holes = polygon
+        assert outer.orientation == Winding.CCW
+        assert all(hole.orientation == Winding.CW for hole in holes)
+
+    rng = random.Random(seed)
+    for _ in range(samples):
+        x, y = rng.uniform(-1, 11), rng.uniform(-1, 11)
+        expected = rule(inside(shape_a, x, y), inside(shape_b, x, y))
+        found = [
+            polygon
+            for polygon in result
+            if polygon[0].contains(Point(x, y))
+            and not any(hole.contains(Point(x, y)) for hole in polygon[1:])
+        ]
+        assert len(found) == (1 if expected else 0)
+
+
+def area(result):
+    return sum(ring.signed_area for polygon in result for ring in polygon)
+
+
+@pytest.mark.parametrize("operation, rule", OPERATIONS)
+def test_boolean_squares(operation, rule) -> None:
+    result = operation(Polygon(SQUARE), Polygon(SHIFTED))
+    assert area(result) == {union: 7.0, intersection: 1.0, difference: 3.0}[operation]
+    check(result, [Polygon(SQUARE)], [Polygon(SHIFTED)], rule)
+
+
+def test_boolean_union_vertices() -> None:
+    (polygon,) = union(SQUARE, SHIFTED)
+    assert len(polygon) == 1
+    assert sorted(zip(polygon[0].x, polygon[0].y)) == sorted(
+        [(0, 0), (2, 0), (2, 1), (3, 1), (3, 3), (1, 3), (1, 2), (0, 2)]
+    )
+
+
+def test_boolean_empty() -> None:
+    assert union([], []) == []
+    assert intersection(SQUARE, []) == []
+    assert difference([], SQUARE) == []
+    assert area(union(SQUARE, [])) == 4.0
+    assert area(difference(SQUARE, [])) == 4.0
+
+
+def test_boolean_disjoint() -> None:
+    far = [(5, 5), (6, 5), (6, 6), (5, 6)]
+    assert len(union(SQUARE, far)) == 2
+    assert intersection(SQUARE, far) == []
+    assert area(difference(SQUARE, far)) == 4.0
+
+
+def test_boolean_identical() -> None:
+    assert area(union(SQUARE, SQUARE)) == 4.0
+    assert area(intersection(SQUARE, SQUARE)) == 4.0
+    assert difference(SQUARE, SQUARE) == []
+
+
+def test_boolean_shared_edge() -> None:
+    right = [(2, 0), (4, 0), (4, 2), (2, 2)]
+    (polygon,) = union(SQUARE, right)
+    assert len(polygon) == 1
+    assert len(polygon[0]) == 4
+    assert polygon[0].area == 8.0
+    assert intersection(SQUARE, right) == []
+
+
+def test_boolean_corners_touching() -> None:
+    corner = [(2, 2), (4, 2), (4, 4), (2, 4)]
+    result = union(SQUARE, corner)
+    assert len(result) == 2
+    assert all(len(polygon[0]) == 4 for polygon in result)
+
+
+def test_boolean_hole() -> None:
+    outer = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    inner = [(3, 3), (7, 3), (7, 7), (3, 7)]
+    (polygon,) = difference(outer, inner)
+    assert [ring.signed_area for ring in polygon] == [100.0, -16.0]
+
+    # an island inside the hole is a polygon of its own
+    island = [(4, 4), (6, 4), (6, 6), (4, 6)]
+    result = union([outer, inner], island)
+    assert sorted(len(polygon) for polygon in result) == [1, 2]
+    check(result, [Polygon(outer), Polygon(inner)], [Polygon(island)], OPERATIONS[0][1])
+
+    # filling the hole leaves a single ring
+    (polygon,) = union([outer, inner], inner)
+    assert [ring.area for ring in polygon] == [100.0]
+
+
+def test_boolean_multipolygon_holes() -> None:
+    a = [
+        [[(0, 0), (4, 0), (4, 4), (0, 4)], [(1, 1), (3, 1), (3, 3), (1, 3)]],
+        [[(6, 6), (10, 6), (10, 10), (6, 10)]],
+    ]
+    b = [(2, -1), (8, -1), (8, 8), (2, 8)]
+    rings_a = [Polygon(r) for r in a[0]] + [Polygon(a[1][0])]
+    for operation, rule in OPERATIONS:
+        check(operation(a, b), rings_a, [Polygon(b)], rule, seed=1)
+
+
+@pytest.mark.parametrize("operation, rule", OPERATIONS)
+def test_boolean_overlapping_rings(operation, rule) -> None:
+    # edges shared by both shapes and three edges crossing at one point
+    a = [[(5, 1), (6, 2), (5, 3), (4, 6), (3, 5), (2, 4)]]
+    b = [
+        [(2, 4), (2, 0), (5, 3), (4, 6), (1, 5)],
+        [(3, 0), (6, 1), (6, 1), (6, 3), (2, 6)],
+        [(3, 0), (5, 4), (3, 4), (5, 6), (0, 6)],
+    ]
+    result = operation(a, b)
+    check(result, [Polygon(r) for r in a], [Polygon(r) for r in b], rule)
+
+
+@pytest.mark.parametrize("operation, rule", OPERATIONS)
+def test_boolean_shared_float_vertices(operation, rule) -> None:
+    p = (5.77076054205658, 0.5724008297734022)
+    q = (5.704153357391838, 5.065665535098869)
+    a = [
+        [(4, 3), (5, 4), (2.6776049580922643, 3.3168873806562944)],
+        [p, (5, 1), q, p, (3, 5)],
+    ]
+    b = [[p, (5, 4), (5, 1)]]
+    result = operation(a, b)
+    check(result, [Polygon(r) for r in a], [Polygon(r) for r in b], rule)
+
+
+@pytest.mark.parametrize("operation, rule", OPERATIONS)
+@pytest.mark.parametrize("seed", range(4))
+def test_boolean_random_stars(operation, rule, seed) -> None:
+    a = star(seed)
+    b = star(seed + 100, cx=6, cy=4)
+    result = operation(a, b)
+    check(result, [a], [b], rule, seed=seed)
+
+
+@pytest.mark.parametrize("operation, rule", OPERATIONS)
+def test_boolean_grid_overlaps(operation, rule) -> None:
+    # many collinear and coincident edges
+    a = [
+        [(x, y), (x + 2, y), (x + 2, y + 2), (x, y + 2)]
+        for x in (0, 4, 8)
+        for y in (0, 4, 8)
+    ]
+    b = [
+        [(x, y), (x + 3, y), (x + 3, y + 3), (x, y + 3)] for x in (1, 5) for y in (1, 5)
+    ]
+    check(
+        operation(a, b),
+        [Polygon(r) for r in a],
+        [Polygon(r) for r in b],
+        rule,
+        seed=2,
+    )
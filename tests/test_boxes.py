@@ -0,0 +1,117 @@
+"""testing boxes like a human™"""
+
+import random
+from array import array
+
+import pytest
+
+from twod import CRect, Rect
+from twod.boxes import iou_matrix, nms
+
+
+def brute_iou(a, b):
+    w = min(a.x + a.w, b.x + b.w) - max(a.x, b.x)
+    h = min(a.y + a.h, b.y + b.h) - max(a.y, b.y)
+    if w <= 0 or h <= 0:
+        return 0.0
+    return w * h / (a.area + b.area - w * h)
+
+
+def brute_nms(rects, scores, threshold):
+    order = sorted(range(len(rects)), key=lambda i: -scores[i])
+    kept = []
+    for i in order:
+        if all(brute_iou(rects[i], rects[k]) <= threshold for k in kept):
+            kept.append(i)
+    return kept
+
+
+def random_rects(count, seed):
+    rng = random.Random(seed)
+    return [
+        Rect(
+            rng.random() * 100,
+            rng.random() * 100,
+            rng.random() * 20,
+            rng.random() * 20,
+        )
+        for _ in range(count)
+    ]
+
+
+def test_iou_matrix() -> None:
+    matrix = iou_matrix(
+        [Rect(0, 0, 2, 2), Rect(10, 10, 1, 1)],
+        [Rect(1, 0, 2, 2), Rect(0, 0, 2, 2), Rect(2, 0, 2, 2)],
+    )
+    assert matrix == [
+        array("d", [1 / 3, 1.0, 0.0]),
+        array("d", [0.0, 0.0, 0.0]),
+    ]
+
+
+def test_iou_matrix_empty() -> None:
+    assert iou_matrix([], [Rect(0, 0, 1, 1)]) == []
+    assert iou_matrix([Rect(0, 0, 1, 1)], []) == [array("d")]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_iou_matrix_random(seed) -> None:
+    a = random_rects(80, seed)
+    b = random_rects(60, seed + 10)
+    matrix = iou_matrix(a, b)
+    for i, ra in enumerate(a):
+        for j, rb in enumerate(b):
+            assert matrix[i][j] == pytest.approx(brute_iou(ra, rb))
+
+
+def test_iou_matrix_input_types() -> None:
+    a = random_rects(20, 4)
+    b = random_rects(20, 5)
+    expected = iou_matrix(a, b)
+    packed_a = array("d", [v for r in a for v in (r.x, r.y, r.w, r.h)])
+    packed_b = [v for r in b for v in (r.x, r.y, r.w, r.h)]
+    assert iou_matrix(packed_a, packed_b) == expected
+    assert iou_matrix([(r.x, r.y, r.w, r.h) for r in a], b) == expected
+    assert iou_matrix([CRect(r.x, r.y, r.w, r.h) for r in a], b) == expected
+
+
+def test_iou_matrix_negative_dimensions() -> None:
+    assert iou_matrix([(2, 2, -2, -2)], [(0, 0, 2, 2)]) == [array("d", [1.0])]
+
+
+def test_iou_matrix_bad_packing() -> None:
+    with pytest.raises(ValueError):
+        iou_matrix([0, 0, 1], [])
+
+
+def test_iou_matrix_touching() -> None:
+    matrix = iou_matrix([Rect(0, 0, 1, 1), Rect(0, 0, 0, 1)], [Rect(1, 0, 1, 1)])
+    assert matrix == [array("d", [0.0]), array("d", [0.0])]
+
+
+def test_nms() -> None:
+    rects = [Rect(0, 0, 2, 2), Rect(0, 0, 2, 2.2), Rect(5, 5, 1, 1)]
+    assert nms(rects, [0.8, 0.9, 0.5], 0.5) == [1, 2]
+    assert nms(rects, [0.8, 0.9, 0.5], 0.95) == [1, 0, 2]
+    assert nms([], [], 0.5) == []
+
+
+def test_nms_chain() -> None:
+    # b suppresses c, so a is kept even though c would overlap it
+    rects = [Rect(0, 0, 10, 10), Rect(4, 0, 10, 10), Rect(8, 0, 10, 10)]
+    assert nms(rects, [0.5, 0.9, 0.8], 0.3) == [1]
+    assert nms(rects, [0.9, 0.5, 0.8], 0.3) == [0, 2]
+
+
+def test_nms_mismatched_scores() -> None:
+    with pytest.raises(ValueError):
+        nms([Rect(0, 0, 1, 1)], [0.5, 0.5], 0.5)
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.3, 0.7])
+def test_nms_random(threshold) -> None:
+    rects = random_rects(300, 7)
+    rng = random.Random(8)
+    scores = [rng.random() for _ in rects]
+    assert nms(rects, scores, threshold) == brute_nms(rects, scores, threshold)
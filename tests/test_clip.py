@@ -0,0 +1,176 @@
+"""testing clip like a human™"""
+
+import math
+import random
+from array import array
+
+import pytest
+
+from twod import CRect, Line, Point, Polygon, Rect
+from twod.clip import clip_lines, clip_polygon
+
+RECT = Rect(0, 0, 10, 5)
+
+
+def random_lines(count, seed):
+    rng = random.Random(seed)
+    return [
+        Line(
+            Point(rng.uniform(-5, 15), rng.uniform(-5, 10)),
+            Point(rng.uniform(-5, 15), rng.uniform(-5, 10)),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_clip_lines_empty() -> None:
+    x0, y0, x1, y1, keep = clip_lines([], RECT)
+    assert len(x0) == len(y0) == len(x1) == len(y1) == len(keep) == 0
+
+
+def test_clip_lines() -> None:
+    lines = [
+        Line(Point(1, 1), Point(2, 2)),
+        Line(Point(-5, 1), Point(15, 1)),
+        Line(Point(-5, 6), Point(15, 6)),
+        Line(Point(-5, -5), Point(-1, 10)),
+        Line(Point(10, 5), Point(12, 7)),
+    ]
+    x0, y0, x1, y1, keep = clip_lines(lines, RECT)
+    assert keep == bytearray([1, 1, 0, 0, 1])
+    assert (x0[0], y0[0], x1[0], y1[0]) == (1, 1, 2, 2)
+    assert (x0[1], y0[1], x1[1], y1[1]) == (0, 1, 10, 1)
+    assert (x0[2], y0[2], x1[2], y1[2]) == (-5, 6, 15, 6)
+    assert (x0[4], y0[4], x1[4], y1[4]) == (10, 5, 10, 5)
+
+
+def test_clip_lines_crossing_corner_outside() -> None:
+    # both endpoints are outside on different sides, the line misses
+    *_, keep = clip_lines([Line(Point(-1, 4.5), Point(2, 7.5))], RECT)
+    assert keep == bytearray([0])
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_clip_lines_matches_clip_line(seed) -> None:
+    lines = random_lines(500, seed)
+    x0, y0, x1, y1, keep = clip_lines(lines, RECT)
+    for i, line in enumerate(lines):
+        clipped = RECT.clip_line(line)
+        assert keep[i] == (clipped is not None)
+        if clipped is not None:
+            assert (x0[i], y0[i]) == clipped.start.xy
+            assert (x1[i], y1[i]) == clipped.end.xy
+
+
+@pytest.mark.parametrize("seed", [4, 5])
+def test_clip_lines_inside_rect(seed) -> None:
+    lines = random_lines(300, seed)
+    x0, y0, x1, y1, keep = clip_lines(lines, RECT)
+    for i, line in enumerate(lines):
+        samples = [line.point_at_parameter(t / 200) for t in range(201)]
+        inside = [p for p in samples if 0 <= p.x <= 10 and 0 <= p.y <= 5]
+        if not keep[i]:
+            assert not inside
+            continue
+        for x, y in ((x0[i], y0[i]), (x1[i], y1[i])):
+            assert -1e-9 <= x <= 10 + 1e-9 and -1e-9 <= y <= 5 + 1e-9
+            assert line.distance_to_point(Point(x, y)) == pytest.approx(0, abs=1e-9)
+        clipped = Line(Point(x0[i], y0[i]), Point(x1[i], y1[i]))
+        for p in inside:
+            assert clipped.distance_to_point(p) == pytest.approx(0, abs=1e-9)
+
+
+def test_clip_lines_input_types() -> None:
+    lines = random_lines(50, 6)
+    expected = clip_lines(lines, RECT)
+    packed = array("d", [v for line in lines for v in (*line.start.xy, *line.end.xy)])
+    pairs = [(line.start.xy, line.end.xy) for line in lines]
+    assert clip_lines(packed, RECT) == expected
+    assert clip_lines(pairs, RECT) == expected
+    assert clip_lines(lines, CRect(0, 0, 10, 5)) == expected
+    assert clip_lines(lines, (10, 5, -10, -5)) == expected
+
+
+def test_clip_lines_bad_packing() -> None:
+    with pytest.raises(ValueError):
+        clip_lines([0.0, 1.0, 2.0], RECT)
+
+
+SQUARE = [(0, 0), (4, 0), (4, 4), (0, 4)]
+
+
+def brute_inside(polygon, clip, x, y):
+    return polygon.contains(Point(x, y)) and clip(x, y)
+
+
+def test_clip_polygon_rect() -> None:
+    clipped = clip_polygon(Polygon(SQUARE), Rect(2, 2, 4, 4))
+    assert isinstance(clipped, Polygon)
+    assert clipped.area == 4.0
+    assert clipped.bounds == Rect(2, 2, 2, 2)
+
+
+def test_clip_polygon_rect_inside_and_outside() -> None:
+    square = Polygon(SQUARE)
+    inside = clip_polygon(square, Rect(-1, -1, 10, 10))
+    assert inside == square
+    assert inside is not square
+    assert len(clip_polygon(square, Rect(5, 5, 1, 1))) == 0
+    assert len(clip_polygon([], Rect(0, 0, 1, 1))) == 0
+
+
+def test_clip_polygon_rect_types() -> None:
+    expected = clip_polygon(Polygon(SQUARE), Rect(1, 1, 2, 5))
+    assert clip_polygon(SQUARE, CRect(1, 1, 2, 5)) == expected
+    assert clip_polygon(SQUARE, (1, 1, 2, 5)) == expected
+    assert clip_polygon(SQUARE, (3, 6, -2, -5)) == expected
+    assert clip_polygon([Point(*p) for p in SQUARE], Rect(1, 1, 2, 5)) == expected
+    packed = array("d", [0, 0, 4, 0, 4, 4, 0, 4])
+    assert clip_polygon(packed, Rect(1, 1, 2, 5)) == expected
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_clip_polygon_convex(reverse) -> None:
+    triangle = [(0, 0), (4, 0), (0, 4)]
+    if reverse:
+        triangle.reverse()
+    clipped = clip_polygon(Polygon(SQUARE), triangle)
+    assert clipped.area == pytest.approx(8.0)
+    clipped = clip_polygon(Polygon(SQUARE), Polygon([(5, 5), (6, 5), (6, 6)]))
+    assert len(clipped) == 0
+
+
+def test_clip_polygon_keeps_winding() -> None:
+    clockwise = Polygon(list(reversed(SQUARE)))
+    clipped = clip_polygon(clockwise, Rect(1, 1, 2, 2))
+    assert clipped.signed_area == -4.0
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_clip_polygon_concave(seed) -> None:
+    # a star-shaped polygon around the center
+    rng = random.Random(seed)
+    count = 24
+    star = Polygon(
+        [
+            (
+                5 + rng.uniform(1, 5) * math.cos(2 * math.pi * i / count),
+                5 + rng.uniform(1, 5) * math.sin(2 * math.pi * i / count),
+            )
+            for i in range(count)
+        ]
+    )
+    hexagon = Polygon(
+        [
+            (5 + 3 * math.cos(math.pi * i / 3), 5 + 3 * math.sin(math.pi * i / 3))
+            for i in range(6)
+        ]
+    )
+    for clip, inside in (
+        (Rect(3, 2, 6, 4), lambda x, y: 3 < x < 9 and 2 < y < 6),
+        (hexagon, lambda x, y: hexagon.contains(Point(x, y))),
+    ):
+        clipped = clip_polygon(star, clip)
+        for _ in range(300):
+            x, y = rng.uniform(0, 10), rng.uniform(0, 10)
+            assert clipped.contains(Point(x, y)) == brute_inside(star, inside, x, y)
@@ -120,3 +120,19 @@ def test_cpoint_setitem_key_out_of_range(key, point):
 def test_cpoint_setitem_invalid_key(key, point):
     with pytest.raises(TypeError):
         point[key] = 0
+
+
+@pytest.mark.parametrize(
+    "d, sign",
+    [
+        (CPoint(0.5, 0.5), 1),
+        ((2, 2), -1),
+        (1j, 0),
+    ],
+)
+def test_cpoint_incircle(d, sign):
+    a, b, c = CPoint(), CPoint(1, 0), CPoint(1, 1)
+    result = a.incircle(b, c, d)
+    assert (result > 0) - (result < 0) == sign
+    result = c.incircle((1, 0), a, d)
+    assert (result > 0) - (result < 0) == -sign
@@ -1,5 +1,7 @@
 """Tests for CPoint.from_any() method to improve coverage"""
 
+import math
+
 import pytest
 from twod import CPoint
 
@@ -187,4 +189,67 @@ class TestCPointFromComplex:
         z = complex(-2, -3)
         result = CPoint.from_complex(z)
         assert result.x == -2
-        assert result.y == -3
\ No newline at end of file
+        assert result.y == -3
+
+
+class TestCPointFromAnyMany:
+    """Test cases for CPoint.from_any_many() method"""
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [complex(1, 2), complex(3, 4)],
+            [{"x": 1, "y": 2}, {"x": 3, "y": 4}],
+            [[1, 2], [3, 4]],
+            [(1, 2), (3, 4)],
+            [1, 2.5],
+            ["1+2j", "3+4j"],
+            [CPoint(1, 2), (3, 4), 5j, {"x": 6, "y": 7}, 8],
+        ],
+    )
+    def test_from_any_many_matches_from_any(self, values):
+        """Test from_any_many agrees with from_any for each value"""
+        result = CPoint.from_any_many(values)
+        assert result == [CPoint.from_any(v) for v in values]
+        assert all(isinstance(p, CPoint) for p in result)
+
+    def test_from_any_many_generator(self):
+        """Test from_any_many with a generator"""
+        result = CPoint.from_any_many(complex(i, -i) for i in range(3))
+        assert [p.xy for p in result] == [(0, 0), (1, -1), (2, -2)]
+
+    def test_from_any_many_empty(self):
+        """Test from_any_many with no values"""
+        assert CPoint.from_any_many([]) == []
+
+    def test_from_any_many_identity(self):
+        """Test from_any_many returns CPoint instances unchanged"""
+        p = CPoint(1, 2)
+        assert CPoint.from_any_many([p])[0] is p
+
+    def test_from_any_many_polar(self):
+        """Test from_any_many with polar pairs"""
+        values = [(1, 0), (2, math.pi / 2)]
+        result = CPoint.from_any_many(values, is_polar=True)
+        assert result == [CPoint.from_any(v, is_polar=True) for v in values]
+
+    def test_from_any_many_scalar_not_ok(self):
+        """Test from_any_many rejects scalars when scalar_ok is False"""
+        with pytest.raises(TypeError):
+            CPoint.from_any_many([1, 2], scalar_ok=False)
+        with pytest.raises(TypeError):
+            CPoint.from_any_many([(1, 2), 3], scalar_ok=False)
+
+    def test_from_any_many_invalid(self):
+        """Test from_any_many with unconvertible values"""
+        with pytest.raises(TypeError):
+            CPoint.from_any_many([None])
+        with pytest.raises(TypeError):
+            CPoint.from_any_many(["not a number"])
+
+    def test_from_any_many_array(self):
+        """Test from_any_many with an array buffer of scalars"""
+        from array import array
+
+        result = CPoint.from_any_many(array("d", [1, 2]))
+        assert [p.xy for p in result] == [(1, 1), (2, 2)]
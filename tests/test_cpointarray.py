@@ -0,0 +1,109 @@
+"""testing CPointArray like a human™"""
+
+import math
+
+import pytest
+
+from twod import CPoint, CPointArray
+
+pytestmark = pytest.mark.usefixtures("kernels")
+
+
+def test_cpointarray_creation_default() -> None:
+    ca = CPointArray()
+    assert len(ca) == 0
+    assert list(ca) == []
+
+
+def test_cpointarray_creation_complex() -> None:
+    ca = CPointArray([1 + 2j, 3, -4j])
+    assert len(ca) == 3
+    assert ca == [(1, 2), (3, 0), (0, -4)]
+    assert list(ca.x) == [1, 3, 0]
+    assert list(ca.y) == [2, 0, -4]
+
+
+def test_cpointarray_from_points() -> None:
+    ca = CPointArray.from_points([CPoint(1, 2), (3, 4), {"x": 5, "y": 6}, 7 + 8j])
+    assert ca == [(1, 2), (3, 4), (5, 6), (7, 8)]
+
+
+def test_cpointarray_getitem_setitem() -> None:
+    ca = CPointArray([1 + 2j, 3 + 4j])
+    p = ca[-1]
+    assert isinstance(p, CPoint)
+    assert p == (3, 4)
+    ca[0] = (9, 9)
+    assert ca[0] == (9, 9)
+    with pytest.raises(IndexError):
+        ca[2]
+    with pytest.raises(TypeError):
+        ca["x"]
+
+
+@pytest.mark.parametrize(
+    "radii, thetas, is_radians",
+    [
+        ([1, 2, 3], [0, math.pi / 2, math.pi], True),
+        ([1, 2, 3], [0, 90, 180], False),
+    ],
+)
+def test_cpointarray_from_polar(radii, thetas, is_radians) -> None:
+    ca = CPointArray.from_polar(radii, thetas, is_radians=is_radians)
+    expected = [
+        CPoint.from_polar(r, t, is_radians=is_radians) for r, t in zip(radii, thetas)
+    ]
+    assert ca == expected
+
+
+def test_cpointarray_from_polar_translate() -> None:
+    ca = CPointArray.from_polar([1], [0], translate=(1, 1))
+    assert ca == [(2, 1)]
+
+
+def test_cpointarray_polar_properties() -> None:
+    ca = CPointArray([3 + 4j, -1j])
+    assert list(ca.radius) == [5, 1]
+    assert list(ca.radians) == [math.atan2(4, 3), -math.pi / 2]
+    assert list(ca.degrees) == [math.degrees(math.atan2(4, 3)), -90]
+    radii, radians = ca.polar
+    assert list(radii) == [5, 1]
+    assert list(radians) == list(ca.radians)
+
+
+@pytest.mark.parametrize("origin", [None, (1, 1), CPoint(-2, 3)])
+@pytest.mark.parametrize("theta", [0, math.pi / 3, -math.pi, 2.5])
+def test_cpointarray_rotate_matches_cpoint(theta, origin) -> None:
+    values = [1 + 2j, -3 + 4j, 5.5 - 6j]
+    ca = CPointArray(values)
+    ca.rotate(theta, origin=origin)
+    expected = [
+        CPoint.from_complex(z).rotate(theta, origin=origin or 0) for z in values
+    ]
+    assert ca == expected
+
+
+def test_cpointarray_rotate_degrees_copy() -> None:
+    ca = CPointArray([1])
+    rotated = ca.rotate(90, is_degrees=True, inplace=False)
+    assert rotated is not ca
+    assert ca == [(1, 0)]
+    assert rotated == [(0, 1)]
+
+
+def test_cpointarray_rotate_inplace() -> None:
+    ca = CPointArray([1])
+    assert ca.rotate(math.pi) is ca
+    assert ca == [(-1, 0)]
+
+
+def test_cpointarray_scale() -> None:
+    ca = CPointArray([1 + 2j, -3j])
+    assert ca.scale(2) is ca
+    assert ca == [(2, 4), (0, -6)]
+
+
+def test_cpointarray_translate() -> None:
+    ca = CPointArray([1 + 2j, -3j])
+    ca.translate((1, 1))
+    assert ca == [(2, 3), (1, -2)]
@@ -0,0 +1,157 @@
+"""testing AABBTree like a human™"""
+
+import random
+
+import pytest
+
+from twod import CPoint, CRect, Rect
+from twod.index import AABBTree
+
+
+def overlaps(a, b):
+    return (
+        a.x <= b.x + b.w and b.x <= a.x + a.w and a.y <= b.y + b.h and b.y <= a.y + a.h
+    )
+
+
+def brute_pairs(rects):
+    return sorted(
+        (i, j)
+        for i in range(len(rects))
+        for j in range(i + 1, len(rects))
+        if overlaps(rects[i], rects[j])
+    )
+
+
+def check_invariants(tree):
+    """Every inner node's box encloses its children and heights are
+    consistent and balanced."""
+    if tree._root == -1:
+        return
+    stack = [tree._root]
+    while stack:
+        node = stack.pop()
+        c1, c2 = tree._child1[node], tree._child2[node]
+        if c1 == -1:
+            assert tree._height[node] == 0
+            assert tree._x0[node] <= tree._tx0[node]
+            assert tree._tx1[node] <= tree._x1[node]
+            continue
+        for c in (c1, c2):
+            assert tree._parent[c] == node
+            assert tree._x0[node] <= tree._x0[c] and tree._x1[c] <= tree._x1[node]
+            assert tree._y0[node] <= tree._y0[c] and tree._y1[c] <= tree._y1[node]
+        assert tree._height[node] == 1 + max(tree._height[c1], tree._height[c2])
+        assert abs(tree._height[c1] - tree._height[c2]) <= 1
+        stack.extend((c1, c2))
+
+
+@pytest.fixture()
+def world():
+    rng = random.Random(7)
+    rects = [
+        CRect(
+            rng.uniform(0, 100),
+            rng.uniform(0, 100),
+            rng.uniform(1, 5),
+            rng.uniform(1, 5),
+        )
+        for _ in range(200)
+    ]
+    tree = AABBTree(margin=0.5)
+    handles = [tree.insert(r, item=i) for i, r in enumerate(rects)]
+    return tree, rects, handles
+
+
+def test_aabbtree_empty() -> None:
+    tree = AABBTree()
+    assert len(tree) == 0
+    assert tree.height == 0
+    assert tree.query_pairs() == []
+    assert tree.query(Rect(0, 0, 1, 1)) == []
+
+
+def test_aabbtree_insert(world) -> None:
+    tree, rects, _ = world
+    check_invariants(tree)
+    assert len(tree) == len(rects)
+    assert sorted(tree) == list(range(len(rects)))
+    assert tree.height < 20
+
+
+def test_aabbtree_query_pairs(world) -> None:
+    tree, rects, _ = world
+    assert sorted(tree.query_pairs()) == brute_pairs(rects)
+
+
+def test_aabbtree_query(world) -> None:
+    tree, rects, _ = world
+    query = Rect(10, 10, 30, 20)
+    expected = [i for i, r in enumerate(rects) if overlaps(r, query)]
+    assert sorted(tree.query(query)) == expected
+
+
+def test_aabbtree_default_item() -> None:
+    tree = AABBTree()
+    r = Rect(0, 0, 1, 1)
+    tree.insert(r)
+    assert tree.query(Rect(0.5, 0.5, 1, 1)) == [r]
+
+
+def test_aabbtree_update_small_move_is_cheap() -> None:
+    tree = AABBTree(margin=1)
+    r = CRect(0, 0, 2, 2)
+    h = tree.insert(r)
+    r += CPoint(0.5, 0.5)
+    assert tree.update(h, r, displacement=(0.5, 0.5)) is False
+    assert tree.query(Rect(2.4, 2.4, 0.1, 0.1)) == [r]
+    assert tree.query(Rect(0, 0, 0.4, 0.4)) == []
+
+
+def test_aabbtree_update_large_move_reinserts() -> None:
+    tree = AABBTree(margin=1)
+    r = CRect(0, 0, 2, 2)
+    h = tree.insert(r)
+    r += CPoint(50, 0)
+    assert tree.update(h, r, displacement=CPoint(50, 0)) is True
+    assert tree.query(Rect(51, 1, 0, 0)) == [r]
+    # the fat box is stretched along the displacement
+    assert tree._x1[h] > r.x + r.w + 100
+
+
+def test_aabbtree_update_simulation(world) -> None:
+    tree, rects, handles = world
+    rng = random.Random(8)
+    for _ in range(20):
+        for r, h in zip(rects, handles):
+            step = CPoint(rng.uniform(-2, 2), rng.uniform(-2, 2))
+            r += step
+            tree.update(h, r, step)
+        check_invariants(tree)
+        assert sorted(tree.query_pairs()) == brute_pairs(rects)
+
+
+def test_aabbtree_remove(world) -> None:
+    tree, rects, handles = world
+    for i in range(0, 200, 3):
+        assert tree.remove(handles[i]) == i
+    check_invariants(tree)
+    alive = [i for i in range(200) if i % 3]
+    assert sorted(tree) == alive
+    expected = [(alive[a], alive[b]) for a, b in brute_pairs([rects[i] for i in alive])]
+    assert sorted(tree.query_pairs()) == sorted(expected)
+    with pytest.raises(KeyError):
+        tree.remove(handles[0])
+    with pytest.raises(KeyError):
+        tree.update(handles[0], rects[0])
+
+
+def test_aabbtree_remove_all_and_reuse(world) -> None:
+    tree, _, handles = world
+    for h in handles:
+        tree.remove(h)
+    assert len(tree) == 0
+    assert list(tree) == []
+    h = tree.insert(Rect(0, 0, 1, 1), item="again")
+    assert tree.query(Rect(0, 0, 1, 1)) == ["again"]
+    assert tree.remove(h) == "again"
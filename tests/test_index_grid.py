@@ -0,0 +1,114 @@
+"""testing GridIndex like a human™"""
+
+import random
+
+import pytest
+
+from twod import CPoint, CRect, Point, Rect
+from twod.index import GridIndex
+
+
+def brute_radius(points, center, radius):
+    return [p for p in points if p.distance(center) <= radius]
+
+
+@pytest.fixture(params=[Point, CPoint])
+def points(request):
+    rng = random.Random(1)
+    return [
+        request.param(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(300)
+    ]
+
+
+def test_grid_creation_bad_cell_size() -> None:
+    with pytest.raises(ValueError):
+        GridIndex(0)
+
+
+def test_grid_insert_len_contains(points) -> None:
+    grid = GridIndex(5)
+    for p in points:
+        grid.insert(p)
+    assert len(grid) == len(points)
+    assert all(p in grid for p in points)
+    assert Point() not in grid
+    assert sorted(map(id, grid)) == sorted(map(id, points))
+
+
+def test_grid_insert_twice() -> None:
+    grid = GridIndex(1)
+    p = Point()
+    grid.insert(p)
+    with pytest.raises(ValueError):
+        grid.insert(p)
+
+
+def test_grid_remove(points) -> None:
+    grid = GridIndex(5)
+    for p in points:
+        grid.insert(p)
+    for p in points[::2]:
+        grid.remove(p)
+    assert len(grid) == len(points) // 2
+    assert points[0] not in grid
+    with pytest.raises(KeyError):
+        grid.remove(points[0])
+
+
+@pytest.mark.parametrize("radius", [0, 1, 7.5, 30, 200])
+@pytest.mark.parametrize("cell_size", [1, 4, 100])
+def test_grid_query_radius(points, radius, cell_size) -> None:
+    grid = GridIndex(cell_size)
+    for p in points:
+        grid.insert(p)
+    center = points[0].__class__(3, -4)
+    found = grid.query_radius(center, radius)
+    assert sorted(map(id, found)) == sorted(
+        map(id, brute_radius(points, center, radius))
+    )
+
+
+def test_grid_query_radius_tuple_center() -> None:
+    grid = GridIndex(1)
+    p = Point(1, 1)
+    grid.insert(p)
+    assert grid.query_radius((0, 0), 2) == [p]
+
+
+@pytest.mark.parametrize("rect_type", [Rect, CRect])
+def test_grid_query_rect(points, rect_type) -> None:
+    grid = GridIndex(3)
+    for p in points:
+        grid.insert(p)
+    rect = rect_type(-10, -20, 25, 15)
+    found = grid.query_rect(rect)
+    expected = [p for p in points if -10 <= p.x <= 15 and -20 <= p.y <= -5]
+    assert sorted(map(id, found)) == sorted(map(id, expected))
+
+
+def test_grid_query_rect_edges() -> None:
+    grid = GridIndex(1)
+    p = Point(2, 2)
+    grid.insert(p)
+    assert grid.query_rect(Rect(0, 0, 2, 2)) == [p]
+    assert grid.query_rect(Rect(2, 2, -2, -2)) == [p]
+
+
+def test_grid_move_in_place() -> None:
+    grid = GridIndex(1)
+    p = Point(0.5, 0.5)
+    grid.insert(p)
+    p += (10, 10)
+    grid.move(p)
+    assert grid.query_radius(Point(10.5, 10.5), 0.1) == [p]
+    assert grid.query_radius(Point(0.5, 0.5), 0.1) == []
+
+
+def test_grid_move_new_xy() -> None:
+    grid = GridIndex(1)
+    p = CPoint(0.5, 0.5)
+    grid.insert(p)
+    grid.move(p, (-3, 4))
+    assert p.xy == (-3, 4)
+    assert grid.query_rect(Rect(-4, 3, 2, 2)) == [p]
+    assert len(grid) == 1
@@ -0,0 +1,94 @@
+"""testing KDTree like a human™"""
+
+import math
+import random
+from array import array
+
+import pytest
+
+from twod import CPoint, Point, PointArray
+from twod.index import KDTree
+
+
+@pytest.fixture(params=["uniform", "grid"])
+def points(request):
+    rng = random.Random(3)
+    if request.param == "grid":
+        # lots of ties along both axes
+        return [Point(i % 7, i // 7) for i in range(100)]
+    return [Point(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(500)]
+
+
+def brute(points, target):
+    return sorted((p.distance(target), i) for i, p in enumerate(points))
+
+
+QUERIES = [Point(0, 0), Point(3.3, -2.1), Point(50, 50), Point(6, 13), Point(2, 2)]
+
+
+def test_kdtree_empty() -> None:
+    tree = KDTree()
+    assert len(tree) == 0
+    assert tree.within(Point(), 10) == []
+    assert tree.knn(Point(), 3) == ([], [])
+    with pytest.raises(ValueError):
+        tree.nearest(Point())
+
+
+def test_kdtree_from_arrays_mismatched() -> None:
+    with pytest.raises(ValueError):
+        KDTree.from_arrays([1, 2], [1])
+
+
+def test_kdtree_memory(points) -> None:
+    tree = KDTree(points)
+    assert isinstance(tree._x, array)
+    assert tree._x.itemsize + tree._y.itemsize + tree._index.itemsize <= 20
+
+
+@pytest.mark.parametrize("target", QUERIES)
+def test_kdtree_nearest(points, target) -> None:
+    tree = KDTree(points)
+    index, distance = tree.nearest(target)
+    expected_distance, _ = brute(points, target)[0]
+    assert distance == pytest.approx(expected_distance)
+    assert points[index].distance(target) == pytest.approx(expected_distance)
+
+
+@pytest.mark.parametrize("k", [1, 3, 17, 1000])
+@pytest.mark.parametrize("target", QUERIES)
+def test_kdtree_knn(points, target, k) -> None:
+    tree = KDTree(points)
+    indices, distances = tree.knn(target, k)
+    expected = [d for d, _ in brute(points, target)[:k]]
+    assert distances == pytest.approx(expected)
+    assert len(set(indices)) == len(indices)
+    assert [points[i].distance(target) for i in indices] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("radius", [0, 1, 2.5, 100])
+@pytest.mark.parametrize("target", QUERIES)
+def test_kdtree_within(points, target, radius) -> None:
+    tree = KDTree(points)
+    found = tree.within(target, radius)
+    expected = [i for d, i in brute(points, target) if d <= radius]
+    assert sorted(found) == sorted(expected)
+
+
+def test_kdtree_query_many(points) -> None:
+    tree = KDTree(points)
+    indices, distances = tree.query_many(QUERIES)
+    assert isinstance(indices, array)
+    assert isinstance(distances, array)
+    for target, i, d in zip(QUERIES, indices, distances):
+        assert d == pytest.approx(brute(points, target)[0][0])
+        assert points[i].distance(target) == pytest.approx(d)
+
+
+def test_kdtree_accepts_cpoints_and_arrays() -> None:
+    cpoints = [CPoint(1, 1), CPoint(4, 5), (9, 9)]
+    tree = KDTree(cpoints)
+    assert tree.nearest((4, 4)) == (1, 1.0)
+    pa = PointArray([1, 4, 9], [1, 5, 9])
+    tree = KDTree.from_arrays(pa.x, pa.y)
+    assert tree.nearest(CPoint(8, 8)) == (2, math.sqrt(2))
@@ -0,0 +1,110 @@
+"""testing PolygonLocator like a human™"""
+
+import random
+from array import array
+
+import pytest
+
+from twod import CPoint, Point, PointArray, Polygon
+from twod.index import PolygonLocator
+
+
+def grid_cells(rows, columns, size=1.0):
+    """Square polygons tiling [0, columns*size] x [0, rows*size],
+    alternating winding direction."""
+    cells = []
+    for r in range(rows):
+        for c in range(columns):
+            x, y = c * size, r * size
+            corners = [(x, y), (x + size, y), (x + size, y + size), (x, y + size)]
+            if (r + c) % 2:
+                corners.reverse()
+            cells.append(Polygon(corners))
+    return cells
+
+
+def test_locator_empty() -> None:
+    locator = PolygonLocator([])
+    assert locator.locate(Point(0, 0)) is None
+    assert list(locator.locate_many([Point(0, 0)])) == [-1]
+
+
+def test_locator_grid() -> None:
+    cells = grid_cells(3, 4)
+    locator = PolygonLocator(cells)
+    for r in range(3):
+        for c in range(4):
+            point = Point(c + 0.5, r + 0.5)
+            assert locator.locate(point) == r * 4 + c
+
+
+@pytest.mark.parametrize(
+    "point",
+    [Point(-1, 0.5), Point(4, 0.5), Point(0.5, -0.1), Point(0.5, 3.5), Point(9, 9)],
+)
+def test_locator_outside(point) -> None:
+    locator = PolygonLocator(grid_cells(3, 4))
+    assert locator.locate(point) is None
+    assert list(locator.locate_many([point])) == [-1]
+
+
+def test_locator_shared_edges_pick_a_neighbour() -> None:
+    locator = PolygonLocator(grid_cells(2, 2))
+    assert locator.locate(Point(1, 0.5)) in (0, 1)
+    assert locator.locate(Point(0.5, 1)) in (0, 2)
+    assert locator.locate(Point(1, 1)) in (0, 1, 2, 3)
+
+
+def test_locator_accepts_point_sequences() -> None:
+    locator = PolygonLocator(
+        [
+            [(0, 0), (2, 0), (1, 2)],
+            [CPoint(3, 0), CPoint(5, 0), CPoint(4, 2)],
+            [(9, 9), (9, 9)],
+        ]
+    )
+    assert locator.locate((1, 1)) == 0
+    assert locator.locate(CPoint(4, 1)) == 1
+    assert locator.locate((2.5, 0.5)) is None
+
+
+def test_locator_concave_and_holes_between() -> None:
+    # a "C" with a second polygon sitting in its notch
+    notched = Polygon([(0, 0), (3, 0), (3, 1), (1, 1), (1, 2), (3, 2), (3, 3), (0, 3)])
+    plug = Polygon([(1.5, 1.25), (2.5, 1.25), (2.5, 1.75), (1.5, 1.75)])
+    locator = PolygonLocator([notched, plug])
+    assert locator.locate(Point(0.5, 1.5)) == 0
+    assert locator.locate(Point(2, 1.5)) == 1
+    assert locator.locate(Point(2, 1.1)) is None
+    assert locator.locate(Point(2, 2.5)) == 0
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [Point(0.5, 0.5), Point(1.5, 0.5), Point(5, 5)],
+        PointArray([0.5, 1.5, 5], [0.5, 0.5, 5]),
+        array("d", [0.5, 0.5, 1.5, 0.5, 5, 5]),
+    ],
+)
+def test_locator_locate_many_accepts(points) -> None:
+    locator = PolygonLocator(grid_cells(2, 2))
+    assert list(locator.locate_many(points)) == [0, 1, -1]
+
+
+def test_locator_matches_contains() -> None:
+    rng = random.Random(4)
+    # irregular triangles fanned around the origin, no two overlapping
+    spokes = sorted(rng.uniform(0, 6.28) for _ in range(40))
+    rims = [Point.from_polar(rng.uniform(1, 3), theta) for theta in spokes]
+    fans = [
+        Polygon([Point(0, 0), rims[i], rims[(i + 1) % len(rims)]])
+        for i in range(len(rims))
+    ]
+    locator = PolygonLocator(fans)
+    points = [Point(rng.uniform(-3, 3), rng.uniform(-3, 3)) for _ in range(3000)]
+    located = locator.locate_many(points)
+    for point, index in zip(points, located):
+        inside = [i for i, fan in enumerate(fans) if fan.contains(point)]
+        assert inside == ([] if index < 0 else [index])
+        assert locator.locate(point) == (None if index < 0 else index)
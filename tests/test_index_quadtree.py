@@ -0,0 +1,168 @@
+"""testing QuadTree like a human™"""
+
+import random
+
+import pytest
+
+from twod import CPoint, CRect, Point, Rect
+from twod.index import QuadTree
+
+
+def ids(points):
+    return sorted(map(id, points))
+
+
+@pytest.fixture(params=[Point, CPoint])
+def points(request):
+    rng = random.Random(2)
+    # a dense cluster and a sparse background
+    dense = [request.param(rng.gauss(10, 1), rng.gauss(10, 1)) for _ in range(300)]
+    sparse = [
+        request.param(rng.uniform(-100, 100), rng.uniform(-100, 100))
+        for _ in range(100)
+    ]
+    return dense + sparse
+
+
+@pytest.fixture(params=["insert", "bulk"])
+def tree(request, points):
+    bounds = Rect(-100, -100, 200, 200)
+    if request.param == "bulk":
+        return QuadTree.from_points(points, bounds, capacity=4)
+    tree = QuadTree(bounds, capacity=4)
+    for p in points:
+        tree.insert(p)
+    return tree
+
+
+def test_quadtree_bad_capacity() -> None:
+    with pytest.raises(ValueError):
+        QuadTree(Rect(0, 0, 1, 1), capacity=0)
+
+
+def test_quadtree_len_iter_contains(tree, points) -> None:
+    assert len(tree) == len(points)
+    assert ids(tree) == ids(points)
+    assert all(p in tree for p in points)
+
+
+def test_quadtree_insert_outside() -> None:
+    tree = QuadTree(CRect(0, 0, 10, 10))
+    with pytest.raises(ValueError):
+        tree.insert(CPoint(11, 5))
+
+
+def test_quadtree_insert_twice() -> None:
+    tree = QuadTree(Rect(0, 0, 10, 10))
+    p = Point(1, 1)
+    tree.insert(p)
+    with pytest.raises(ValueError):
+        tree.insert(p)
+
+
+def test_quadtree_boundary_between() -> None:
+    tree = QuadTree(Rect(0, 0, 10, 10), capacity=1)
+    corners = [Point(0, 0), Point(10, 0), Point(10, 10), Point(0, 10), Point(5, 5)]
+    for p in corners:
+        tree.insert(p)
+    assert ids(tree.query(Rect(0, 0, 10, 10))) == ids(corners)
+    assert tree.query(Rect(0, 0, 10, 10), inclusive=False) == [corners[-1]]
+
+
+@pytest.mark.parametrize("rect_type", [Rect, CRect])
+@pytest.mark.parametrize("inclusive", [True, False])
+def test_quadtree_query(tree, points, rect_type, inclusive) -> None:
+    rect = rect_type(5, 5, 10, 8)
+    A, C = Point(5, 5), Point(15, 13)
+    found = tree.query(rect, inclusive=inclusive)
+    if inclusive:
+        expected = [p for p in points if Point(*p.xy).between(A, C)]
+    else:
+        expected = [p for p in points if Point(*p.xy).inside(A, C)]
+    assert ids(found) == ids(expected)
+
+
+@pytest.mark.parametrize("radius", [0, 0.5, 3, 50, 500])
+def test_quadtree_query_circle(tree, points, radius) -> None:
+    center = Point(9, 11)
+    found = tree.query_circle(center, radius)
+    expected = [p for p in points if Point(*p.xy).distance(center) <= radius]
+    assert ids(found) == ids(expected)
+
+
+@pytest.mark.parametrize("k", [1, 5, 40])
+@pytest.mark.parametrize("target", [(10, 10), (-90, 80), (150, 150)])
+def test_quadtree_nearest(tree, points, k, target) -> None:
+    target = Point(*target)
+    found = tree.nearest(target, k)
+    distances = [Point(*p.xy).distance(target) for p in found]
+    expected = sorted(Point(*p.xy).distance(target) for p in points)[:k]
+    assert distances == pytest.approx(expected)
+
+
+def test_quadtree_nearest_more_than_len() -> None:
+    tree = QuadTree(Rect(0, 0, 10, 10))
+    tree.insert(Point(1, 1))
+    assert len(tree.nearest(Point(), 5)) == 1
+
+
+def test_quadtree_remove(tree, points) -> None:
+    for p in points[:350]:
+        tree.remove(p)
+    assert len(tree) == len(points) - 350
+    assert ids(tree.query(Rect(-100, -100, 200, 200))) == ids(points[350:])
+    with pytest.raises(KeyError):
+        tree.remove(points[0])
+
+
+def test_quadtree_remove_merges() -> None:
+    tree = QuadTree(Rect(0, 0, 10, 10), capacity=2)
+    points = [Point(1, 1), Point(9, 9), Point(1, 9)]
+    for p in points:
+        tree.insert(p)
+    assert tree._root.children
+    tree.remove(points[0])
+    assert not tree._root.children
+
+
+def test_quadtree_move() -> None:
+    tree = QuadTree(Rect(0, 0, 10, 10), capacity=1)
+    p, q = Point(1, 1), Point(2, 2)
+    tree.insert(p)
+    tree.insert(q)
+    p += (7, 7)
+    tree.move(p)
+    assert tree.nearest(Point(9, 9)) == [p]
+    tree.move(q, (8, 1))
+    assert q == (8, 1)
+    assert tree.query(Rect(7, 0, 2, 2)) == [q]
+    with pytest.raises(ValueError):
+        tree.move(q, (20, 20))
+    assert q in tree
+
+
+def test_quadtree_from_points_default_bounds() -> None:
+    points = [Point(-1, 2), Point(3, -4), Point(0, 0)]
+    tree = QuadTree.from_points(points)
+    assert tree.bounds == Rect(-1, -4, 4, 6)
+    assert len(tree) == 3
+
+
+def test_quadtree_from_points_default_bounds_float_extremes() -> None:
+    # 0.2134602579949041 + (9.990232406970458 - 0.2134602579949041) rounds
+    # below 9.990232406970458
+    low = Point(0.2134602579949041, 0.2134602579949041)
+    high = Point(9.990232406970458, 9.990232406970458)
+    tree = QuadTree.from_points([low, high])
+    assert len(tree) == 2
+    assert tree.query(Rect(9, 9, 1, 1)) == [high]
+    tree.move(high, (9.990232406970458, 0.2134602579949041))
+    assert tree.nearest(Point(10, 0)) == [high]
+
+
+def test_quadtree_max_depth_duplicates() -> None:
+    tree = QuadTree(Rect(0, 0, 1, 1), capacity=1, max_depth=3)
+    points = [Point(0.5, 0.5) for _ in range(10)]
+    for p in points:
+        tree.insert(p)
+    assert len(tree.query_circle(Point(0.5, 0.5), 0)) == 10
@@ -0,0 +1,162 @@
+"""testing RTree like a human™"""
+
+import random
+
+import pytest
+
+from twod import CPoint, CRect, Point, Rect
+from twod.index import RTree
+
+
+def random_rects(count, seed=4, rect_type=Rect):
+    rng = random.Random(seed)
+    return [
+        rect_type(
+            rng.uniform(-100, 100),
+            rng.uniform(-100, 100),
+            rng.uniform(0, 10),
+            rng.uniform(0, 10),
+        )
+        for _ in range(count)
+    ]
+
+
+def overlaps(a, b):
+    return (
+        a.x <= b.x + b.w and b.x <= a.x + a.w and a.y <= b.y + b.h and b.y <= a.y + a.h
+    )
+
+
+def contains(r, p):
+    return r.x <= p.x <= r.x + r.w and r.y <= p.y <= r.y + r.h
+
+
+def rect_distance(r, p):
+    dx = max(r.x - p.x, 0, p.x - (r.x + r.w))
+    dy = max(r.y - p.y, 0, p.y - (r.y + r.h))
+    return (dx * dx + dy * dy) ** 0.5
+
+
+def ids(items):
+    return sorted(map(id, items))
+
+
+@pytest.fixture(params=["bulk", "insert"])
+def loaded(request):
+    rects = random_rects(600)
+    if request.param == "bulk":
+        return RTree.from_rects(rects, max_entries=8), rects
+    tree = RTree(max_entries=8)
+    for r in rects:
+        tree.insert(r)
+    return tree, rects
+
+
+QUERY_RECTS = [Rect(0, 0, 20, 20), Rect(-100, -100, 200, 200), Rect(500, 500, 1, 1)]
+QUERY_POINTS = [Point(0, 0), Point(50, -50), Point(-95, 99), Point(300, 0)]
+
+
+def test_rtree_bad_max_entries() -> None:
+    with pytest.raises(ValueError):
+        RTree(max_entries=2)
+
+
+def test_rtree_empty() -> None:
+    tree = RTree.from_rects([])
+    assert len(tree) == 0
+    assert tree.intersecting(Rect(0, 0, 1, 1)) == []
+    assert tree.nearest(Point()) == []
+
+
+def test_rtree_len_iter(loaded) -> None:
+    tree, rects = loaded
+    assert len(tree) == len(rects)
+    assert ids(tree) == ids(rects)
+
+
+@pytest.mark.parametrize("query", QUERY_RECTS)
+def test_rtree_intersecting(loaded, query) -> None:
+    tree, rects = loaded
+    found = tree.intersecting(query)
+    assert ids(found) == ids(r for r in rects if overlaps(r, query))
+
+
+@pytest.mark.parametrize("query", QUERY_POINTS)
+def test_rtree_containing(loaded, query) -> None:
+    tree, rects = loaded
+    found = tree.containing(query)
+    assert ids(found) == ids(r for r in rects if contains(r, query))
+
+
+@pytest.mark.parametrize("k", [1, 4, 25])
+@pytest.mark.parametrize("query", QUERY_POINTS)
+def test_rtree_nearest(loaded, query, k) -> None:
+    tree, rects = loaded
+    found = tree.nearest(query, k)
+    expected = sorted(rect_distance(r, query) for r in rects)[:k]
+    assert [rect_distance(r, query) for r in found] == pytest.approx(expected)
+
+
+def test_rtree_edges_touch() -> None:
+    a, b = Rect(0, 0, 1, 1), Rect(1, 1, 1, 1)
+    tree = RTree.from_rects([a])
+    assert tree.intersecting(b) == [a]
+    assert tree.containing(Point(1, 0)) == [a]
+
+
+def test_rtree_crect_and_items() -> None:
+    rects = random_rects(50, rect_type=CRect)
+    tree = RTree.from_rects(rects, items=range(50))
+    found = tree.containing(CPoint(rects[7].center.x, rects[7].center.y))
+    assert 7 in found
+    with pytest.raises(ValueError):
+        RTree.from_rects(rects, items=range(3))
+
+
+def test_rtree_insert_returns_handles() -> None:
+    tree = RTree()
+    handle = tree.insert(Rect(0, 0, 1, 1), item="tile")
+    assert tree.containing((0.5, 0.5)) == ["tile"]
+    assert tree.delete(handle) == "tile"
+    assert len(tree) == 0
+    assert tree.containing((0.5, 0.5)) == []
+    with pytest.raises(KeyError):
+        tree.delete(handle)
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+def test_rtree_delete(bulk) -> None:
+    rects = random_rects(400, seed=5)
+    if bulk:
+        tree = RTree.from_rects(rects, items=range(400), max_entries=6)
+        handles = list(range(400))
+    else:
+        tree = RTree(max_entries=6)
+        handles = [tree.insert(r, item=i) for i, r in enumerate(rects)]
+
+    rng = random.Random(6)
+    alive = set(range(400))
+    for i in rng.sample(range(400), 350):
+        assert tree.delete(handles[i]) == i
+        alive.discard(i)
+    assert len(tree) == 50
+    assert sorted(tree) == sorted(alive)
+    for query in QUERY_RECTS:
+        expected = sorted(i for i in alive if overlaps(rects[i], query))
+        assert sorted(tree.intersecting(query)) == expected
+
+    for i in range(400, 450):
+        tree.insert(Rect(i, i, 1, 1), item=i)
+    assert sorted(tree.containing(Point(420.5, 420.5))) == [420]
+    assert len(tree) == 100
+
+
+def test_rtree_delete_everything() -> None:
+    tree = RTree(max_entries=4)
+    handles = [tree.insert(r) for r in random_rects(100)]
+    for h in handles:
+        tree.delete(h)
+    assert len(tree) == 0
+    assert list(tree) == []
+    tree.insert(Rect(0, 0, 1, 1))
+    assert len(tree.intersecting(Rect(0, 0, 1, 1))) == 1
@@ -0,0 +1,137 @@
+"""testing SweepAndPrune like a human™"""
+
+import random
+
+import pytest
+
+from twod import CPoint, CRect, Rect
+from twod.index import SweepAndPrune
+
+
+def overlaps(a, b):
+    return (
+        a.x <= b.x + b.w and b.x <= a.x + a.w and a.y <= b.y + b.h and b.y <= a.y + a.h
+    )
+
+
+def brute_pairs(rects, alive):
+    return {
+        (i, j) for i in alive for j in alive if i < j and overlaps(rects[i], rects[j])
+    }
+
+
+def normalized(pairs):
+    return {tuple(sorted(p)) for p in pairs}
+
+
+def test_sweep_empty() -> None:
+    sap = SweepAndPrune()
+    assert len(sap) == 0
+    assert sap.update_pairs() == ([], [])
+    assert sap.pairs == []
+
+
+def test_sweep_enter_exit() -> None:
+    sap = SweepAndPrune()
+    a = CRect(0, 0, 2, 2)
+    b = CRect(5, 0, 2, 2)
+    ha = sap.insert(a, item="a")
+    sap.insert(b, item="b")
+    assert sap.update_pairs() == ([], [])
+
+    a += CPoint(3, 0)
+    sap.update(ha, a)
+    assert sap.update_pairs() == ([("a", "b")], [])
+    assert sap.pairs == [("a", "b")]
+    # no change, no events
+    assert sap.update_pairs() == ([], [])
+
+    a -= CPoint(3, 0)
+    sap.update(ha, a)
+    assert sap.update_pairs() == ([], [("a", "b")])
+    assert sap.pairs == []
+
+
+def test_sweep_touching_edges_overlap() -> None:
+    sap = SweepAndPrune()
+    sap.insert(Rect(0, 0, 1, 1), item=1)
+    sap.insert(Rect(1, 0, 1, 1), item=2)
+    entered, _ = sap.update_pairs()
+    assert normalized(entered) == {(1, 2)}
+
+
+def test_sweep_enter_and_exit_cancel() -> None:
+    sap = SweepAndPrune()
+    a = Rect(0, 0, 1, 1)
+    ha = sap.insert(a, item="a")
+    sap.insert(Rect(5, 5, 1, 1), item="b")
+    sap.update_pairs()
+    sap.update(ha, Rect(5, 5, 1, 1))
+    sap.update(ha, Rect(0, 0, 1, 1))
+    assert sap.update_pairs() == ([], [])
+
+
+def test_sweep_remove_reports_exit() -> None:
+    sap = SweepAndPrune()
+    ha = sap.insert(Rect(0, 0, 2, 2), item="a")
+    sap.insert(Rect(1, 1, 2, 2), item="b")
+    sap.update_pairs()
+    assert sap.remove(ha) == "a"
+    assert sap.update_pairs() == ([], [("a", "b")])
+    assert len(sap) == 1
+    assert list(sap) == ["b"]
+    with pytest.raises(KeyError):
+        sap.remove(ha)
+    with pytest.raises(KeyError):
+        sap.update(ha, Rect())
+
+
+def test_sweep_remove_then_insert_before_update() -> None:
+    sap = SweepAndPrune()
+    sap.insert(Rect(0, 0, 2, 2), item="a")
+    hb = sap.insert(Rect(1, 1, 2, 2), item="b")
+    sap.update_pairs()
+    sap.remove(hb)
+    hc = sap.insert(Rect(1, 1, 2, 2), item="c")
+    assert hc != hb
+    assert sap.update_pairs() == ([("a", "c")], [("a", "b")])
+    sap.remove(hc)
+    sap.update_pairs()
+    assert sap.insert(Rect(), item="d") in (hb, hc)
+
+
+def test_sweep_simulation() -> None:
+    rng = random.Random(9)
+    rects = [
+        CRect(
+            rng.uniform(0, 50), rng.uniform(0, 50), rng.uniform(1, 4), rng.uniform(1, 4)
+        )
+        for _ in range(80)
+    ]
+    sap = SweepAndPrune()
+    handles = {sap.insert(r, item=i): i for i, r in enumerate(rects)}
+    alive = set(range(len(rects)))
+
+    current = set()
+    for frame in range(30):
+        for handle, i in list(handles.items()):
+            step = CPoint(rng.uniform(-1, 1), rng.uniform(-1, 1))
+            rects[i] += step
+            sap.update(handle, rects[i])
+        if frame == 10:
+            for handle in list(handles)[:10]:
+                alive.discard(handles.pop(handle))
+                sap.remove(handle)
+        if frame == 20:
+            for _ in range(5):
+                rects.append(CRect(rng.uniform(0, 50), rng.uniform(0, 50), 5, 5))
+                index = len(rects) - 1
+                handles[sap.insert(rects[index], item=index)] = index
+                alive.add(index)
+
+        entered, exited = sap.update_pairs()
+        expected = brute_pairs(rects, alive)
+        assert normalized(entered) == expected - current
+        assert normalized(exited) == current - expected
+        current = expected
+        assert normalized(sap.pairs) == expected
@@ -0,0 +1,146 @@
+"""testing delaunay like a human™"""
+
+import random
+from array import array
+
+import pytest
+
+from twod import CPoint, Point, PointArray
+from twod.algorithms import convex_hull
+from twod.mesh import Triangulation, delaunay
+
+
+def ccw(mesh, a, b, c):
+    return Point(mesh.x[a], mesh.y[a]).ccw(
+        Point(mesh.x[b], mesh.y[b]), Point(mesh.x[c], mesh.y[c])
+    )
+
+
+def check(mesh):
+    """Asserts mesh is a valid Delaunay triangulation of its points."""
+    triangles = list(mesh)
+    for a, b, c in triangles:
+        assert ccw(mesh, a, b, c) > 0
+
+    for t, corners in enumerate(triangles):
+        for k in range(3):
+            n = mesh.neighbours[3 * t + k]
+            edge = {corners[(k + 1) % 3], corners[(k + 2) % 3]}
+            if n < 0:
+                continue
+            assert edge <= set(triangles[n])
+            assert t in mesh.neighbours[3 * n : 3 * n + 3]
+            (w,) = set(triangles[n]) - edge
+            a, b, c = (Point(mesh.x[i], mesh.y[i]) for i in corners)
+            assert a.incircle(b, c, Point(mesh.x[w], mesh.y[w])) <= 1e-9
+
+    # the triangles tile the convex hull
+    points = list(zip(mesh.x, mesh.y))
+    hull = convex_hull(points)
+    hull_area = sum(
+        mesh.x[hull[i - 1]] * mesh.y[hull[i]] - mesh.x[hull[i]] * mesh.y[hull[i - 1]]
+        for i in range(len(hull))
+    )
+    area = sum(ccw(mesh, *corners) for corners in triangles)
+    assert area == pytest.approx(hull_area)
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [],
+        [(0, 0)],
+        [(0, 0), (1, 1)],
+        [(0, 0), (1, 1), (2, 2), (3, 3)],
+        [(1, 1)] * 5,
+    ],
+)
+def test_delaunay_degenerate(points) -> None:
+    mesh = delaunay(points)
+    assert isinstance(mesh, Triangulation)
+    assert len(mesh) == 0
+    assert list(mesh.triangles) == []
+
+
+def test_delaunay_triangle() -> None:
+    mesh = delaunay([Point(0, 0), Point(0, 1), Point(1, 0)])
+    assert len(mesh) == 1
+    assert sorted(mesh[0]) == [0, 1, 2]
+    assert list(mesh.neighbours) == [-1, -1, -1]
+    check(mesh)
+
+
+def test_delaunay_square() -> None:
+    mesh = delaunay([Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)])
+    assert len(mesh) == 2
+    assert isinstance(mesh.triangles, array)
+    assert mesh.triangles.typecode == "i"
+    assert sorted(mesh.neighbours) == [-1, -1, -1, -1, 0, 1]
+    check(mesh)
+
+
+def test_delaunay_picks_the_empty_circle_diagonal() -> None:
+    # a flat rhombus: only the short diagonal is Delaunay
+    mesh = delaunay([(0, 0), (2, -0.5), (4, 0), (2, 0.5)])
+    edges = {frozenset(e) for a, b, c in mesh for e in ((a, b), (b, c), (c, a))}
+    assert frozenset((1, 3)) in edges
+    assert frozenset((0, 2)) not in edges
+
+
+def test_delaunay_duplicates_and_collinear_start() -> None:
+    points = [(0, 0), (0, 0), (1, 0), (2, 0), (1, 0), (1, 1)]
+    mesh = delaunay(points)
+    check(mesh)
+    used = set(mesh.triangles)
+    assert used <= {0, 1, 2, 3, 4, 5}
+    assert 5 in used and 3 in used
+    assert len({points[i] for i in used}) == len(used)
+
+
+def test_delaunay_duplicates_keep_the_smallest_index() -> None:
+    points = [(2, 0), (4, 0), (3, 2), (2, 4), (3, 2), (4, 4), (3, 2), (2, 0)]
+    mesh = delaunay(points)
+    check(mesh)
+    used = set(mesh.triangles)
+    assert used == {0, 1, 2, 3, 5}
+
+
+def test_delaunay_getitem() -> None:
+    mesh = delaunay([(0, 0), (1, 0), (0, 1)])
+    assert mesh[-1] == mesh[0]
+    with pytest.raises(IndexError):
+        mesh[1]
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [CPoint(0, 0), CPoint(1, 0), CPoint(0, 1), CPoint(1, 1)],
+        PointArray([0, 1, 0, 1], [0, 0, 1, 1]),
+        array("d", [0, 0, 1, 0, 0, 1, 1, 1]),
+    ],
+)
+def test_delaunay_accepts(points) -> None:
+    mesh = delaunay(points)
+    assert len(mesh) == 2
+    check(mesh)
+
+
+@pytest.mark.parametrize("seed", range(15))
+@pytest.mark.parametrize("grid", [3, 10, None])
+def test_delaunay_random(seed, grid) -> None:
+    rng = random.Random(seed)
+    count = rng.randint(3, 200)
+    if grid:
+        points = [(rng.randint(0, grid), rng.randint(0, grid)) for _ in range(count)]
+    else:
+        points = [(rng.random(), rng.random()) for _ in range(count)]
+    check(delaunay(points))
+
+
+def test_delaunay_euler() -> None:
+    rng = random.Random(2)
+    points = [(rng.random(), rng.random()) for _ in range(500)]
+    mesh = delaunay(points)
+    hull = len(convex_hull(points))
+    assert len(mesh) == 2 * len(points) - 2 - hull
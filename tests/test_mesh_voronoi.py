@@ -0,0 +1,107 @@
+"""testing voronoi like a human™"""
+
+import random
+
+import pytest
+
+from twod import Point, PointArray, Polygon, Rect
+from twod.mesh import voronoi
+
+
+def nearest(sites, x, y):
+    return min(
+        range(len(sites)),
+        key=lambda i: (sites[i][0] - x) ** 2 + (sites[i][1] - y) ** 2,
+    )
+
+
+def check(sites, bounds, cells):
+    """Asserts cells are the Voronoi cells of sites clipped to bounds."""
+    assert len(cells) == len(sites)
+    assert all(isinstance(cell, Polygon) for cell in cells)
+
+    unique = {}
+    for i, site in enumerate(sites):
+        unique.setdefault(site, i)
+    assert sum(cells[i].area for i in unique.values()) == pytest.approx(
+        bounds.w * bounds.h
+    )
+
+    rng = random.Random(len(sites))
+    for _ in range(200):
+        x = bounds.x + rng.random() * bounds.w
+        y = bounds.y + rng.random() * bounds.h
+        owner = sites[nearest(sites, x, y)]
+        for i, site in enumerate(sites):
+            if site == owner:
+                continue
+            assert not cells[i].contains(Point(x, y)) or (
+                (site[0] - x) ** 2 + (site[1] - y) ** 2
+                == pytest.approx((owner[0] - x) ** 2 + (owner[1] - y) ** 2)
+            )
+        assert cells[unique[owner]].contains(Point(x, y))
+
+
+@pytest.mark.parametrize("count", [3, 10, 100, 500])
+def test_voronoi_random(count):
+    rng = random.Random(count)
+    sites = [(rng.random() * 10, rng.random() * 10) for _ in range(count)]
+    bounds = Rect(0, 0, 10, 10)
+    cells = voronoi([Point(x, y) for x, y in sites], bounds)
+    check(sites, bounds, cells)
+    for (x, y), cell in zip(sites, cells):
+        assert cell.contains(Point(x, y))
+        assert cell.signed_area > 0
+
+
+def test_voronoi_two_sites():
+    cells = voronoi([Point(1, 1), Point(3, 1)], Rect(0, 0, 4, 2))
+    assert cells[0].area == pytest.approx(4.0)
+    assert cells[1].area == pytest.approx(4.0)
+    assert cells[0].contains(Point(1.5, 1.5))
+    assert cells[1].contains(Point(2.5, 0.5))
+
+
+def test_voronoi_collinear():
+    sites = [(float(i), float(i)) for i in range(5)]
+    bounds = Rect(-1, -1, 6, 6)
+    cells = voronoi(sites, bounds)
+    check(sites, bounds, cells)
+
+
+def test_voronoi_grid():
+    sites = [(float(x), float(y)) for x in range(6) for y in range(6)]
+    bounds = Rect(-0.5, -0.5, 6, 6)
+    cells = voronoi(sites, bounds)
+    check(sites, bounds, cells)
+    for cell in cells:
+        assert cell.area == pytest.approx(1.0)
+
+
+def test_voronoi_duplicates():
+    sites = [(0.0, 0.0), (4.0, 0.0), (0.0, 4.0), (4.0, 0.0)]
+    cells = voronoi(sites, Rect(0, 0, 4, 4))
+    assert cells[3] == cells[1]
+    assert cells[3] is not cells[1]
+
+
+def test_voronoi_sites_outside_bounds():
+    sites = [(-10.0, -10.0), (-8.0, -10.0), (-9.0, -8.0), (5.0, 5.0)]
+    bounds = Rect(4, 4, 2, 2)
+    cells = voronoi(sites, bounds)
+    assert len(cells[0]) == len(cells[1]) == 0
+    assert cells[3].area == pytest.approx(4.0)
+
+
+def test_voronoi_point_array():
+    rng = random.Random(7)
+    sites = [(rng.random(), rng.random()) for _ in range(50)]
+    bounds = Rect(0, 0, 1, 1)
+    expected = voronoi(sites, bounds)
+    array = PointArray([x for x, _ in sites], [y for _, y in sites])
+    assert voronoi(array, bounds) == expected
+    assert voronoi(sites, (0, 0, 1, 1)) == expected
+
+
+def test_voronoi_empty():
+    assert voronoi([], Rect(0, 0, 1, 1)) == []
@@ -117,6 +117,22 @@ def test_point_is_ccw_colinear():
         p.is_ccw(q, r)
 
 
+@pytest.mark.parametrize(
+    "d, sign",
+    [
+        ((Point(0.5, 0.5)), 1),
+        ((Point(2, 2)), -1),
+        ((Point(0, 1)), 0),
+    ],
+)
+def test_point_incircle(d, sign):
+    a, b, c = Point(), Point(1, 0), Point(1, 1)
+    result = a.incircle(b, c, d)
+    assert (result > 0) - (result < 0) == sign
+    result = c.incircle(b, a, d)
+    assert (result > 0) - (result < 0) == -sign
+
+
 def test_point_midpoint_from_origin():
     p = Point(1, 1)
     o = Point()
@@ -123,3 +123,28 @@ def test_point_radians_degrees_properties():
     d = math.degrees(r)
     assert p.radians == r
     assert p.degrees == d
+
+
+@pytest.mark.parametrize("is_radians", [True, False])
+@pytest.mark.parametrize("translate", [None, Point(1, -2), (3, 4)])
+def test_point_from_polar_many_matches_from_polar(is_radians, translate):
+    radii = [0, 1, 2.5, 10]
+    thetas = [0, 1, 45, -3]
+    points = Point.from_polar_many(radii, thetas, is_radians, translate)
+    expected = [
+        Point.from_polar(r, t, is_radians, translate) for r, t in zip(radii, thetas)
+    ]
+    assert points == expected
+    assert all(isinstance(p, Point) for p in points)
+
+
+def test_point_from_polar_many_buffers():
+    from array import array
+
+    points = Point.from_polar_many(array("d", [1, 2]), array("d", [0, math.pi]))
+    assert points == [Point(1, 0), Point(-2, 0)]
+    assert all(type(p.x) is float for p in points)
+
+
+def test_point_from_polar_many_empty():
+    assert Point.from_polar_many([], []) == []
@@ -0,0 +1,187 @@
+"""testing PointArray like a human™"""
+
+import operator
+
+import pytest
+
+from twod import Point, PointArray
+
+pytestmark = pytest.mark.usefixtures("kernels")
+
+
+def test_pointarray_creation_default() -> None:
+    pa = PointArray()
+    assert len(pa) == 0
+
+
+def test_pointarray_creation_mismatched() -> None:
+    with pytest.raises(ValueError):
+        PointArray([0, 1], [0])
+
+
+def test_pointarray_from_points() -> None:
+    pa = PointArray.from_points([Point(1, 2), (3, 4), [5, 6]])
+    assert list(pa.x) == [1, 3, 5]
+    assert list(pa.y) == [2, 4, 6]
+
+
+def test_pointarray_zeros() -> None:
+    pa = PointArray.zeros(3)
+    assert pa == [Point(), Point(), Point()]
+
+
+def test_pointarray_getitem_returns_point_copy() -> None:
+    pa = PointArray([1, 2], [3, 4])
+    p = pa[1]
+    assert isinstance(p, Point)
+    assert p == (2, 4)
+    p.x = 10
+    assert pa[1] == (2, 4)
+    assert pa[-1] == (2, 4)
+
+
+def test_pointarray_getitem_slice() -> None:
+    pa = PointArray([1, 2, 3], [4, 5, 6])
+    assert pa[1:] == PointArray([2, 3], [5, 6])
+
+
+def test_pointarray_getitem_bad_key() -> None:
+    with pytest.raises(TypeError):
+        PointArray([1], [1])["x"]
+
+
+def test_pointarray_setitem() -> None:
+    pa = PointArray([1, 2], [3, 4])
+    pa[0] = Point(9, 8)
+    pa[1] = (7, 6)
+    assert pa == [(9, 8), (7, 6)]
+
+
+def test_pointarray_iter() -> None:
+    pa = PointArray([1, 2], [3, 4])
+    assert list(pa) == [Point(1, 3), Point(2, 4)]
+
+
+def test_pointarray_append() -> None:
+    pa = PointArray()
+    for i in range(100):
+        pa.append((i, -i))
+    pa.append(Point(100, -100))
+    assert len(pa) == 101
+    assert list(pa.x) == list(range(101))
+    assert list(pa.y) == [-i for i in range(101)]
+
+
+def test_pointarray_append_after_slice() -> None:
+    pa = PointArray([1, 2], [3, 4])
+    pa.append((5, 6))
+    copy = pa[:]
+    pa.append((7, 8))
+    copy.append((9, 10))
+    assert pa == [(1, 3), (2, 4), (5, 6), (7, 8)]
+    assert copy == [(1, 3), (2, 4), (5, 6), (9, 10)]
+
+
+def test_pointarray_extend() -> None:
+    pa = PointArray([1], [1])
+    pa.extend(PointArray([2], [2]))
+    pa.extend([(3, 3)])
+    assert pa == [(1, 1), (2, 2), (3, 3)]
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        operator.add,
+        operator.sub,
+        operator.mul,
+        operator.truediv,
+        operator.floordiv,
+    ],
+)
+@pytest.mark.parametrize("other", [2, 0.5, Point(3, -4), (3, -4)])
+def test_pointarray_op_matches_point(op, other) -> None:
+    points = [Point(1, 2), Point(-3, 4), Point(5.5, -6)]
+    pa = PointArray.from_points(points)
+    result = op(pa, other)
+    assert isinstance(result, PointArray)
+    assert result == [op(p, other) for p in points]
+
+
+@pytest.mark.parametrize(
+    "op, iop",
+    [
+        (operator.add, operator.iadd),
+        (operator.sub, operator.isub),
+        (operator.mul, operator.imul),
+        (operator.truediv, operator.itruediv),
+        (operator.floordiv, operator.ifloordiv),
+    ],
+)
+def test_pointarray_iop_matches_point(op, iop) -> None:
+    points = [Point(1, 2), Point(-3, 4), Point(5.5, -6)]
+    pa = PointArray.from_points(points)
+    xs = pa.x
+    result = iop(pa, Point(2, 3))
+    assert result is pa
+    assert pa.x is xs
+    assert pa == [op(p, Point(2, 3)) for p in points]
+
+
+def test_pointarray_op_with_pointarray() -> None:
+    a = PointArray([1, 2], [3, 4])
+    b = PointArray([10, 20], [30, 40])
+    assert a + b == [(11, 33), (22, 44)]
+    assert b - a == [(9, 27), (18, 36)]
+
+
+def test_pointarray_op_with_mismatched_pointarray() -> None:
+    with pytest.raises(ValueError):
+        PointArray([1, 2], [3, 4]) + PointArray([1], [1])
+
+
+def test_pointarray_reflected_ops() -> None:
+    pa = PointArray([1, 2], [3, 4])
+    assert Point(1, 1) + pa == [(2, 4), (3, 5)]
+    assert 10 - pa == [(9, 7), (8, 6)]
+    assert 2 * pa == [(2, 6), (4, 8)]
+
+
+def test_pointarray_zero_division() -> None:
+    with pytest.raises(ZeroDivisionError):
+        PointArray([1], [1]) / 0
+    with pytest.raises(ZeroDivisionError):
+        PointArray([1], [1]).__ifloordiv__(Point(1, 0))
+
+
+def test_pointarray_unsupported_operand() -> None:
+    with pytest.raises(TypeError):
+        PointArray([1], [1]) + "foo"
+
+
+def test_pointarray_pow_abs_neg() -> None:
+    pa = PointArray([-2, 3], [4, -5])
+    assert pa**2 == [(4, 16), (9, 25)]
+    assert abs(pa) == [(2, 4), (3, 5)]
+    assert -pa == [(2, -4), (-3, 5)]
+    pa **= 2
+    assert pa == [(4, 16), (9, 25)]
+
+
+def test_pointarray_polar() -> None:
+    pa = PointArray([3, 0], [4, -1])
+    assert list(pa.radius) == [5, 1]
+    assert list(pa.radians) == [Point(3, 4).radians, Point(0, -1).radians]
+
+
+def test_pointarray_distance_squared() -> None:
+    pa = PointArray([3, 0], [4, -1])
+    assert list(pa.distance_squared()) == [25, 1]
+    assert list(pa.distance_squared(Point(3, 4))) == [0, 34]
+
+
+def test_pointarray_between_inside() -> None:
+    pa = PointArray([0, 1, 2, 3], [0, 1, 2, 3])
+    p, q = Point(2, 2), Point(0, 0)
+    assert list(pa.between(p, q)) == [p_.between(p, q) for p_ in pa]
+    assert list(pa.inside(p, q)) == [p_.inside(p, q) for p_ in pa]
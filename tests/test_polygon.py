@@ -0,0 +1,165 @@
+"""testing Polygon like a human™"""
+
+import math
+import random
+from array import array
+
+import pytest
+
+from twod import CPoint, Point, PointArray, Polygon, Rect
+from twod.constants import Winding
+
+SQUARE = [(0, 0), (4, 0), (4, 4), (0, 4)]
+# a "C" shape open to the right
+NOTCHED = [(0, 0), (3, 0), (3, 1), (1, 1), (1, 2), (3, 2), (3, 3), (0, 3)]
+
+
+def test_polygon_create() -> None:
+    polygon = Polygon(SQUARE)
+    assert len(polygon) == 4
+    assert list(polygon) == [Point(*p) for p in SQUARE]
+    assert polygon[1] == Point(4, 0)
+    assert polygon == Polygon([Point(*p) for p in SQUARE])
+    assert polygon == Polygon([CPoint(*p) for p in SQUARE])
+    assert polygon == Polygon.from_arrays([0, 4, 4, 0], [0, 0, 4, 4])
+    assert eval(repr(polygon)) == polygon
+
+
+def test_polygon_from_arrays_mismatched() -> None:
+    with pytest.raises(ValueError):
+        Polygon.from_arrays([0, 1], [0])
+
+
+def test_polygon_properties() -> None:
+    polygon = Polygon(SQUARE)
+    assert polygon.area == 16
+    assert polygon.signed_area == 16
+    assert polygon.centroid == Point(2, 2)
+    assert polygon.orientation == Winding.CCW
+    bounds = polygon.bounds
+    assert isinstance(bounds, Rect)
+    assert (bounds.x, bounds.y, bounds.w, bounds.h) == (0, 0, 4, 4)
+
+
+def test_polygon_clockwise() -> None:
+    polygon = Polygon(reversed(SQUARE))
+    assert polygon.signed_area == -16
+    assert polygon.area == 16
+    assert polygon.orientation == Winding.CW
+    assert polygon.winding_number(Point(1, 1)) == -1
+    assert polygon.contains(Point(1, 1))
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [],
+        [(1, 1)],
+        [(0, 0), (1, 1), (2, 2)],
+    ],
+)
+def test_polygon_degenerate(points) -> None:
+    polygon = Polygon(points)
+    assert polygon.area == 0
+    assert polygon.orientation == Winding.Colinear
+    assert not polygon.contains(Point(1, 1))
+    assert polygon.contains_many([Point(1, 1), Point(0, 0)]) == [False, False]
+
+
+def test_polygon_centroid_of_triangle() -> None:
+    polygon = Polygon([(0, 0), (3, 0), (0, 3)])
+    assert polygon.centroid == Point(1, 1)
+
+
+def test_polygon_cache_invalidated_by_mutation() -> None:
+    polygon = Polygon(SQUARE)
+    assert polygon.area == 16
+    assert polygon.contains_many([Point(5, 2)]) == [False]
+
+    polygon[1] = Point(8, 0)
+    polygon[2] = (8, 4)
+    assert polygon.area == 32
+    assert polygon.centroid == Point(4, 2)
+    assert polygon.bounds.w == 8
+    assert polygon.contains(Point(5, 2))
+    assert polygon.contains_many([Point(5, 2)]) == [True]
+
+    polygon.append(Point(-4, 2))
+    assert polygon.area == 40
+    del polygon[-1]
+    assert polygon.area == 32
+    polygon.insert(1, Point(4, -4))
+    assert polygon.area == 48
+
+
+def test_polygon_coordinates_are_read_only() -> None:
+    polygon = Polygon(SQUARE)
+    assert polygon.area == 16
+    assert list(polygon.x) == [0, 4, 4, 0]
+    assert list(polygon.y) == [0, 0, 4, 4]
+    with pytest.raises(TypeError):
+        polygon.x[1] = 8
+    with pytest.raises(TypeError):
+        polygon.y[2] = 8
+    assert polygon.area == 16
+
+
+@pytest.mark.parametrize(
+    "point, expected",
+    [
+        (Point(0.5, 0.5), True),
+        (Point(2, 0.5), True),
+        (Point(0.5, 2.5), True),
+        (Point(2, 1.5), False),
+        (Point(5, 1.5), False),
+        (Point(-1, 1.5), False),
+        (Point(2, 4), False),
+    ],
+)
+def test_polygon_contains(point, expected) -> None:
+    polygon = Polygon(NOTCHED)
+    assert polygon.contains(point) == expected
+    assert polygon.contains_many([point]) == [expected]
+
+
+def test_polygon_shared_edge_belongs_to_one() -> None:
+    left = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+    right = Polygon([(1, 0), (2, 0), (2, 1), (1, 1)])
+    for y in (0, 0.25, 0.5, 0.75):
+        point = Point(1, y)
+        assert left.contains(point) + right.contains(point) == 1
+
+
+def test_polygon_self_overlapping_winding() -> None:
+    # the square traced twice winds twice around its inside
+    polygon = Polygon(SQUARE + SQUARE)
+    assert polygon.winding_number(Point(2, 2)) == 2
+    assert polygon.contains(Point(2, 2))
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        PointArray([0.5, 2, 5], [0.5, 1.5, 1.5]),
+        array("d", [0.5, 0.5, 2, 1.5, 5, 1.5]),
+        [CPoint(0.5, 0.5), CPoint(2, 1.5), CPoint(5, 1.5)],
+    ],
+)
+def test_polygon_contains_many_accepts(points) -> None:
+    assert Polygon(NOTCHED).contains_many(points) == [True, False, False]
+
+
+def test_polygon_contains_many_matches_contains() -> None:
+    rng = random.Random(7)
+    n = 300
+    star = Polygon(
+        (
+            math.cos(2 * math.pi * i / n) * (1 + (i % 2)),
+            math.sin(2 * math.pi * i / n) * (1 + (i % 2)),
+        )
+        for i in range(n)
+    )
+    points = [
+        Point(rng.uniform(-2.5, 2.5), rng.uniform(-2.5, 2.5)) for _ in range(2000)
+    ]
+    assert star.contains_many(points) == [star.contains(p) for p in points]
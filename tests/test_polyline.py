@@ -0,0 +1,159 @@
+"""testing Polyline like a human™"""
+
+import itertools
+import random
+
+import pytest
+
+from twod import Line, Point, PointArray, Polygon, Polyline
+
+PATH = [(0, 0), (3, 0), (3, 4), (0, 4)]
+
+
+def test_polyline_create() -> None:
+    path = Polyline(PATH)
+    assert len(path) == 4
+    assert list(path) == [Point(*p) for p in PATH]
+    assert path[2] == Point(3, 4)
+    assert Polyline.from_arrays(path.x, path.y) == path
+    assert Polyline(PointArray([0, 3, 3, 0], [0, 0, 4, 4])) == path
+
+
+def test_polyline_from_arrays_mismatched() -> None:
+    with pytest.raises(ValueError):
+        Polyline.from_arrays([0, 1], [0])
+
+
+def test_polyline_coordinates_are_read_only() -> None:
+    path = Polyline(PATH)
+    assert path.length == 10.0
+    with pytest.raises(TypeError):
+        path.x[1] = 8
+    assert path.length == 10.0
+    assert path != Polyline([(0, 0), (3, 0)])
+    assert path.__eq__(Polygon(PATH)) is NotImplemented
+
+
+def test_polyline_lengths() -> None:
+    path = Polyline(PATH)
+    assert list(path.lengths) == [0.0, 3.0, 7.0, 10.0]
+    assert path.length == 10.0
+    assert Polyline().length == 0.0
+    assert Polyline([(1, 1)]).length == 0.0
+
+
+def test_polyline_lengths_are_read_only() -> None:
+    path = Polyline(PATH)
+    with pytest.raises(TypeError):
+        path.lengths[2] = 100
+    assert path.length == 10.0
+    assert path.point_at_distance(5) == Point(3, 2)
+
+
+def test_polyline_mutation_updates_lengths() -> None:
+    path = Polyline(PATH)
+    assert path.length == 10.0
+    path.append(Point(0, 0))
+    assert list(path.lengths) == [0.0, 3.0, 7.0, 10.0, 14.0]
+    path[1] = Point(0, 0)
+    assert path.length == 12.0
+    del path[1]
+    assert path.length == 12.0
+    path.insert(1, (3, 0))
+    assert path.length == 14.0
+    assert path == Polyline(PATH + [(0, 0)])
+
+
+def test_polyline_append_to_empty() -> None:
+    path = Polyline()
+    assert path.length == 0.0
+    path.append((1, 1))
+    path.append((4, 5))
+    assert list(path.lengths) == [0.0, 5.0]
+
+
+@pytest.mark.parametrize(
+    "distance, expected",
+    [
+        (-1, Point(0, 0)),
+        (0, Point(0, 0)),
+        (1.5, Point(1.5, 0)),
+        (3, Point(3, 0)),
+        (5, Point(3, 2)),
+        (8, Point(2, 4)),
+        (10, Point(0, 4)),
+        (11, Point(0, 4)),
+    ],
+)
+def test_polyline_point_at_distance(distance, expected) -> None:
+    assert Polyline(PATH).point_at_distance(distance) == expected
+
+
+def test_polyline_point_at_fraction() -> None:
+    path = Polyline(PATH)
+    assert path.point_at_fraction(0) == Point(0, 0)
+    assert path.point_at_fraction(0.5) == Point(3, 2)
+    assert path.point_at_fraction(1) == Point(0, 4)
+
+
+def test_polyline_point_at_distance_repeated_vertices() -> None:
+    path = Polyline([(0, 0), (2, 0), (2, 0), (2, 0), (2, 2)])
+    assert path.point_at_distance(2) == Point(2, 0)
+    assert path.point_at_distance(3) == Point(2, 1)
+
+
+def test_polyline_point_at_distance_degenerate() -> None:
+    with pytest.raises(ValueError):
+        Polyline().point_at_distance(1)
+    assert Polyline([(2, 3)]).point_at_fraction(0.5) == Point(2, 3)
+
+
+def test_polyline_point_at_distance_matches_segments() -> None:
+    rng = random.Random(3)
+    points = [Point(rng.random() * 10, rng.random() * 10) for _ in range(200)]
+    path = Polyline(points)
+    for _ in range(100):
+        distance = rng.random() * path.length
+        walked = 0.0
+        for a, b in itertools.pairwise(points):
+            segment = Line(a, b).length
+            if walked + segment >= distance:
+                expected = Line(a, b).point_at_parameter((distance - walked) / segment)
+                break
+            walked += segment
+        found = path.point_at_distance(distance)
+        assert found.x == pytest.approx(expected.x)
+        assert found.y == pytest.approx(expected.y)
+
+
+def test_polyline_resample() -> None:
+    samples = Polyline(PATH).resample(5)
+    assert isinstance(samples, PointArray)
+    assert [tuple(p) for p in samples] == [
+        (0, 0),
+        (2.5, 0),
+        (3, 2),
+        (2.5, 4),
+        (0, 4),
+    ]
+
+
+def test_polyline_resample_spacing() -> None:
+    rng = random.Random(4)
+    path = Polyline((rng.random(), rng.random()) for _ in range(300))
+    samples = path.resample(1000)
+    assert len(samples) == 1000
+    for i in range(0, 1000, 37):
+        expected = path.point_at_fraction(i / 999)
+        assert samples[i].x == pytest.approx(expected.x)
+        assert samples[i].y == pytest.approx(expected.y)
+
+
+def test_polyline_resample_degenerate() -> None:
+    assert len(Polyline(PATH).resample(0)) == 0
+    assert [tuple(p) for p in Polyline(PATH).resample(1)] == [(0, 0)]
+    assert [tuple(p) for p in Polyline([(2, 3)]).resample(2)] == [(2, 3), (2, 3)]
+    with pytest.raises(ValueError):
+        Polyline(PATH).resample(-1)
+    with pytest.raises(ValueError):
+        Polyline().resample(3)
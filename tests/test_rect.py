@@ -1,6 +1,7 @@
 """ """
 
 import pytest
+from twod.line import Line
 from twod.point import Point
 from twod.rect import Rect
 
@@ -147,3 +148,31 @@ def test_rect_center_setter() -> None:
     assert r.perimeter == q.perimeter
     assert r.area == q.area
     assert r.sides == q.sides
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        ((1, 1), (2, 3), ((1, 1), (2, 3))),
+        ((-1, 1), (5, 1), ((0, 1), (4, 1))),
+        ((5, 1), (-1, 1), ((4, 1), (0, 1))),
+        ((-2, -2), (6, 6), ((0, 0), (4, 4))),
+        ((2, -1), (2, 2), ((2, 0), (2, 2))),
+        ((0, 4), (4, 4), ((0, 4), (4, 4))),
+        ((-1, 5), (5, 5), None),
+        ((-3, 1), (1, 5), ((-0.0, 4.0), (0.0, 4.0))),
+        ((-1, 3), (3, 7), ((0, 4), (0, 4))),
+        ((6, 6), (7, 7), None),
+    ],
+)
+def test_rect_clip_line(start, end, expected) -> None:
+    clipped = Rect(0, 0, 4, 4).clip_line(Line(Point(*start), Point(*end)))
+    if expected is None:
+        assert clipped is None
+    else:
+        assert clipped == Line(Point(*expected[0]), Point(*expected[1]))
+
+
+def test_rect_clip_line_negative_dimensions() -> None:
+    clipped = Rect(4, 4, -4, -4).clip_line(Line(Point(-1, 1), Point(5, 1)))
+    assert clipped == Line(Point(0, 1), Point(4, 1))